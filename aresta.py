@@ -1,4 +1,97 @@
+import struct
+from array import array
+
 class Aresta:
+    __slots__ = ('destino', 'peso')
+
     def __init__(self, destino: int, peso: int):
         self.destino = destino
-        self.peso = peso
\ No newline at end of file
+        self.peso = peso
+
+
+# tipos tentados para os pesos, do mais compacto ao mais geral
+TIPOS_PESO_ARESTAS = ('i', 'q', 'd')
+
+
+def _array_pesos(pesos, tipo: str = 'i') -> array:
+    """array do primeiro tipo, a partir de tipo, que aceita todos os pesos"""
+    for tipo in TIPOS_PESO_ARESTAS[TIPOS_PESO_ARESTAS.index(tipo):-1]:
+        try:
+            return array(tipo, pesos)
+        except (TypeError, OverflowError):
+            continue
+    return array('d', pesos)
+
+
+class ListaArestas:
+    """
+    Arestas que saem de um vértice em dois arrays paralelos, destinos ('i') e pesos
+    (o menor tipo entre 'i', 'q' e 'd' que cabe todos eles), em vez de um objeto Aresta
+    por aresta. Funciona como uma lista de Aresta: len, iteração e índice produzem
+    Aresta (cópias: alterá-las não altera a lista) e append aceita Aresta.
+    """
+
+    __slots__ = ('destinos', 'pesos')
+
+    def __init__(self, destinos=(), pesos=()):
+        self.destinos = array('i', destinos)
+        self.pesos = _array_pesos(pesos)
+
+    def __len__(self):
+        return len(self.destinos)
+
+    def __iter__(self):
+        return map(Aresta, self.destinos, self.pesos)
+
+    def __getitem__(self, i: int) -> Aresta:
+        return Aresta(self.destinos[i], self.pesos[i])
+
+    def posicao(self, destino: int) -> int:
+        """
+        Índice da primeira aresta para destino, ou -1. Procura os bytes do destino nos
+        bytes do array (em C), em vez de comparar elemento a elemento como o `in`.
+        """
+        if not -2**31 <= destino < 2**31:
+            return -1
+        dados = self.destinos.tobytes()
+        alvo = struct.pack('i', destino)
+        tamanho = self.destinos.itemsize
+        i = dados.find(alvo)
+        # só valem ocorrências alinhadas ao início de um elemento
+        while i != -1 and i % tamanho:
+            i = dados.find(alvo, i + 1)
+        return i // tamanho if i != -1 else -1
+
+    def append(self, aresta: Aresta) -> None:
+        self.adicionar(aresta.destino, aresta.peso)
+
+    def adicionar(self, destino: int, peso) -> None:
+        self.destinos.append(destino)
+        try:
+            self.pesos.append(peso)
+        except (TypeError, OverflowError):
+            # peso que não cabe no tipo atual: alarga o array inteiro
+            self.pesos = _array_pesos(self.pesos.tolist() + [peso], self.pesos.typecode)
+
+    def estender(self, destinos, pesos) -> None:
+        self.destinos.extend(array('i', destinos))
+        try:
+            self.pesos.extend(array(self.pesos.typecode, pesos))
+        except (TypeError, OverflowError):
+            self.pesos = _array_pesos(self.pesos.tolist() + list(pesos), self.pesos.typecode)
+
+    def definir_peso(self, i: int, peso) -> None:
+        try:
+            self.pesos[i] = peso
+        except (TypeError, OverflowError):
+            pesos = self.pesos.tolist()
+            pesos[i] = peso
+            self.pesos = _array_pesos(pesos, self.pesos.typecode)
+
+    def remover_destino(self, destino: int) -> None:
+        """Remove todas as arestas para destino"""
+        if self.posicao(destino) == -1:
+            return
+        mantidas = [(d, peso) for d, peso in zip(self.destinos, self.pesos) if d != destino]
+        self.destinos = array('i', [d for d, _ in mantidas])
+        self.pesos = array(self.pesos.typecode, [peso for _, peso in mantidas])
\ No newline at end of file
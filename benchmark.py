@@ -0,0 +1,377 @@
+"""
+Benchmarks de desempenho das estruturas e algoritmos de grafos
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import subprocess
+import tracemalloc
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+from union_find import UnionFind
+from dijkstra import dijkstra, dijkstra_bidirecional, a_estrela, Landmarks
+from delta_stepping import delta_stepping, delta_padrao
+from busca_largura import busca_em_largura, busca_em_largura_direcional, mascaras_adjacencia
+from mst import MST
+from coloracao_grafos import ColoracaoGrafos
+from medicao import medir, fixar_cpu, ambiente, salvar_json, salvar_csv, carregar_resultados, comparar, \
+    LIMIAR_REGRESSAO
+
+PASTAS = ["arquivos_m2/MST", "arquivos_m2/coloracao"]
+
+INSTANCIAS = [
+    ("arquivos_m2/MST/1000vertices25%Arestas.txt", True),
+    ("arquivos_m2/MST/500vertices100%Arestas.txt", True),
+    ("arquivos_m2/coloracao/r1000-234-234.txt", False),
+]
+
+
+def medir_memoria(classe, arquivo, ponderado):
+    """Carrega o arquivo e retorna o grafo e a memória alocada (bytes) pelo carregamento"""
+    tracemalloc.start()
+    grafo = classe(direcionado=False, ponderado=ponderado)
+    grafo.ler_arquivo(arquivo, usar_cache=False)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return grafo, memoria
+
+
+def benchmark_memoria():
+    """Compara a memória ocupada por GrafoLista, GrafoCSR e GrafoMatriz nas instâncias grandes"""
+    print(f"{'Instância':<30} {'GrafoLista (MB)':>16} {'GrafoCSR (MB)':>14} {'Redução':>9} "
+          f"{'GrafoMatriz (MB)':>17}")
+    print("-" * 90)
+    for arquivo, ponderado in INSTANCIAS:
+        if not os.path.exists(arquivo):
+            continue
+        _, memoria_lista = medir_memoria(GrafoLista, arquivo, ponderado)
+        _, memoria_csr = medir_memoria(GrafoCSR, arquivo, ponderado)
+        _, memoria_matriz = medir_memoria(GrafoMatriz, arquivo, ponderado)
+        print(f"{os.path.basename(arquivo):<30} {memoria_lista / 2**20:>16.2f} "
+              f"{memoria_csr / 2**20:>14.2f} {memoria_lista / memoria_csr:>8.1f}x "
+              f"{memoria_matriz / 2**20:>17.2f}")
+
+
+# roda em um processo novo, para que o pico de RSS seja só o da carga de uma estrutura
+SCRIPT_RSS = """
+import sys, resource
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+classe, arquivo, usar_cache = sys.argv[1], sys.argv[2], sys.argv[3] == '1'
+antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+globals()[classe](direcionado=False, ponderado=True).ler_arquivo(arquivo, usar_cache=usar_cache)
+print(antes, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def benchmark_rss(arquivo="arquivos_m2/MST/500vertices100%Arestas.txt"):
+    """Pico de RSS (ru_maxrss, em KB no Linux) de um processo que só carrega a instância"""
+    GrafoCSR(False, True).ler_arquivo(arquivo)  # garante o cache gravado
+    print(f"Instância: {os.path.basename(arquivo)}")
+    print(f"{'Estrutura':<12} {'Leitura':<8} {'Antes (MB)':>11} {'Pico (MB)':>10} {'Carga (MB)':>11}")
+    print("-" * 56)
+    for classe in (GrafoLista, GrafoMatriz, GrafoCSR):
+        for usar_cache in (False, True):
+            saida = subprocess.run([sys.executable, "-c", SCRIPT_RSS, classe.__name__, arquivo, str(int(usar_cache))],
+                                   capture_output=True, text=True, check=True).stdout
+            antes, pico = map(int, saida.split())
+            print(f"{classe.__name__:<12} {'cache' if usar_cache else 'texto':<8} {antes / 1024:>11.1f} "
+                  f"{pico / 1024:>10.1f} {(pico - antes) / 1024:>11.1f}")
+
+
+def listar_instancias():
+    """Retorna os caminhos de todas as instâncias de teste"""
+    arquivos = []
+    for pasta in PASTAS:
+        arquivos += [os.path.join(pasta, f) for f in sorted(os.listdir(pasta)) if f.endswith('.txt')]
+    return arquivos
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def benchmark_carregamento():
+    """Compara a leitura linha a linha, a leitura em lote e o cache binário para cada instância"""
+    print(f"{'Instância':<30} {'Estrutura':<12} {'Sequencial (s)':>15} {'Em lote (s)':>12} "
+          f"{'Cache (s)':>10} {'Speedup lote':>13} {'Speedup cache':>14}")
+    print("-" * 111)
+    for arquivo in listar_instancias():
+        for classe in (GrafoLista, GrafoMatriz, GrafoCSR):
+            sequencial = cronometrar(lambda: classe(False, False).ler_arquivo_sequencial(arquivo))
+            em_lote = cronometrar(lambda: classe(False, False).ler_arquivo(arquivo, usar_cache=False))
+            classe(False, False).ler_arquivo(arquivo)  # garante o cache gravado
+            cache = cronometrar(lambda: classe(False, False).ler_arquivo(arquivo))
+            print(f"{os.path.basename(arquivo):<30} {classe.__name__:<12} {sequencial:>15.4f} "
+                  f"{em_lote:>12.4f} {cache:>10.4f} {sequencial / em_lote:>12.1f}x {sequencial / cache:>13.1f}x")
+
+
+class UnionFindRecursivo:
+    """Versão anterior do Union-Find (listas e find recursivo), usada como referência"""
+    def __init__(self, n):
+        self.pai = list(range(n))
+        self.rank = [0] * n
+
+    def find(self, x):
+        if self.pai[x] != x:
+            self.pai[x] = self.find(self.pai[x])
+        return self.pai[x]
+
+    def union(self, x, y):
+        raiz_x = self.find(x)
+        raiz_y = self.find(y)
+
+        if raiz_x == raiz_y:
+            return False
+
+        if self.rank[raiz_x] < self.rank[raiz_y]:
+            self.pai[raiz_x] = raiz_y
+        elif self.rank[raiz_x] > self.rank[raiz_y]:
+            self.pai[raiz_y] = raiz_x
+        else:
+            self.pai[raiz_y] = raiz_x
+            self.rank[raiz_x] += 1
+
+        return True
+
+
+def benchmark_union_find(num_elementos=100000, num_operacoes=10**6):
+    """Compara o Union-Find recursivo com o iterativo (individual e em lote) em 10⁶ operações"""
+    gerador = random.Random(42)
+    xs = [gerador.randrange(num_elementos) for _ in range(num_operacoes)]
+    ys = [gerador.randrange(num_elementos) for _ in range(num_operacoes)]
+    metade = num_operacoes // 2
+
+    def operacoes_individuais(uf):
+        # metade uniões, metade consultas
+        for x, y in zip(xs[:metade], ys[:metade]):
+            uf.union(x, y)
+        for x in xs[metade:]:
+            uf.find(x)
+
+    def operacoes_em_lote(uf):
+        uf.union_many(xs[:metade], ys[:metade])
+        uf.find_many(xs[metade:])
+
+    tempos = [
+        ("Recursivo (anterior)", cronometrar(lambda: operacoes_individuais(UnionFindRecursivo(num_elementos)))),
+        ("Iterativo", cronometrar(lambda: operacoes_individuais(UnionFind(num_elementos)))),
+        ("Iterativo em lote", cronometrar(lambda: operacoes_em_lote(UnionFind(num_elementos)))),
+    ]
+
+    print(f"{num_operacoes} operações sobre {num_elementos} elementos")
+    for nome, tempo in tempos:
+        print(f"{nome:<22} {tempo:>8.3f}s {tempos[0][1] / tempo:>6.2f}x")
+
+    # cadeia longa (pai[i] = i + 1), como a que surge ao unir conjuntos sem rank
+    for classe in (UnionFindRecursivo, UnionFind):
+        uf = classe(num_elementos)
+        for i in range(num_elementos - 1):
+            uf.pai[i] = i + 1
+        try:
+            uf.find(0)
+            resultado = "ok"
+        except RecursionError:
+            resultado = "RecursionError"
+        print(f"find numa cadeia de {num_elementos} elementos ({classe.__name__}): {resultado}")
+
+
+def benchmark_caminhos(num_consultas=50, num_landmarks=4):
+    """Vértices fixados e tempo médio por consulta origem-destino em cada modo, nas instâncias de MST"""
+    print(f"{'Instância':<30} {'Modo':<24} {'Fixados (média)':>16} {'Tempo (ms)':>11}")
+    print("-" * 84)
+    for arquivo in sorted(os.listdir(PASTAS[0])):
+        grafo = GrafoLista(direcionado=False, ponderado=True)
+        grafo.ler_arquivo(os.path.join(PASTAS[0], arquivo), usar_cache=False)
+
+        gerador = random.Random(42)
+        num_vertices = len(grafo.labels)
+        pares = [(gerador.randrange(num_vertices), gerador.randrange(num_vertices)) for _ in range(num_consultas)]
+
+        inicio = time.perf_counter()
+        landmarks = Landmarks(grafo, num_landmarks, semente=42)
+        preparo = time.perf_counter() - inicio
+
+        modos = [
+            ("Dijkstra completo", lambda s, t: dijkstra(grafo, s)[1].fixados),
+            ("Dijkstra com destino", lambda s, t: dijkstra(grafo, s, t)[1].fixados),
+            ("Bidirecional", lambda s, t: dijkstra_bidirecional(grafo, s, t)[2]),
+            ("A* sem heurística", lambda s, t: a_estrela(grafo, s, t)[2]),
+            (f"A* ALT ({num_landmarks} landmarks)", lambda s, t: a_estrela(grafo, s, t, landmarks)[2]),
+        ]
+        for nome, consulta in modos:
+            inicio = time.perf_counter()
+            fixados = sum(consulta(s, t) for s, t in pares)
+            tempo = time.perf_counter() - inicio
+            print(f"{arquivo:<30} {nome:<24} {fixados / num_consultas:>16.1f} "
+                  f"{1000 * tempo / num_consultas:>11.3f}")
+        print(f"{arquivo:<30} {'(preparo dos landmarks)':<24} {'':>16} {1000 * preparo:>11.3f}")
+
+
+def benchmark_delta_stepping(processos=(1, 2, 4, 8), fatores_delta=(0.25, 1, 4, 16)):
+    """
+    Tempo do delta-stepping com 1, 2, 4 e 8 processos (delta padrão) e com vários
+    múltiplos do delta padrão (1 processo), conferindo as distâncias com o Dijkstra
+    """
+    print(f"CPUs disponíveis: {os.cpu_count()}")
+    print(f"{'Instância':<30} {'Configuração':<32} {'Tempo (s)':>10} {'vs Dijkstra':>12} {'Confere':>8}")
+    print("-" * 96)
+    for arquivo, ponderado in INSTANCIAS:
+        if not ponderado or not os.path.exists(arquivo):
+            continue
+        grafo = GrafoLista(direcionado=False, ponderado=True)
+        grafo.ler_arquivo(arquivo, usar_cache=False)
+        nome = os.path.basename(arquivo)
+
+        referencia = []
+        tempo_dijkstra = cronometrar(lambda: referencia.append(dijkstra(grafo, 0)[0]))
+        print(f"{nome:<30} {'Dijkstra':<32} {tempo_dijkstra:>10.3f} {1:>11.2f}x {'':>8}")
+
+        delta = delta_padrao(grafo)
+        configuracoes = [(f"{n} processo{'s' if n > 1 else ''}, delta={delta:g}", delta, n) for n in processos]
+        configuracoes += [(f"1 processo, delta={delta * f:g}", delta * f, 1) for f in fatores_delta if f != 1]
+        for descricao, delta_usado, num_processos in configuracoes:
+            resultado = []
+            tempo = cronometrar(lambda: resultado.append(delta_stepping(grafo, 0, delta_usado, num_processos)[0]))
+            confere = "sim" if resultado[0] == referencia[0] else "NÃO"
+            print(f"{nome:<30} {descricao:<32} {tempo:>10.3f} {tempo_dijkstra / tempo:>11.2f}x {confere:>8}")
+
+
+def benchmark_bfs(num_buscas=20):
+    """Tempo médio por busca da BFS com fila e da BFS com otimização de direção (bitsets)"""
+    print(f"{'Instância':<30} {'Fila (ms)':>10} {'Máscaras (ms)':>14} {'Direcional (ms)':>16} {'Speedup':>8}")
+    print("-" * 82)
+    for arquivo, ponderado in INSTANCIAS:
+        if not os.path.exists(arquivo):
+            continue
+        grafo = GrafoLista(direcionado=False, ponderado=ponderado)
+        grafo.ler_arquivo(arquivo, usar_cache=False)
+        origens = range(min(num_buscas, len(grafo.labels)))
+
+        fila = cronometrar(lambda: [busca_em_largura(grafo, s) for s in origens]) / len(origens)
+        mascaras = []
+        preparo = cronometrar(lambda: mascaras.append(mascaras_adjacencia(grafo)))
+        direcional = cronometrar(lambda: [busca_em_largura_direcional(grafo, s, mascaras=mascaras[0])
+                                          for s in origens]) / len(origens)
+        print(f"{os.path.basename(arquivo):<30} {1000 * fila:>10.3f} {1000 * preparo:>14.3f} "
+              f"{1000 * direcional:>16.3f} {fila / direcional:>7.1f}x")
+
+
+# métodos medidos pela suíte em cada instância da pasta; o tabucol fica de fora porque
+# roda até esgotar o limite de tempo, e o tempo dele é o próprio limite
+METODOS_SUITE = {
+    "arquivos_m2/MST": (MST, True, ('kruskal', 'prim', 'boruvka')),
+    "arquivos_m2/coloracao": (ColoracaoGrafos, False,
+                              ('welsh_powell', 'dsatur', 'jones_plassmann', 'heuristica_simples')),
+}
+
+
+def executar_suite(repeticoes=15, aquecimento=3, coletar_lixo=False, cpu=None, filtro=None):
+    """
+    Mede cada método de METODOS_SUITE em cada instância com medicao.medir, sempre sobre
+    um objeto novo e com os caches do grafo descartados antes de cada execução, para
+    que a extração e a ordenação das arestas também entrem no tempo. Retorna
+    (resultados, ambiente).
+    """
+    if cpu is not None and fixar_cpu(cpu) is None:
+        print("Aviso: fixar CPU não é suportado nesta plataforma", file=sys.stderr)
+
+    print(f"{'Medição':<48} {'Mediana (ms)':>13} {'IQR (ms)':>10} {'Execuções':>10}")
+    print("-" * 84)
+    resultados = []
+    for pasta, (classe, ponderado, metodos) in METODOS_SUITE.items():
+        for arquivo in sorted(f for f in os.listdir(pasta) if f.endswith('.txt')):
+            grafo = GrafoLista(direcionado=False, ponderado=ponderado)
+            grafo.ler_arquivo(os.path.join(pasta, arquivo))
+            for metodo in metodos:
+                nome = f"{classe.__name__}.{metodo}/{arquivo}"
+                if filtro and filtro not in nome:
+                    continue
+                resultado = {'nome': nome}
+                resultado.update(medir(lambda: getattr(classe(grafo), metodo)(),
+                                       repeticoes, aquecimento, coletar_lixo, preparar=grafo.descartar_caches))
+                resultados.append(resultado)
+                print(f"{nome:<48} {resultado['mediana_ns'] / 1e6:>13.3f} "
+                      f"{resultado['iqr_ns'] / 1e6:>10.3f} {resultado['execucoes_por_amostra']:>10}")
+
+    return resultados, ambiente(repeticoes=repeticoes, aquecimento=aquecimento,
+                                coletar_lixo=coletar_lixo, cpu_fixada=cpu)
+
+
+def imprimir_comparacao(comparacao):
+    """Tabela de medicao.comparar; retorna o número de regressões"""
+    def ms(valor):
+        return f"{valor / 1e6:.3f}" if valor is not None else "-"
+
+    print(f"{'Medição':<48} {'Base (ms)':>10} {'Nova (ms)':>10} {'Razão':>7} {'Situação':>10}")
+    print("-" * 89)
+    for nome, antes, depois, razao, situacao in comparacao:
+        print(f"{nome:<48} {ms(antes):>10} {ms(depois):>10} "
+              f"{f'{razao:.2f}x' if razao is not None else '-':>7} {situacao:>10}")
+    return sum(situacao == 'regressão' for *_, situacao in comparacao)
+
+
+def principal_suite(argumentos):
+    parser = argparse.ArgumentParser(prog="benchmark.py suite",
+                                     description="Mede MST e coloração com repetições e grava JSON/CSV")
+    parser.add_argument("--repeticoes", type=int, default=15)
+    parser.add_argument("--aquecimento", type=int, default=3)
+    parser.add_argument("--com-gc", action="store_true", help="mantém o coletor de lixo ligado nas medições")
+    parser.add_argument("--cpu", type=int, help="prende o processo a esta CPU (Linux)")
+    parser.add_argument("--filtro", help="só mede os nomes que contêm este texto")
+    parser.add_argument("--json", help="arquivo JSON de saída (com as amostras)")
+    parser.add_argument("--csv", help="arquivo CSV de saída (só os resumos)")
+    opcoes = parser.parse_args(argumentos)
+
+    resultados, dados = executar_suite(opcoes.repeticoes, opcoes.aquecimento, opcoes.com_gc, opcoes.cpu,
+                                       opcoes.filtro)
+    if opcoes.json:
+        salvar_json(opcoes.json, resultados, dados)
+    if opcoes.csv:
+        salvar_csv(opcoes.csv, resultados)
+
+
+def principal_comparar(argumentos):
+    parser = argparse.ArgumentParser(prog="benchmark.py comparar",
+                                     description="Compara dois arquivos de resultados da suíte")
+    parser.add_argument("base")
+    parser.add_argument("nova")
+    parser.add_argument("--limiar", type=float, default=LIMIAR_REGRESSAO,
+                        help="variação mínima da mediana para contar (fração, padrão %(default)s)")
+    opcoes = parser.parse_args(argumentos)
+
+    comparacao = comparar(carregar_resultados(opcoes.base), carregar_resultados(opcoes.nova), opcoes.limiar)
+    regressoes = imprimir_comparacao(comparacao)
+    print(f"\n{regressoes} regressão(ões)")
+    return 1 if regressoes else 0
+
+
+BENCHMARKS = {
+    'memoria': benchmark_memoria,
+    'rss': benchmark_rss,
+    'carregamento': benchmark_carregamento,
+    'union_find': benchmark_union_find,
+    'caminhos': benchmark_caminhos,
+    'delta_stepping': benchmark_delta_stepping,
+    'bfs': benchmark_bfs,
+}
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["suite"]:
+        sys.exit(principal_suite(sys.argv[2:]))
+    if sys.argv[1:2] == ["comparar"]:
+        sys.exit(principal_comparar(sys.argv[2:]))
+
+    nomes = sys.argv[1:] or list(BENCHMARKS)
+    for nome in nomes:
+        print(f"\n=== {nome} ===")
+        BENCHMARKS[nome]()
@@ -1,6 +1,9 @@
 from collections import deque
 
+from dijkstra import Caminhos
+
 def busca_em_largura(grafo, inicio: int, destino: int = None) -> list:
+    grafo.exigir_vertice_ativo(inicio)
     visitados = [False] * len(grafo.labels)
     caminho = []
     fila = deque([inicio])
@@ -19,4 +22,116 @@ def busca_em_largura(grafo, inicio: int, destino: int = None) -> list:
                 fila.append(vizinho)
                 visitados[vizinho] = True
 
-    return caminho  
+    return caminho
+
+
+# parâmetros de Beamer et al.: desce para bottom-up quando as arestas da fronteira passam
+# de 1/ALFA das arestas dos não visitados, e volta quando a fronteira fica abaixo de V/BETA
+ALFA_BFS = 14
+BETA_BFS = 24
+
+# byte 0/1 por vértice -> dígito '0'/'1', para montar a máscara com int(..., 2)
+_DIGITOS_BINARIOS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def _mascara(vizinhos, num_vertices: int) -> int:
+    marcados = bytearray(num_vertices)
+    for vizinho in vizinhos:
+        marcados[vizinho] = 1
+    # o bit v do inteiro é o vértice v, então os dígitos vão do último vértice ao primeiro
+    return int(marcados[::-1].translate(_DIGITOS_BINARIOS) or b'0', 2)
+
+
+def mascaras_adjacencia(grafo) -> tuple:
+    """
+    Vizinhanças de saída e de entrada como bitsets (inteiros em que o bit w indica o
+    vizinho w), e o grau de saída de cada vértice. Em grafos não direcionados as duas
+    listas de máscaras são a mesma.
+    """
+    num_vertices = len(grafo.labels)
+    vizinhos = [grafo.retornar_vizinhos(v) for v in range(num_vertices)]
+    saida = [_mascara(lista, num_vertices) for lista in vizinhos]
+    graus = [len(lista) for lista in vizinhos]
+
+    if not grafo.direcionado:
+        return saida, saida, graus
+
+    anteriores = [[] for _ in range(num_vertices)]
+    for v, lista in enumerate(vizinhos):
+        for w in lista:
+            anteriores[w].append(v)
+    return saida, [_mascara(lista, num_vertices) for lista in anteriores], graus
+
+
+def _bits(mascara: int):
+    while mascara:
+        bit = mascara & -mascara
+        yield bit.bit_length() - 1
+        mascara ^= bit
+
+
+def busca_em_largura_direcional(grafo, inicio: int, destino: int = None, mascaras: tuple = None) -> tuple:
+    """
+    BFS que otimiza a direção (Beamer et al.): com fronteira pequena expande cada vértice
+    dela (top-down); quando ela cobre boa parte das arestas restantes, cada vértice não
+    visitado procura um vizinho de entrada na fronteira (bottom-up), o que num grafo denso
+    custa um AND de bitsets por vértice em vez de percorrer todas as arestas da fronteira.
+
+    Fronteira e visitados são bitsets em inteiros. mascaras pode ser o resultado de
+    mascaras_adjacencia(grafo), para reaproveitar entre buscas. Com destino, para no
+    nível em que ele é alcançado. Retorna (niveis, caminhos) como o dijkstra: niveis[v] é
+    o número de arestas até v (inf se inacessível) e caminhos.caminho(v) o caminho pela
+    árvore da busca.
+    """
+    grafo.exigir_vertice_ativo(inicio)
+    num_vertices = len(grafo.labels)
+    saida, entrada, graus = mascaras if mascaras is not None else mascaras_adjacencia(grafo)
+
+    niveis = [float('inf')] * num_vertices
+    anteriores = [None] * num_vertices
+    niveis[inicio] = 0
+
+    fronteira = 1 << inicio
+    visitados = fronteira
+    tamanho_fronteira = 1
+    arestas_fronteira = graus[inicio]
+    arestas_restantes = sum(graus) - graus[inicio]
+    bottom_up = False
+    nivel = 0
+
+    while fronteira and not (destino is not None and visitados >> destino & 1):
+        nivel += 1
+        if bottom_up:
+            bottom_up = tamanho_fronteira >= num_vertices / BETA_BFS
+        else:
+            bottom_up = arestas_fronteira > arestas_restantes / ALFA_BFS
+
+        proxima = 0
+        if bottom_up:
+            for v in _bits(~visitados & ((1 << num_vertices) - 1)):
+                comuns = entrada[v] & fronteira
+                if comuns:
+                    anteriores[v] = (comuns & -comuns).bit_length() - 1
+                    proxima |= 1 << v
+            novos = _bits(proxima)
+        else:
+            novos = []
+            for u in _bits(fronteira):
+                descobertos = saida[u] & ~visitados & ~proxima
+                if descobertos:
+                    proxima |= descobertos
+                    for v in _bits(descobertos):
+                        anteriores[v] = u
+                        novos.append(v)
+
+        visitados |= proxima
+        fronteira = proxima
+        tamanho_fronteira = 0
+        arestas_fronteira = 0
+        for v in novos:
+            niveis[v] = nivel
+            tamanho_fronteira += 1
+            arestas_fronteira += graus[v]
+        arestas_restantes -= arestas_fronteira
+
+    return niveis, Caminhos(niveis, anteriores)
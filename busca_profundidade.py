@@ -1,20 +1,31 @@
-def busca_em_profundidade(grafo, inicio: int, destino: int = None) -> list:
+def percorrer_em_profundidade(grafo, inicio: int, destino: int = None):
+    """
+    Gera os vértices na ordem de visita da busca em profundidade a partir de inicio,
+    parando após destino (se dado). Usa uma pilha explícita de iteradores de vizinhos,
+    então não há limite de recursão e quem chama pode parar a qualquer momento.
+    """
+    grafo.exigir_vertice_ativo(inicio)
     visitados = [False] * len(grafo.labels)
-    caminho = []
-
-    def dfs(v):
-        visitados[v] = True
-        caminho.append(v)
-
-        if destino is not None and v == destino:
-            return True
+    visitados[inicio] = True
+    yield inicio
+    if inicio == destino:
+        return
 
-        for vizinho in grafo.retornar_vizinhos(v):
+    # cada entrada é o iterador dos vizinhos ainda não examinados de um vértice
+    pilha = [iter(grafo.retornar_vizinhos(inicio))]
+    while pilha:
+        for vizinho in pilha[-1]:
             if not visitados[vizinho]:
-                if dfs(vizinho):
-                    return True
+                visitados[vizinho] = True
+                yield vizinho
+                if vizinho == destino:
+                    return
 
-        return False
+                pilha.append(iter(grafo.retornar_vizinhos(vizinho)))
+                break
+        else:
+            pilha.pop()
 
-    dfs(inicio)
-    return caminho
+
+def busca_em_profundidade(grafo, inicio: int, destino: int = None) -> list:
+    return list(percorrer_em_profundidade(grafo, inicio, destino))
\ No newline at end of file
@@ -1,5 +1,253 @@
+import os
 import time
-import itertools
+import heapq
+import random
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from multiprocessing.sharedctypes import RawArray
+
+from grafo_csr import csr_compartilhado, visao_nativa
+
+# abaixo disso, o custo de coordenar os processos a cada rodada supera o ganho
+ARESTAS_POR_PROCESSO_JP = 50000
+
+# blocos de vértices por processo, para equilibrar a carga entre as rodadas
+BLOCOS_POR_PROCESSO_JP = 4
+
+def _menor_cor_livre(vertice, vizinhos, cores, marcas):
+    """
+    Menor cor que nenhum vizinho usa (first-fit), em O(grau). marcas é um vetor
+    reaproveitado entre chamadas: marcas[c] == vertice indica que a cor c está ocupada
+    para este vértice, então não é preciso limpá-lo entre um vértice e outro.
+    """
+    for vizinho in vizinhos:
+        cor = cores[vizinho]
+        if cor != -1:
+            marcas[cor] = vertice
+
+    cor = 0
+    while marcas[cor] == vertice:
+        cor += 1
+    return cor
+
+
+def _colorir_em_ordem(ordem, vizinhos):
+    """Coloração gulosa first-fit dos vértices na ordem dada; retorna (cores, num_cores)"""
+    cores = [-1] * len(vizinhos)
+    marcas = [-1] * (len(vizinhos) + 1)  # um vértice nunca precisa de mais que grau + 1 cores
+    num_cores = 0
+
+    for vertice in ordem:
+        cor = _menor_cor_livre(vertice, vizinhos[vertice], cores, marcas)
+        cores[vertice] = cor
+        if cor >= num_cores:
+            num_cores = cor + 1
+
+    return cores, num_cores
+
+
+def _dsatur(vertices, vizinhos):
+    """
+    DSATUR sobre as listas de vizinhos dadas: colore os vértices informados, sempre o
+    de maior saturação (cores distintas na vizinhança), desempatando pelo grau e depois
+    pelo menor índice. Retorna (cores, num_cores), com -1 nos vértices não coloridos.
+    """
+    grau = [len(lista) for lista in vizinhos]
+
+    # cores distintas já usadas na vizinhança de cada vértice, como máscara de bits;
+    # a saturação é o número de bits ligados
+    cores_vizinhas = [0] * len(vizinhos)
+    saturacao = [0] * len(vizinhos)
+
+    cores = [-1] * len(vizinhos)
+    num_cores = 0
+
+    # fila de prioridade em baldes por saturação: cada balde é um heap de (-grau, vértice)
+    # e vivos[s] conta os vértices sem cor com saturação s. Quando um vértice sobe de
+    # balde, a entrada antiga fica para trás e é descartada se chegar ao topo.
+    baldes = [[(-grau[v], v) for v in vertices]]
+    heapq.heapify(baldes[0])
+    vivos = [len(vertices)]
+    maior_saturacao = 0
+
+    for _ in vertices:
+        while not vivos[maior_saturacao]:
+            maior_saturacao -= 1
+
+        balde = baldes[maior_saturacao]
+        while True:
+            _, vertice = heapq.heappop(balde)
+            if cores[vertice] == -1 and saturacao[vertice] == maior_saturacao:
+                break
+
+        vivos[maior_saturacao] -= 1
+
+        # menor cor ausente da máscara (o bit zero menos significativo)
+        mascara = cores_vizinhas[vertice]
+        cor = (~mascara & (mascara + 1)).bit_length() - 1
+
+        cores[vertice] = cor
+        num_cores = max(num_cores, cor + 1)
+
+        bit = 1 << cor
+        for vizinho in vizinhos[vertice]:
+            if cores[vizinho] == -1 and not cores_vizinhas[vizinho] & bit:
+                cores_vizinhas[vizinho] |= bit
+                s = saturacao[vizinho]
+                vivos[s] -= 1
+                s += 1
+                saturacao[vizinho] = s
+
+                if s == len(baldes):
+                    baldes.append([])
+                    vivos.append(0)
+                heapq.heappush(baldes[s], (-grau[vizinho], vizinho))
+                vivos[s] += 1
+                if s > maior_saturacao:
+                    maior_saturacao = s
+
+    return cores, num_cores
+
+
+# estado compartilhado do Jones-Plassmann (definido pelo inicializador do pool)
+_ESTADO_JP = None
+_MARCAS_JP = None
+
+
+def _inicializar_jones_plassmann(offsets, destinos, prioridade, cores, fim_prioritarios, proximo):
+    global _ESTADO_JP, _MARCAS_JP
+    if prioridade is None:
+        _ESTADO_JP = _MARCAS_JP = None
+        return
+    _ESTADO_JP = tuple(map(visao_nativa, (offsets, destinos, prioridade, cores, fim_prioritarios, proximo)))
+    _MARCAS_JP = [-1] * (len(prioridade) + 1)
+
+
+def _separar_prioritarios(tarefa):
+    """
+    Reordena a vizinhança de cada vértice do bloco para que os vizinhos de maior
+    prioridade venham primeiro; fim_prioritarios[v] marca onde eles terminam
+    """
+    inicio, fim = tarefa
+    offsets, destinos, prioridade, _, fim_prioritarios, proximo = _ESTADO_JP
+
+    for vertice in range(inicio, fim):
+        a, b = offsets[vertice], offsets[vertice + 1]
+        minha = prioridade[vertice]
+        vizinhos = destinos[a:b].tolist()
+        maiores = [u for u in vizinhos if prioridade[u] > minha]
+        menores = [u for u in vizinhos if prioridade[u] <= minha]
+        destinos[a:b] = array('i', maiores + menores)
+        fim_prioritarios[vertice] = a + len(maiores)
+        proximo[vertice] = a
+
+
+def _colorir_rodada(pendentes):
+    """
+    Colore os vértices pendentes do bloco cujos vizinhos de maior prioridade já têm
+    cor. Eles formam um conjunto independente, então cada um recebe a menor cor livre
+    sem conflito com os demais da rodada. Retorna (vértices, cores, ainda pendentes).
+    """
+    offsets, destinos, _, cores, fim_prioritarios, proximo = _ESTADO_JP
+    marcas = _MARCAS_JP
+
+    coloridos = array('i')
+    novas_cores = array('i')
+    restantes = array('i')
+    for vertice in pendentes:
+        # avança sobre os vizinhos prioritários já coloridos; cada posição é visitada uma vez
+        p, limite = proximo[vertice], fim_prioritarios[vertice]
+        while p < limite and cores[destinos[p]] != -1:
+            p += 1
+        proximo[vertice] = p
+        if p < limite:
+            restantes.append(vertice)
+            continue
+
+        coloridos.append(vertice)
+        novas_cores.append(_menor_cor_livre(vertice, destinos[offsets[vertice]:limite], cores, marcas))
+
+    return coloridos, novas_cores, restantes
+
+
+def _ordenar_por_cores(candidatos, adj):
+    """
+    Colore gulosamente os candidatos (máscara de bits) e devolve os vértices na ordem
+    das classes de cor, junto com o número da classe de cada um: um limite superior
+    para o tamanho de qualquer clique entre os candidatos até aquela posição.
+    """
+    ordem, limites = [], []
+    classe = 0
+    while candidatos:
+        classe += 1
+        livres = candidatos
+        while livres:
+            bit = livres & -livres
+            vertice = bit.bit_length() - 1
+            livres &= ~adj[vertice] & ~bit
+            candidatos ^= bit
+            ordem.append(vertice)
+            limites.append(classe)
+    return ordem, limites
+
+
+def _clique_maxima(adj, alvo, orcamento):
+    """
+    Clique máxima por branch and bound com limite de coloração gulosa (estilo MCQ),
+    sobre máscaras de bits e com pilha explícita. Para assim que encontra uma clique
+    de tamanho alvo ou o orçamento acaba; retorna (clique, completa).
+    """
+    melhor = []
+    todos = (1 << len(adj)) - 1
+    ordem, limites = _ordenar_por_cores(todos, adj)
+    pilha = [([], todos, ordem, limites)]
+
+    while pilha:
+        clique, candidatos, ordem, limites = pilha[-1]
+
+        # a ordem termina nas classes mais altas; se nem a maior fecha a conta, desiste do nó
+        if not ordem or len(clique) + limites[-1] <= len(melhor):
+            pilha.pop()
+            continue
+
+        if orcamento.esgotado():
+            return melhor, False
+
+        vertice = ordem.pop()
+        limites.pop()
+        bit = 1 << vertice
+        pilha[-1] = (clique, candidatos & ~bit, ordem, limites)
+
+        novos = candidatos & adj[vertice]
+        if not novos:
+            if len(clique) + 1 > len(melhor):
+                melhor = clique + [vertice]
+                if len(melhor) >= alvo:
+                    return melhor, True
+            continue
+
+        ordem_novos, limites_novos = _ordenar_por_cores(novos, adj)
+        pilha.append((clique + [vertice], novos, ordem_novos, limites_novos))
+
+    return melhor, True
+
+
+class _Orcamento:
+    """Limite de tempo (segundos) e de nós explorados compartilhado entre as fases da busca"""
+
+    def __init__(self, limite_tempo=None, limite_nos=None):
+        self.prazo = time.perf_counter() + limite_tempo if limite_tempo is not None else None
+        self.limite_nos = limite_nos
+        self.nos = 0
+
+    def esgotado(self) -> bool:
+        self.nos += 1
+        if self.limite_nos is not None and self.nos > self.limite_nos:
+            return True
+        # consultar o relógio a cada nó pesa mais que a própria poda
+        return self.prazo is not None and not self.nos & 255 and time.perf_counter() > self.prazo
+
 
 class ColoracaoGrafos:
     def __init__(self, grafo):
@@ -7,25 +255,152 @@ class ColoracaoGrafos:
         self.cores = {}
         self.tempo_execucao = 0
 
-    def força_bruta(self):
-        inicio = time.time()
-
-        # lista de vértices
-        vertices = list(range(len(self.grafo.labels)))
-        
-        # tenta com 2 cores até len(vertices)
-        for num_cores in range(2, len(vertices) + 1):
-            for combinacao in itertools.product(range(num_cores), repeat=len(vertices)):
-                if self.e_coloring_valida(vertices, combinacao):
-                    self.tempo_execucao = time.time() - inicio
-                    self.cores = {vertices[i]: combinacao[i] for i in range(len(vertices))}
-
-                    return num_cores
-
-        self.tempo_execucao = time.time() - inicio
+        # número de rodadas do Jones-Plassmann
+        self.rodadas = 0
+
+        # preenchidos pela busca exata
+        self.limite_inferior = 0
+        self.otima = False
+        self.nos_explorados = 0
+
+    def branch_and_bound(self, limite_tempo=None, limite_nos=None):
+        """
+        Número cromático exato por DSATUR com branch and bound. O DSATUR guloso dá o
+        limite superior e uma clique máxima dá o inferior; a clique é pré-colorida e a
+        busca ramifica sempre no vértice mais saturado, sem abrir mais de uma cor nova
+        por nível. Se o orçamento acabar, retorna a melhor coloração encontrada e
+        deixa otima = False, com o limite inferior provado em limite_inferior.
+        Em grafos direcionados as arestas são tomadas sem direção, inclusive no DSATUR
+        do limite superior.
+        """
+        inicio = time.perf_counter()
+        orcamento = _Orcamento(limite_tempo, limite_nos)
+
+        num_vertices = len(self.grafo.labels)
+        vizinhos = [[] for _ in range(num_vertices)]
+        adj = [0] * num_vertices
+        for v in range(num_vertices):
+            for u in self.grafo.retornar_vizinhos(v):
+                if u != v and not adj[v] >> u & 1:
+                    adj[v] |= 1 << u
+                    adj[u] |= 1 << v
+        for v in range(num_vertices):
+            mascara = adj[v]
+            while mascara:
+                bit = mascara & -mascara
+                vizinhos[v].append(bit.bit_length() - 1)
+                mascara ^= bit
+
+        # o limite superior vem da mesma vizinhança simétrica usada na busca
+        melhores_cores, melhor = _dsatur(self.grafo.vertices_ativos(), vizinhos)
+
+        clique, _ = _clique_maxima(adj, melhor, orcamento)
+        self.limite_inferior = len(clique)
+
+        # estado incremental: contagem[v][c] vizinhos de v com a cor c, mascara[v] com as
+        # cores presentes na vizinhança, saturacao[v] o número delas e grau[v] os vizinhos
+        # ainda sem cor (desempate do DSATUR)
+        # removidos ficam com a cor -2, que o mais_saturado nunca escolhe
+        cores = [-1 if self.grafo.vertice_ativo(v) else -2 for v in range(num_vertices)]
+        contagem = [[0] * melhor for _ in range(num_vertices)]
+        mascara = [0] * num_vertices
+        saturacao = [0] * num_vertices
+        uso = [0] * (melhor + 1)
+        grau = [len(vizinhos[v]) for v in range(num_vertices)]
+
+        def atribuir(vertice, cor):
+            cores[vertice] = cor
+            uso[cor] += 1
+            bit = 1 << cor
+            for vizinho in vizinhos[vertice]:
+                grau[vizinho] -= 1
+                contagem_vizinho = contagem[vizinho]
+                contagem_vizinho[cor] += 1
+                if contagem_vizinho[cor] == 1:
+                    mascara[vizinho] |= bit
+                    saturacao[vizinho] += 1
 
-        # no pior caso, todas as cores
-        return len(vertices)
+        def desfazer(vertice):
+            cor = cores[vertice]
+            cores[vertice] = -1
+            uso[cor] -= 1
+            bit = 1 << cor
+            for vizinho in vizinhos[vertice]:
+                grau[vizinho] += 1
+                contagem_vizinho = contagem[vizinho]
+                contagem_vizinho[cor] -= 1
+                if not contagem_vizinho[cor]:
+                    mascara[vizinho] &= ~bit
+                    saturacao[vizinho] -= 1
+
+        def mais_saturado():
+            escolhido, chave = -1, (-1, -1)
+            for v in range(num_vertices):
+                if cores[v] == -1 and (saturacao[v], grau[v]) > chave:
+                    escolhido, chave = v, (saturacao[v], grau[v])
+            return escolhido
+
+        for cor, vertice in enumerate(clique):
+            atribuir(vertice, cor)
+        usadas = len(clique)
+
+        completa = melhor <= self.limite_inferior
+        if not completa:
+            completa = True
+            vertice = mais_saturado()
+            # cada nível guarda [vértice, cores candidatas, próxima candidata]
+            pilha = [[vertice, [c for c in range(usadas + 1) if not mascara[vertice] >> c & 1], 0]] if vertice != -1 else []
+
+            while pilha:
+                nivel = pilha[-1]
+                vertice, candidatas, i = nivel
+                if cores[vertice] != -1:
+                    desfazer(vertice)
+                    if not uso[usadas - 1]:
+                        usadas -= 1
+
+                # candidatas é crescente: se esta já não melhora a solução, as próximas também não
+                if i == len(candidatas) or candidatas[i] + 1 >= melhor:
+                    pilha.pop()
+                    continue
+
+                if orcamento.esgotado():
+                    completa = False
+                    break
+
+                cor = candidatas[i]
+                nivel[2] = i + 1
+                atribuir(vertice, cor)
+                if cor == usadas:
+                    usadas += 1
+
+                proximo = mais_saturado()
+                if proximo == -1:
+                    melhor = usadas
+                    melhores_cores = cores[:]
+                    if melhor <= self.limite_inferior:
+                        break
+                    continue
+
+                limite = min(usadas + 1, melhor - 1)
+                livres = [c for c in range(limite) if not mascara[proximo] >> c & 1]
+                pilha.append([proximo, livres, 0])
+
+        self.nos_explorados = orcamento.nos
+        self.otima = completa
+        if completa:
+            self.limite_inferior = melhor
+
+        self.tempo_execucao = time.perf_counter() - inicio
+
+        self.cores = {v: melhores_cores[v] for v in self.grafo.vertices_ativos()}
+
+        return melhor
+
+    def força_bruta(self, limite_tempo=None, limite_nos=None):
+        # a enumeração de todas as combinações com itertools.product não passava de ~10
+        # vértices; a busca exata agora é o branch and bound
+        return self.branch_and_bound(limite_tempo, limite_nos)
 
     def e_coloring_valida(self, vertices, combinacao):
         for i in range(len(vertices)):
@@ -37,86 +412,293 @@ class ColoracaoGrafos:
         return True
 
     def welsh_powell(self):
-        inicio = time.time()
+        inicio = time.perf_counter()
 
-        vertices = list(range(len(self.grafo.labels)))
-        vertices.sort(key=lambda v: len(self.grafo.retornar_vizinhos(v)), reverse=True)  # Ordena por grau decrescente
-        
-        num_cores = 0
-        cores = [-1] * len(vertices)
-
-        for vertice in vertices:
-            # todas as cores possíveis
-            cor_disponivel = set(range(len(vertices)))
+        vizinhos = [self.grafo.retornar_vizinhos(v) for v in range(len(self.grafo.labels))]
+        vertices = list(self.grafo.vertices_ativos())
+        vertices.sort(key=lambda v: len(vizinhos[v]), reverse=True)  # Ordena por grau decrescente
 
-            for vizinho in self.grafo.retornar_vizinhos(vertice):
-                if cores[vizinho] != -1:
-                    # remove cores usadas por vizinhos
-                    cor_disponivel.discard(cores[vizinho])
+        cores, num_cores = _colorir_em_ordem(vertices, vizinhos)
 
-            cores[vertice] = min(cor_disponivel)
-            num_cores = max(num_cores, cores[vertice] + 1)
+        self.tempo_execucao = time.perf_counter() - inicio
 
-        self.tempo_execucao = time.time() - inicio
-
-        self.cores = {vertices[i]: cores[i] for i in range(len(vertices))}
+        self.cores = {v: cores[v] for v in self.grafo.vertices_ativos()}
 
         return num_cores
 
     def dsatur(self):
-        inicio = time.time()
-
-        vertices = list(range(len(self.grafo.labels)))
-        saturacao = [0] * len(vertices)
-        grau = [len(self.grafo.retornar_vizinhos(v)) for v in vertices]
+        inicio = time.perf_counter()
 
-        cores = [-1] * len(vertices)
-        num_cores = 0
+        vertices = self.grafo.vertices_ativos()
+        vizinhos = [self.grafo.retornar_vizinhos(v) for v in range(len(self.grafo.labels))]
+        cores, num_cores = _dsatur(vertices, vizinhos)
 
-        while -1 in cores:
-            vertice = max(vertices, key=lambda v: (saturacao[v], grau[v]) if cores[v] == -1 else (-1, -1))
-            cor_disponivel = set(range(len(vertices)))
+        self.tempo_execucao = time.perf_counter() - inicio
 
-            for vizinho in self.grafo.retornar_vizinhos(vertice):
-                if cores[vizinho] != -1:
-                    cor_disponivel.discard(cores[vizinho])
+        self.cores = {v: cores[v] for v in vertices}
 
-            cores[vertice] = min(cor_disponivel)
-            num_cores = max(num_cores, cores[vertice] + 1)
+        return num_cores
 
-            for vizinho in self.grafo.retornar_vizinhos(vertice):
-                if cores[vizinho] == -1:
-                    saturacao[vizinho] += 1
+    def jones_plassmann(self, num_processos=None, semente=None, prioridade='aleatoria'):
+        """
+        Coloração paralela de Jones-Plassmann: cada vértice recebe uma prioridade
+        aleatória e, a cada rodada, os vértices sem cor cuja prioridade supera a de
+        todos os vizinhos ainda sem cor (um conjunto independente) recebem a menor cor
+        livre. As rodadas são divididas em blocos de vértices entre num_processos
+        processos (padrão: número de CPUs), que leem a adjacência e as cores de
+        memória compartilhada. O resultado é igual ao guloso na ordem das prioridades.
+
+        prioridade: 'aleatoria' (Jones-Plassmann clássico) ou 'grau' (maior grau
+        primeiro, com desempate aleatório), que usa menos cores, como o Welsh-Powell.
+        """
+        inicio = time.perf_counter()
+
+        offsets, destinos = csr_compartilhado(self.grafo)
+        num_vertices = len(offsets) - 1
+
+        # prioridades distintas: uma permutação dos vértices
+        ordem = list(range(num_vertices))
+        random.Random(semente).shuffle(ordem)
+        if prioridade == 'grau':
+            limites = visao_nativa(offsets)
+            ordem.sort(key=lambda v: limites[v + 1] - limites[v], reverse=True)
+        elif prioridade != 'aleatoria':
+            raise ValueError(f"Prioridade do Jones-Plassmann desconhecida: {prioridade}")
+
+        prioridades = RawArray('i', num_vertices)
+        visao_prioridade = visao_nativa(prioridades)
+        for posicao, vertice in enumerate(ordem):
+            visao_prioridade[vertice] = num_vertices - posicao
+
+        cores_compartilhadas = RawArray('i', num_vertices)
+        cores = visao_nativa(cores_compartilhadas)
+        cores[:] = array('i', [-1]) * num_vertices
+        fim_prioritarios = RawArray('q', num_vertices)
+        proximo = RawArray('q', num_vertices)
+
+        if num_processos is None:
+            num_processos = os.cpu_count() or 1
+        num_processos = max(1, min(num_processos, len(destinos) // ARESTAS_POR_PROCESSO_JP))
+
+        # blocos com aproximadamente o mesmo número de arestas
+        num_blocos = num_processos * BLOCOS_POR_PROCESSO_JP if num_processos > 1 else 1
+        cortes = [0] + [bisect_left(offsets, len(destinos) * i // num_blocos, 0, num_vertices)
+                        for i in range(1, num_blocos)] + [num_vertices]
+        blocos = [(a, b) for a, b in zip(cortes, cortes[1:]) if a < b]
+
+        dados = (offsets, destinos, prioridades, cores_compartilhadas, fim_prioritarios, proximo)
+        pool = None
+        if num_processos > 1:
+            pool = multiprocessing.Pool(num_processos, initializer=_inicializar_jones_plassmann, initargs=dados)
+            mapear = pool.map
+        else:
+            _inicializar_jones_plassmann(*dados)
+            mapear = lambda funcao, tarefas: [funcao(tarefa) for tarefa in tarefas]
+
+        self.rodadas = 0
+        num_cores = 0
+        pendentes = [array('i', range(a, b)) for a, b in blocos]
+        try:
+            mapear(_separar_prioritarios, blocos)
+
+            while pendentes:
+                self.rodadas += 1
+                resultados = mapear(_colorir_rodada, pendentes)
+                pendentes = []
+                for coloridos, novas_cores, restantes in resultados:
+                    for vertice, cor in zip(coloridos, novas_cores):
+                        cores[vertice] = cor
+                        if cor >= num_cores:
+                            num_cores = cor + 1
+                    if restantes:
+                        pendentes.append(restantes)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            _inicializar_jones_plassmann(None, None, None, None, None, None)
+
+        self.tempo_execucao = time.perf_counter() - inicio
+
+        # removidos, isolados, também recebem a cor 0, mas ficam fora do resultado
+        cores = cores.tolist()
+        self.cores = {v: cores[v] for v in self.grafo.vertices_ativos()}
 
-        self.tempo_execucao = time.time() - inicio
+        return num_cores
 
-        self.cores = {vertices[i]: cores[i] for i in range(len(vertices))}
+    def tabucol(self, limite_tempo=10.0, semente=None, ao_melhorar=None):
+        """
+        Melhora por busca tabu (Tabucol) a coloração em self.cores, que pode vir de
+        qualquer heurística. A busca toma as arestas sem direção; se self.cores estiver
+        vazia, ou não for válida nessa vizinhança (como a de uma heurística que só olha
+        os vizinhos de saída de um grafo direcionado), parte do DSATUR sobre a mesma
+        vizinhança. Com k cores válidas,
+        tenta k - 1: os vértices da cor removida vão para a cor de menos conflitos e a
+        busca move um vértice em conflito por vez para a cor que mais reduz o número
+        de arestas conflitantes, proibindo a volta por algumas iterações.
+
+        gama[v * k + c] conta os vizinhos de v com a cor c, então avaliar um movimento
+        custa O(1) e aplicá-lo custa O(grau). Para quando limite_tempo (segundos) se
+        esgota; a cada coloração válida com menos cores chama ao_melhorar(num_cores,
+        segundos decorridos), se informado. Também para ao chegar ao tamanho de uma
+        clique, já que menos cores que isso é impossível.
+        """
+        inicio = time.perf_counter()
+        prazo = inicio + limite_tempo
+        aleatorio = random.Random(semente)
+
+        num_vertices = len(self.grafo.labels)
+
+        # vizinhança simétrica e sem laços nem arestas repetidas
+        conjuntos = [set() for _ in range(num_vertices)]
+        for v in range(num_vertices):
+            for u in self.grafo.retornar_vizinhos(v):
+                if u != v:
+                    conjuntos[v].add(u)
+                    conjuntos[u].add(v)
+        vizinhos = [list(conjunto) for conjunto in conjuntos]
+
+        # uma clique dá o limite inferior em que a busca pode parar (com pouco do orçamento)
+        adj = [0] * num_vertices
+        for v in range(num_vertices):
+            for u in vizinhos[v]:
+                adj[v] |= 1 << u
+        clique, _ = _clique_maxima(adj, num_vertices, _Orcamento(limite_tempo=0.05 * limite_tempo))
+        limite_inferior = max(len(clique), 1)
+
+        # removidos não têm vizinhos e seguem com a cor 0, sem nunca entrar em conflito
+        melhores_cores = [self.cores.get(v, 0) for v in range(num_vertices)]
+        valida = bool(self.cores) and all(melhores_cores[u] != melhores_cores[v]
+                                          for v in range(num_vertices) for u in vizinhos[v])
+        inicio_busca = inicio
+        if not valida:
+            cores, _ = _dsatur(self.grafo.vertices_ativos(), vizinhos)
+            melhores_cores = [max(cor, 0) for cor in cores]
+            inicio_busca = time.perf_counter()
+
+        num_cores = max((melhores_cores[v] for v in self.grafo.vertices_ativos()), default=-1) + 1
+        cores = melhores_cores[:]
+        k = num_cores - 1
+
+        while k >= limite_inferior and time.perf_counter() < prazo:
+            # conflitos com os vértices que já cabem em k cores
+            gama = [0] * (num_vertices * k)
+            fora = []
+            for v in range(num_vertices):
+                if cores[v] >= k:
+                    fora.append(v)
+                    cores[v] = -1
+            for v in range(num_vertices):
+                cor = cores[v]
+                if cor != -1:
+                    for u in vizinhos[v]:
+                        gama[u * k + cor] += 1
+
+            # a cor removida é redistribuída pela de menos conflitos
+            for v in fora:
+                base = v * k
+                linha = gama[base:base + k]
+                cor = linha.index(min(linha))
+                cores[v] = cor
+                for u in vizinhos[v]:
+                    gama[u * k + cor] += 1
+
+            # conjunto dos vértices em conflito, com remoção O(1)
+            em_conflito = []
+            posicao = [-1] * num_vertices
+            conflitos = 0
+            for v in range(num_vertices):
+                repetidos = gama[v * k + cores[v]]
+                if repetidos:
+                    posicao[v] = len(em_conflito)
+                    em_conflito.append(v)
+                    conflitos += repetidos
+            conflitos //= 2
+
+            tabu = [0] * (num_vertices * k)
+            menos_conflitos = conflitos
+            iteracao = 0
+
+            while conflitos and time.perf_counter() < prazo:
+                iteracao += 1
+
+                # melhor movimento não tabu (ou tabu que bata o melhor já visto)
+                melhor_delta = num_vertices
+                movimentos = []
+                for v in em_conflito:
+                    base = v * k
+                    cor_atual = cores[v]
+                    repetidos = gama[base + cor_atual]
+                    for cor in range(k):
+                        delta = gama[base + cor] - repetidos
+                        if delta <= melhor_delta and cor != cor_atual and (
+                                tabu[base + cor] < iteracao or conflitos + delta < menos_conflitos):
+                            if delta < melhor_delta:
+                                melhor_delta = delta
+                                movimentos = []
+                            movimentos.append((v, cor))
+
+                if movimentos:
+                    vertice, nova = aleatorio.choice(movimentos)
+                else:
+                    vertice = aleatorio.choice(em_conflito)
+                    nova = aleatorio.choice([c for c in range(k) if c != cores[vertice]])
+
+                # aplica o movimento em O(grau)
+                antiga = cores[vertice]
+                base = vertice * k
+                conflitos += gama[base + nova] - gama[base + antiga]
+                cores[vertice] = nova
+                tabu[base + antiga] = iteracao + int(0.6 * len(em_conflito)) + aleatorio.randrange(10)
+
+                for u in vizinhos[vertice] + [vertice]:
+                    base_u = u * k
+                    if u != vertice:
+                        gama[base_u + antiga] -= 1
+                        gama[base_u + nova] += 1
+
+                    if gama[base_u + cores[u]]:
+                        if posicao[u] == -1:
+                            posicao[u] = len(em_conflito)
+                            em_conflito.append(u)
+                    elif posicao[u] != -1:
+                        ultimo = em_conflito.pop()
+                        if ultimo != u:
+                            em_conflito[posicao[u]] = ultimo
+                            posicao[ultimo] = posicao[u]
+                        posicao[u] = -1
+
+                if conflitos < menos_conflitos:
+                    menos_conflitos = conflitos
+
+            if conflitos:
+                break
+
+            melhores_cores = cores[:]
+            num_cores = k
+            if ao_melhorar is not None:
+                ao_melhorar(num_cores, time.perf_counter() - inicio_busca)
+            k -= 1
+
+        self.tempo_execucao = time.perf_counter() - inicio
+
+        self.cores = {v: melhores_cores[v] for v in self.grafo.vertices_ativos()}
 
         return num_cores
 
     # heuristica gulosa 
     # o algoritmo faz escolhas locais (a menor cor disponível para cada vértice) sem seguir um critério específico de ordenação dos vértices
     def heuristica_simples(self):
-        inicio = time.time()
-
-        vertices = list(range(len(self.grafo.labels)))
-
-        cores = [-1] * len(vertices)
-        num_cores = 0
-
-        for vertice in vertices:
-            cor_disponivel = set(range(len(vertices)))
+        inicio = time.perf_counter()
 
-            for vizinho in self.grafo.retornar_vizinhos(vertice):
-                if cores[vizinho] != -1:
-                    cor_disponivel.discard(cores[vizinho])
+        vizinhos = [self.grafo.retornar_vizinhos(v) for v in range(len(self.grafo.labels))]
+        vertices = self.grafo.vertices_ativos()
 
-            cores[vertice] = min(cor_disponivel)
-            num_cores = max(num_cores, cores[vertice] + 1)
+        cores, num_cores = _colorir_em_ordem(vertices, vizinhos)
 
-        self.tempo_execucao = time.time() - inicio
+        self.tempo_execucao = time.perf_counter() - inicio
 
-        self.cores = {vertices[i]: cores[i] for i in range(len(vertices))}
+        self.cores = {v: cores[v] for v in vertices}
 
         return num_cores
 
@@ -0,0 +1,146 @@
+"""
+Componentes conexas, componentes fortemente conexas e ordenação topológica em tempo
+linear, sem recursão, sobre qualquer Grafo (só usam labels,
+vertices_ativos e retornar_vizinhos)
+"""
+
+from collections import deque
+
+
+def _exigir_direcionado(grafo, operacao: str) -> None:
+    if not grafo.direcionado:
+        raise ValueError(f"{operacao} só se aplica a grafos direcionados")
+
+
+def rotular_componentes(grafo) -> tuple:
+    """
+    Componente de cada vértice por BFS: retorna (rotulos, num_componentes), com as
+    componentes numeradas pela ordem do seu menor vértice. Em grafos direcionados as
+    arestas são tomadas sem direção (componentes fracamente conexas). Vértices
+    removidos ficam com rótulo -1 e não contam como componente.
+    """
+    num_vertices = len(grafo.labels)
+    vizinhos = [grafo.retornar_vizinhos(v) for v in range(num_vertices)]
+    if grafo.direcionado:
+        saida = vizinhos
+        vizinhos = [list(lista) for lista in saida]
+        for v, lista in enumerate(saida):
+            for w in lista:
+                vizinhos[w].append(v)
+
+    rotulos = [-1] * num_vertices
+    num_componentes = 0
+    for raiz in grafo.vertices_ativos():
+        if rotulos[raiz] != -1:
+            continue
+
+        rotulos[raiz] = num_componentes
+        fila = deque([raiz])
+        while fila:
+            v = fila.popleft()
+            for w in vizinhos[v]:
+                if rotulos[w] == -1:
+                    rotulos[w] = num_componentes
+                    fila.append(w)
+        num_componentes += 1
+
+    return rotulos, num_componentes
+
+
+def componentes_conexas(grafo) -> list:
+    """Vértices de cada componente conexa, em ordem crescente"""
+    rotulos, num_componentes = rotular_componentes(grafo)
+    componentes = [[] for _ in range(num_componentes)]
+    for v, rotulo in enumerate(rotulos):
+        if rotulo != -1:
+            componentes[rotulo].append(v)
+    return componentes
+
+
+def componentes_fortemente_conexas(grafo) -> list:
+    """
+    Componentes fortemente conexas pelo algoritmo de Tarjan, com uma pilha explícita de
+    iteradores de vizinhos no lugar da recursão. As componentes saem em ordem topológica
+    do grafo condensado: nenhuma aresta vai de uma componente para uma anterior.
+    """
+    _exigir_direcionado(grafo, "Componentes fortemente conexas")
+    num_vertices = len(grafo.labels)
+    indice = [-1] * num_vertices
+    menor = [0] * num_vertices  # menor índice alcançável ainda na pilha (low-link)
+    na_pilha = [False] * num_vertices
+    pilha = []
+    componentes = []
+    contador = 0
+
+    for raiz in grafo.vertices_ativos():
+        if indice[raiz] != -1:
+            continue
+
+        indice[raiz] = menor[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        na_pilha[raiz] = True
+        chamadas = [(raiz, iter(grafo.retornar_vizinhos(raiz)))]
+
+        while chamadas:
+            v, vizinhos = chamadas[-1]
+            for w in vizinhos:
+                if indice[w] == -1:
+                    indice[w] = menor[w] = contador
+                    contador += 1
+                    pilha.append(w)
+                    na_pilha[w] = True
+                    chamadas.append((w, iter(grafo.retornar_vizinhos(w))))
+                    break
+                if na_pilha[w] and indice[w] < menor[v]:
+                    menor[v] = indice[w]
+            else:
+                # v terminou: repassa o low-link ao pai e fecha a componente se v é a raiz dela
+                chamadas.pop()
+                if chamadas:
+                    pai = chamadas[-1][0]
+                    if menor[v] < menor[pai]:
+                        menor[pai] = menor[v]
+
+                if menor[v] == indice[v]:
+                    componente = []
+                    while True:
+                        w = pilha.pop()
+                        na_pilha[w] = False
+                        componente.append(w)
+                        if w == v:
+                            break
+                    componentes.append(componente)
+
+    # o Tarjan fecha as componentes em ordem topológica reversa
+    componentes.reverse()
+    return componentes
+
+
+def ordenacao_topologica(grafo) -> list:
+    """
+    Ordem topológica pelo algoritmo de Kahn (vértices sem arestas de entrada pendentes
+    saem primeiro, em ordem de índice). Levanta ValueError se o grafo tem ciclo.
+    """
+    _exigir_direcionado(grafo, "Ordenação topológica")
+    num_vertices = len(grafo.labels)
+    vizinhos = [grafo.retornar_vizinhos(v) for v in range(num_vertices)]
+
+    grau_entrada = [0] * num_vertices
+    for lista in vizinhos:
+        for w in lista:
+            grau_entrada[w] += 1
+
+    fila = deque(v for v in grafo.vertices_ativos() if grau_entrada[v] == 0)
+    ordem = []
+    while fila:
+        v = fila.popleft()
+        ordem.append(v)
+        for w in vizinhos[v]:
+            grau_entrada[w] -= 1
+            if grau_entrada[w] == 0:
+                fila.append(w)
+
+    if len(ordem) < grafo.num_vertices_ativos():
+        raise ValueError("Grafo possui ciclo, não há ordenação topológica")
+    return ordem
@@ -0,0 +1,191 @@
+"""
+Caminhos mínimos de origem única por delta-stepping, com as relaxações de cada
+balde distribuídas entre processos
+"""
+
+import os
+import multiprocessing
+from array import array
+
+from dijkstra import Caminhos
+from grafo_csr import csr_compartilhado, visao_nativa
+
+# abaixo disso, relaxar no próprio processo sai mais barato que despachar para o pool
+VERTICES_POR_TAREFA_DELTA = 256
+
+
+# grafo e distâncias de cada processo (definidos pelo inicializador do pool)
+_ESTADO_DELTA = None
+
+
+def _inicializar_delta_stepping(offsets, destinos, pesos, fim_leves, distancias):
+    global _ESTADO_DELTA
+    if offsets is None:
+        _ESTADO_DELTA = None
+        return
+    _ESTADO_DELTA = tuple(map(visao_nativa, (offsets, destinos, pesos, fim_leves, distancias)))
+
+
+def _separar_leves(tarefa):
+    """
+    Reordena a vizinhança de cada vértice do intervalo com as arestas leves (peso <= delta)
+    primeiro; fim_leves[v] marca onde elas terminam
+    """
+    inicio, fim, delta = tarefa
+    offsets, destinos, pesos, fim_leves, _ = _ESTADO_DELTA
+
+    for vertice in range(inicio, fim):
+        a, b = offsets[vertice], offsets[vertice + 1]
+        arestas = list(zip(destinos[a:b].tolist(), pesos[a:b].tolist()))
+        leves = [aresta for aresta in arestas if aresta[1] <= delta]
+        pesadas = [aresta for aresta in arestas if aresta[1] > delta]
+        ordenadas = leves + pesadas
+        destinos[a:b] = array('i', [destino for destino, _ in ordenadas])
+        pesos[a:b] = array('d', [peso for _, peso in ordenadas])
+        fim_leves[vertice] = a + len(leves)
+
+
+def _relaxar(tarefa):
+    """
+    Gera as requisições de relaxação das arestas leves (ou pesadas) dos vértices dados,
+    já descartando as que não melhoram a distância atual e ficando só com a melhor por
+    destino. Retorna (destinos, distâncias, anteriores).
+    """
+    vertices, leves = tarefa
+    offsets, destinos, pesos, fim_leves, distancias = _ESTADO_DELTA
+
+    melhores = {}
+    for vertice in vertices:
+        distancia_vertice = distancias[vertice]
+        if leves:
+            a, b = offsets[vertice], fim_leves[vertice]
+        else:
+            a, b = fim_leves[vertice], offsets[vertice + 1]
+
+        for i in range(a, b):
+            vizinho = destinos[i]
+            distancia = distancia_vertice + pesos[i]
+            if distancia < distancias[vizinho]:
+                atual = melhores.get(vizinho)
+                if atual is None or distancia < atual[0]:
+                    melhores[vizinho] = (distancia, vertice)
+
+    alvos = array('i', melhores)
+    return alvos, array('d', [melhores[v][0] for v in alvos]), array('i', [melhores[v][1] for v in alvos])
+
+
+def _delta(maior_peso, num_arestas: int, num_vertices: int) -> float:
+    grau_medio = num_arestas / num_vertices if num_vertices else 1
+    return max(1.0, maior_peso / max(grau_medio, 1))
+
+
+def delta_padrao(grafo) -> float:
+    """Peso máximo dividido pelo grau médio, como sugerido por Meyer e Sanders, e no mínimo 1"""
+    maior_peso = 0
+    num_arestas = 0
+    for vertice in range(len(grafo.labels)):
+        pesos = [peso for _, peso in grafo.retornar_vizinhos_ponderados(vertice)]
+        maior_peso = max(maior_peso, max(pesos, default=0))
+        num_arestas += len(pesos)
+
+    return _delta(maior_peso, num_arestas, len(grafo.labels))
+
+
+def delta_stepping(grafo, inicio: int, delta: float = None, num_processos: int = None):
+    """
+    Menores distâncias a partir de inicio por delta-stepping (Meyer e Sanders).
+
+    Os vértices ficam em baldes de largura delta pela distância provisória. O menor
+    balde não vazio é esvaziado relaxando as arestas leves (peso <= delta) de seus
+    vértices, que podem voltar ao mesmo balde, até ele ficar vazio; depois as arestas
+    pesadas de todos os vértices que passaram por ele são relaxadas de uma vez. Cada
+    lote de relaxações é dividido entre num_processos processos (padrão: número de
+    CPUs), que leem o grafo e as distâncias em memória compartilhada e devolvem só as
+    requisições que melhoram alguma distância; o processo principal as aplica.
+
+    delta grande aproxima Bellman-Ford (poucos baldes, mais retrabalho); delta pequeno
+    aproxima Dijkstra (muitos baldes pequenos, pouco paralelismo). Padrão: delta_padrao.
+    Pesos devem ser não negativos. Retorna (distancias, caminhos) como o dijkstra,
+    com as distâncias em float.
+    """
+    grafo.exigir_vertice_ativo(inicio)
+    num_vertices = len(grafo.labels)
+    offsets, destinos, pesos = csr_compartilhado(grafo, com_pesos=True)
+
+    if delta is None:
+        delta = _delta(max(visao_nativa(pesos), default=0), len(destinos), num_vertices)
+    if delta <= 0:
+        raise ValueError(f"Delta deve ser positivo: {delta}")
+
+    if num_processos is None:
+        num_processos = os.cpu_count() or 1
+    num_processos = max(1, num_processos)
+    fim_leves = multiprocessing.RawArray('q', num_vertices)
+    distancias_compartilhadas = multiprocessing.RawArray('d', num_vertices)
+    distancias = visao_nativa(distancias_compartilhadas)
+    distancias[:] = array('d', [float('inf')]) * num_vertices
+    anteriores = [None] * num_vertices
+
+    dados = (offsets, destinos, pesos, fim_leves, distancias_compartilhadas)
+    pool = None
+    if num_processos > 1:
+        pool = multiprocessing.Pool(num_processos, initializer=_inicializar_delta_stepping, initargs=dados)
+    _inicializar_delta_stepping(*dados)
+
+    def em_paralelo(funcao, tarefas):
+        if pool is None or len(tarefas) == 1:
+            return [funcao(tarefa) for tarefa in tarefas]
+        return pool.map(funcao, tarefas)
+
+    baldes = {}
+
+    def aplicar(resultados):
+        for alvos, novas_distancias, novos_anteriores in resultados:
+            for vizinho, distancia, anterior in zip(alvos, novas_distancias, novos_anteriores):
+                antiga = distancias[vizinho]
+                if distancia >= antiga:
+                    continue
+
+                if antiga != float('inf'):
+                    balde = baldes.get(int(antiga // delta))
+                    if balde is not None:
+                        balde.discard(vizinho)
+                distancias[vizinho] = distancia
+                anteriores[vizinho] = anterior
+                baldes.setdefault(int(distancia // delta), set()).add(vizinho)
+
+    def relaxar(vertices, leves):
+        vertices = array('i', vertices)
+        tamanho = max(VERTICES_POR_TAREFA_DELTA, -(-len(vertices) // num_processos))
+        aplicar(em_paralelo(_relaxar, [(vertices[i:i + tamanho], leves)
+                                       for i in range(0, len(vertices), tamanho)]))
+
+    try:
+        blocos = -(-num_vertices // num_processos) if num_vertices else 1
+        em_paralelo(_separar_leves, [(i, min(i + blocos, num_vertices), delta)
+                                     for i in range(0, num_vertices, blocos)])
+
+        distancias[inicio] = 0.0
+        baldes[0] = {inicio}
+
+        while baldes:
+            indice = min(baldes)
+            processados = set()
+
+            # fase leve: o balde pode ser reabastecido pelas próprias relaxações
+            while baldes.get(indice):
+                vertices = baldes.pop(indice)
+                processados |= vertices
+                relaxar(vertices, leves=True)
+            baldes.pop(indice, None)
+
+            # fase pesada: arestas pesadas nunca caem no balde atual
+            relaxar(processados, leves=False)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        _inicializar_delta_stepping(None, None, None, None, None)
+
+    distancias = distancias.tolist()
+    return distancias, Caminhos(distancias, anteriores)
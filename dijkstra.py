@@ -1,46 +1,264 @@
-def dijkstra(grafo, inicio: int):
-    num_vertices = len(grafo.labels)
+import heapq
+import random
+
+
+class Caminhos:
+    """
+    Sequência de (destino, distância, caminho) para todos os vértices, como a lista
+    que o dijkstra montava antes, mas cada caminho só é reconstruído quando acessado.
+    """
+
+    def __init__(self, distancias: list, anteriores: list, fixados: int = 0):
+        self.distancias = distancias
+        self.anteriores = anteriores
+        self.fixados = fixados  # vértices fixados pela busca
+
+    def __len__(self):
+        return len(self.distancias)
+
+    def __getitem__(self, destino: int) -> tuple:
+        if destino < 0:
+            destino += len(self)
+        if not 0 <= destino < len(self):
+            raise IndexError(destino)
+
+        if self.distancias[destino] == float('inf'):
+            return (destino, "Inacessível", [])
+        return (destino, self.distancias[destino], self.caminho(destino))
+
+    def __iter__(self):
+        return (self[destino] for destino in range(len(self)))
+
+    def caminho(self, destino: int) -> list:
+        """Vértices do início até o destino (lista vazia se inacessível)"""
+        if self.distancias[destino] == float('inf'):
+            return []
+
+        caminho = []
+        atual = destino
+        while atual is not None:
+            caminho.append(atual)
+            atual = self.anteriores[atual]
+        caminho.reverse()
+        return caminho
+
+
+def _busca(vizinhos_ponderados, num_vertices: int, inicio: int, destino: int = None, heuristica=None):
+    """
+    Núcleo do Dijkstra e do A*: heap binário com remoção preguiçosa (entradas
+    desatualizadas ficam no heap e são descartadas ao sair). Com heuristica(v)
+    consistente, a chave de v é distância + heuristica(v) e cada vértice ainda é
+    fixado uma única vez. Retorna (distancias, anteriores, número de vértices fixados).
+    """
     distancias = [float('inf')] * num_vertices
     anteriores = [None] * num_vertices
     distancias[inicio] = 0
     visitados = [False] * num_vertices
+    fixados = 0
 
-    for _ in range(num_vertices):
-        menor_distancia = float('inf')
-        vertice_atual = None
-
-        for vertice in range(num_vertices):
-            if not visitados[vertice] and distancias[vertice] < menor_distancia:
-                menor_distancia = distancias[vertice]
-                vertice_atual = vertice
-
-        if vertice_atual is None:  
-            break
+    heap = [(heuristica(inicio) if heuristica else 0, inicio)]
+    while heap:
+        _, vertice_atual = heapq.heappop(heap)
+        if visitados[vertice_atual]:
+            continue
 
         visitados[vertice_atual] = True
+        fixados += 1
+        if vertice_atual == destino:
+            break
 
-        for vizinho in grafo.retornar_vizinhos(vertice_atual):
-            peso = grafo.peso_aresta(vertice_atual, vizinho)
-            distancia = distancias[vertice_atual] + peso
+        distancia_atual = distancias[vertice_atual]
+        for vizinho, peso in vizinhos_ponderados(vertice_atual):
+            distancia = distancia_atual + peso
 
             if distancia < distancias[vizinho]:
                 distancias[vizinho] = distancia
                 anteriores[vizinho] = vertice_atual
+                chave = distancia + heuristica(vizinho) if heuristica else distancia
+                heapq.heappush(heap, (chave, vizinho))
+
+    return distancias, anteriores, fixados
+
+
+def dijkstra(grafo, inicio: int, destino: int = None):
+    """
+    Menores distâncias a partir de inicio, com heap binário e remoção preguiçosa:
+    entradas desatualizadas ficam no heap e são descartadas ao sair. O(E log V).
+
+    Se destino for informado, para assim que ele é fixado; nesse caso só as
+    distâncias dos vértices fixados antes dele são finais.
+    """
+    grafo.exigir_vertice_ativo(inicio)
+    distancias, anteriores, fixados = _busca(
+        grafo.retornar_vizinhos_ponderados, len(grafo.labels), inicio, destino)
+
+    return distancias, Caminhos(distancias, anteriores, fixados)
+
+
+def adjacencia_reversa(grafo) -> list:
+    """Para cada vértice, os pares (origem, peso) das arestas que chegam nele"""
+    reversa = [[] for _ in range(len(grafo.labels))]
+    for origem in range(len(grafo.labels)):
+        for destino, peso in grafo.retornar_vizinhos_ponderados(origem):
+            reversa[destino].append((origem, peso))
+    return reversa
 
-    caminhos = []
-    for destino in range(num_vertices):
-        if distancias[destino] == float('inf'):
-            caminhos.append((destino, "Inacessível", []))
+
+def dijkstra_bidirecional(grafo, inicio: int, destino: int, reversa: list = None) -> tuple:
+    """
+    Caminho mínimo de inicio a destino com duas buscas simultâneas, uma a partir de
+    cada ponta, expandindo sempre a que tem o menor topo de heap (a que avançou menos
+    em distância). Para quando a soma dos topos dos dois heaps não pode mais melhorar
+    o melhor caminho já ligado pelas buscas.
+
+    Em grafos direcionados a busca de trás percorre as arestas invertidas; a
+    adjacência reversa pode ser passada em reversa para ser reaproveitada entre
+    consultas. Retorna (distância, caminho, número de vértices fixados).
+    """
+    grafo.exigir_vertice_ativo(inicio)
+    grafo.exigir_vertice_ativo(destino)
+    if not grafo.direcionado:
+        vizinhos_tras = grafo.retornar_vizinhos_ponderados
+    else:
+        if reversa is None:
+            reversa = adjacencia_reversa(grafo)
+        vizinhos_tras = reversa.__getitem__
+
+    num_vertices = len(grafo.labels)
+    # índice 0: busca a partir do início; índice 1: busca a partir do destino
+    distancias = ([float('inf')] * num_vertices, [float('inf')] * num_vertices)
+    anteriores = ([None] * num_vertices, [None] * num_vertices)
+    visitados = ([False] * num_vertices, [False] * num_vertices)
+    heaps = ([(0, inicio)], [(0, destino)])
+    vizinhos = (grafo.retornar_vizinhos_ponderados, vizinhos_tras)
+    distancias[0][inicio] = 0
+    distancias[1][destino] = 0
+
+    melhor = 0 if inicio == destino else float('inf')
+    encontro = inicio if inicio == destino else None
+    fixados = 0
+
+    while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < melhor:
+        lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        _, vertice_atual = heapq.heappop(heaps[lado])
+        if visitados[lado][vertice_atual]:
             continue
 
-        caminho = []
-        atual = destino
-        while atual is not None:
-            caminho.append(atual)
-            atual = anteriores[atual]
-        caminhos.append((destino, distancias[destino], list(reversed(caminho))))
+        visitados[lado][vertice_atual] = True
+        fixados += 1
+
+        distancias_lado, outras = distancias[lado], distancias[1 - lado]
+        distancia_atual = distancias_lado[vertice_atual]
+        for vizinho, peso in vizinhos[lado](vertice_atual):
+            distancia = distancia_atual + peso
+
+            if distancia < distancias_lado[vizinho]:
+                distancias_lado[vizinho] = distancia
+                anteriores[lado][vizinho] = vertice_atual
+                heapq.heappush(heaps[lado], (distancia, vizinho))
+
+            # a aresta liga as duas buscas
+            if distancia + outras[vizinho] < melhor:
+                melhor = distancia + outras[vizinho]
+                encontro = vizinho
+
+    if encontro is None:
+        return "Inacessível", [], fixados
+
+    # início -> encontro pelos anteriores da ida, encontro -> destino pelos da volta
+    caminho = []
+    atual = encontro
+    while atual is not None:
+        caminho.append(atual)
+        atual = anteriores[0][atual]
+    caminho.reverse()
+    atual = anteriores[1][encontro]
+    while atual is not None:
+        caminho.append(atual)
+        atual = anteriores[1][atual]
+
+    return melhor, caminho, fixados
+
+
+def a_estrela(grafo, inicio: int, destino: int, heuristica=None) -> tuple:
+    """
+    A* de inicio a destino. heuristica(v, destino) deve ser um limite inferior
+    consistente da distância de v ao destino (por exemplo, Landmarks); sem ela o
+    A* é o próprio Dijkstra com parada no destino.
+    Retorna (distância, caminho, número de vértices fixados).
+    """
+    grafo.exigir_vertice_ativo(inicio)
+    grafo.exigir_vertice_ativo(destino)
+    h = (lambda vertice: heuristica(vertice, destino)) if heuristica else None
+    distancias, anteriores, fixados = _busca(
+        grafo.retornar_vizinhos_ponderados, len(grafo.labels), inicio, destino, h)
+
+    caminhos = Caminhos(distancias, anteriores, fixados)
+    if distancias[destino] == float('inf'):
+        return "Inacessível", [], fixados
+    return distancias[destino], caminhos.caminho(destino), fixados
+
+
+class Landmarks:
+    """
+    Heurística ALT para o A*: distâncias de (e, em grafos direcionados, até) alguns
+    vértices de referência, pré-calculadas com Dijkstra. Pela desigualdade
+    triangular, d(L, t) - d(L, v) e d(v, L) - d(t, L) são limites inferiores de d(v, t).
+    As referências são escolhidas uma a uma como o vértice mais distante das já escolhidas.
+    """
+
+    def __init__(self, grafo, num_landmarks: int = 4, semente=None):
+        num_vertices = len(grafo.labels)
+        ativos = grafo.vertices_ativos()
+        self.direcionado = grafo.direcionado
+        self.landmarks = []
+        self.de_landmark = []   # de_landmark[i][v] = d(L_i, v)
+        self.ate_landmark = []  # ate_landmark[i][v] = d(v, L_i), só em grafos direcionados
+        if not ativos:
+            return
+
+        reversa = adjacencia_reversa(grafo).__getitem__ if self.direcionado else None
+
+        # distância de cada vértice ao conjunto já escolhido (inalcançáveis ficam por último)
+        proximidade = [float('inf')] * num_vertices
+        landmark = ativos[random.Random(semente).randrange(len(ativos))]
+        for _ in range(min(num_landmarks, len(ativos))):
+            self.landmarks.append(landmark)
+            distancias, _, _ = _busca(grafo.retornar_vizinhos_ponderados, num_vertices, landmark)
+            self.de_landmark.append(distancias)
+            if self.direcionado:
+                self.ate_landmark.append(_busca(reversa, num_vertices, landmark)[0])
+
+            for v, distancia in enumerate(distancias):
+                if distancia < proximidade[v]:
+                    proximidade[v] = distancia
+            candidatos = [v for v in range(num_vertices)
+                          if proximidade[v] != float('inf') and v not in self.landmarks]
+            if not candidatos:
+                break
+            landmark = max(candidatos, key=proximidade.__getitem__)
+
+    def __call__(self, vertice: int, destino: int) -> float:
+        inf = float('inf')
+        limite = 0
+        for i, distancias in enumerate(self.de_landmark):
+            ate_destino, ate_vertice = distancias[destino], distancias[vertice]
+            if ate_vertice == inf:
+                continue
+            if ate_destino == inf:
+                # o landmark alcança v mas não o destino: v também não alcança o destino
+                return inf
+
+            limite = max(limite, ate_destino - ate_vertice)
+            if not self.direcionado:
+                limite = max(limite, ate_vertice - ate_destino)
+            else:
+                de_vertice, de_destino = self.ate_landmark[i][vertice], self.ate_landmark[i][destino]
+                if de_vertice != inf and de_destino != inf:
+                    limite = max(limite, de_vertice - de_destino)
+
+        return limite
 
-    return distancias, caminhos
 
 def print_dijkstra(distancias, caminhos):
     for destino, distancia, caminho in caminhos:
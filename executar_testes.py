@@ -2,6 +2,28 @@ import os
 from grafo_lista import GrafoLista
 from mst import MST
 from coloracao_grafos import ColoracaoGrafos
+from medicao import medir, iqrs_sobrepostos
+
+# orçamento (segundos) da busca tabu que refina a coloração do DSATUR em cada instância
+LIMITE_TABUCOL = 10
+
+# repetições de cada medição de tempo (mediana e IQR), depois das execuções de aquecimento
+REPETICOES_TEMPO = 7
+AQUECIMENTO_TEMPO = 1
+
+
+def medir_algoritmo(classe, grafo, metodo):
+    """
+    Tempo de classe(grafo).metodo() com medicao.medir, sempre sobre um objeto novo e
+    sem os caches que o grafo guarda entre execuções
+    """
+    return medir(lambda: getattr(classe(grafo), metodo)(), REPETICOES_TEMPO, AQUECIMENTO_TEMPO,
+                 preparar=grafo.descartar_caches)
+
+
+def formatar_tempo(medicao):
+    return f"{medicao['mediana_ns'] / 1e9:.6f}s (IQR {medicao['iqr_ns'] / 1e9:.6f}s)"
+
 
 def executar_testes_mst():
     """Executa testes de MST em todas as instâncias"""
@@ -31,24 +53,39 @@ def executar_testes_mst():
         print("\n--- Algoritmo de Kruskal ---")
         mst_kruskal = MST(grafo)
         peso_kruskal = mst_kruskal.kruskal()
+        medicao_kruskal = medir_algoritmo(MST, grafo, 'kruskal')
+        print(f"Variante: {mst_kruskal.variante}")
         print(f"Peso total: {peso_kruskal}")
-        print(f"Tempo: {mst_kruskal.tempo_execucao:.6f}s")
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao_kruskal)}")
         
         # Prim
         print("\n--- Algoritmo de Prim ---")
         mst_prim = MST(grafo)
         peso_prim = mst_prim.prim()
+        medicao_prim = medir_algoritmo(MST, grafo, 'prim')
+        print(f"Variante: {mst_prim.variante}")
         print(f"Peso total: {peso_prim}")
-        print(f"Tempo: {mst_prim.tempo_execucao:.6f}s")
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao_prim)}")
+        
+        # Borůvka
+        print("\n--- Algoritmo de Borůvka ---")
+        mst_boruvka = MST(grafo)
+        peso_boruvka = mst_boruvka.boruvka()
+        medicao_boruvka = medir_algoritmo(MST, grafo, 'boruvka')
+        print(f"Peso total: {peso_boruvka}")
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao_boruvka)}")
         
         resultados.append({
             'arquivo': arquivo,
             'vertices': len(grafo.labels),
             'arestas': sum(len(grafo.lista_adj[v]) for v in grafo.lista_adj) // 2,
             'peso_kruskal': peso_kruskal,
-            'tempo_kruskal': mst_kruskal.tempo_execucao,
+            'tempo_kruskal': medicao_kruskal,
             'peso_prim': peso_prim,
-            'tempo_prim': mst_prim.tempo_execucao
+            'tempo_prim': medicao_prim,
+            'variante_prim': mst_prim.variante,
+            'peso_boruvka': peso_boruvka,
+            'tempo_boruvka': medicao_boruvka
         })
     
     return resultados
@@ -89,27 +126,51 @@ def executar_testes_coloracao():
         coloracao_wp = ColoracaoGrafos(grafo)
         cores_wp = coloracao_wp.welsh_powell()
         print(f"Número de cores: {cores_wp}")
-        print(f"Tempo: {coloracao_wp.tempo_execucao:.6f}s")
+        medicao = medir_algoritmo(ColoracaoGrafos, grafo, 'welsh_powell')
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao)}")
         resultado_arquivo['cores_welsh_powell'] = cores_wp
-        resultado_arquivo['tempo_welsh_powell'] = coloracao_wp.tempo_execucao
+        resultado_arquivo['tempo_welsh_powell'] = medicao
         
         # DSATUR
         print("\n--- Algoritmo DSATUR ---")
         coloracao_dsatur = ColoracaoGrafos(grafo)
         cores_dsatur = coloracao_dsatur.dsatur()
         print(f"Número de cores: {cores_dsatur}")
-        print(f"Tempo: {coloracao_dsatur.tempo_execucao:.6f}s")
+        medicao = medir_algoritmo(ColoracaoGrafos, grafo, 'dsatur')
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao)}")
         resultado_arquivo['cores_dsatur'] = cores_dsatur
-        resultado_arquivo['tempo_dsatur'] = coloracao_dsatur.tempo_execucao
+        resultado_arquivo['tempo_dsatur'] = medicao
+        
+        # Jones-Plassmann (paralelo)
+        print("\n--- Algoritmo Jones-Plassmann (paralelo) ---")
+        coloracao_jp = ColoracaoGrafos(grafo)
+        cores_jp = coloracao_jp.jones_plassmann()
+        print(f"Número de cores: {cores_jp}")
+        print(f"Rodadas: {coloracao_jp.rodadas}")
+        medicao = medir_algoritmo(ColoracaoGrafos, grafo, 'jones_plassmann')
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao)}")
+        resultado_arquivo['cores_jones_plassmann'] = cores_jp
+        resultado_arquivo['tempo_jones_plassmann'] = medicao
         
         # Heurística Simples
         print("\n--- Heurística Simples ---")
         coloracao_simples = ColoracaoGrafos(grafo)
         cores_simples = coloracao_simples.heuristica_simples()
         print(f"Número de cores: {cores_simples}")
-        print(f"Tempo: {coloracao_simples.tempo_execucao:.6f}s")
+        medicao = medir_algoritmo(ColoracaoGrafos, grafo, 'heuristica_simples')
+        print(f"Tempo (mediana de {REPETICOES_TEMPO}): {formatar_tempo(medicao)}")
         resultado_arquivo['cores_heuristica_simples'] = cores_simples
-        resultado_arquivo['tempo_heuristica_simples'] = coloracao_simples.tempo_execucao
+        resultado_arquivo['tempo_heuristica_simples'] = medicao
+        
+        # Tabucol partindo da coloração do DSATUR
+        print(f"\n--- Tabucol sobre o DSATUR (limite de {LIMITE_TABUCOL}s) ---")
+        cores_tabucol = coloracao_dsatur.tabucol(
+            limite_tempo=LIMITE_TABUCOL,
+            ao_melhorar=lambda num_cores, segundos: print(f"  {num_cores} cores após {segundos:.2f}s"))
+        print(f"Número de cores: {cores_tabucol}")
+        print(f"Tempo: {coloracao_dsatur.tempo_execucao:.6f}s")
+        resultado_arquivo['cores_tabucol'] = cores_tabucol
+        resultado_arquivo['tempo_tabucol'] = coloracao_dsatur.tempo_execucao
         
         resultados.append(resultado_arquivo)
     
@@ -135,20 +196,25 @@ def gerar_relatorio(resultados_mst, resultados_coloracao):
             f.write(f"  - Arestas: {resultado['arestas']}\n")
             f.write(f"\n  Algoritmo de Kruskal:\n")
             f.write(f"    • Peso total da MST: {resultado['peso_kruskal']}\n")
-            f.write(f"    • Tempo de execução: {resultado['tempo_kruskal']:.6f} segundos\n")
-            f.write(f"\n  Algoritmo de Prim:\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_kruskal'])}\n")
+            f.write(f"\n  Algoritmo de Prim (variante: {resultado['variante_prim']}):\n")
             f.write(f"    • Peso total da MST: {resultado['peso_prim']}\n")
-            f.write(f"    • Tempo de execução: {resultado['tempo_prim']:.6f} segundos\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_prim'])}\n")
+            f.write(f"\n  Algoritmo de Borůvka:\n")
+            f.write(f"    • Peso total da MST: {resultado['peso_boruvka']}\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_boruvka'])}\n")
             f.write("\n" + "-" * 100 + "\n\n")
         
         # Tabela resumo MST
         f.write("\nTABELA RESUMO - MST (Kruskal)\n")
         f.write("-" * 100 + "\n")
-        f.write(f"{'Instância':<40} {'Vértices':>10} {'Arestas':>10} {'Peso Total':>15} {'Tempo (s)':>12}\n")
+        f.write(f"{'Instância':<40} {'Vértices':>10} {'Arestas':>10} {'Peso Total':>15} {'Mediana (s)':>12} "
+                f"{'IQR (s)':>10}\n")
         f.write("-" * 100 + "\n")
         for r in resultados_mst:
             f.write(f"{r['arquivo']:<40} {r['vertices']:>10} {r['arestas']:>10} "
-                   f"{r['peso_kruskal']:>15} {r['tempo_kruskal']:>12.6f}\n")
+                   f"{r['peso_kruskal']:>15} {r['tempo_kruskal']['mediana_ns'] / 1e9:>12.6f} "
+                   f"{r['tempo_kruskal']['iqr_ns'] / 1e9:>10.6f}\n")
         f.write("-" * 100 + "\n\n")
         
         # Relatório Coloração
@@ -161,41 +227,49 @@ def gerar_relatorio(resultados_mst, resultados_coloracao):
             f.write(f"  - Arestas: {resultado['arestas']}\n")
             f.write(f"\n  Algoritmo Welsh-Powell:\n")
             f.write(f"    • Número de cores: {resultado['cores_welsh_powell']}\n")
-            f.write(f"    • Tempo de execução: {resultado['tempo_welsh_powell']:.6f} segundos\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_welsh_powell'])}\n")
             f.write(f"\n  Algoritmo DSATUR:\n")
             f.write(f"    • Número de cores: {resultado['cores_dsatur']}\n")
-            f.write(f"    • Tempo de execução: {resultado['tempo_dsatur']:.6f} segundos\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_dsatur'])}\n")
+            f.write(f"\n  Algoritmo Jones-Plassmann (paralelo):\n")
+            f.write(f"    • Número de cores: {resultado['cores_jones_plassmann']}\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_jones_plassmann'])}\n")
             f.write(f"\n  Heurística Simples:\n")
             f.write(f"    • Número de cores: {resultado['cores_heuristica_simples']}\n")
-            f.write(f"    • Tempo de execução: {resultado['tempo_heuristica_simples']:.6f} segundos\n")
+            f.write(f"    • Tempo de execução: {formatar_tempo(resultado['tempo_heuristica_simples'])}\n")
+            f.write(f"\n  Tabucol (a partir do DSATUR):\n")
+            f.write(f"    • Número de cores: {resultado['cores_tabucol']}\n")
+            f.write(f"    • Tempo de execução: {resultado['tempo_tabucol']:.6f} segundos\n")
             f.write("\n" + "-" * 100 + "\n\n")
         
         # Tabela resumo Coloração
         f.write("\nTABELA RESUMO - COLORAÇÃO\n")
-        f.write("-" * 130 + "\n")
+        f.write("-" * 158 + "\n")
         f.write(f"{'Instância':<30} {'Vértices':>10} {'Arestas':>10} "
-               f"{'Welsh-Powell':>15} {'DSATUR':>10} {'Heur. Simples':>15} {'Melhor':>10}\n")
-        f.write("-" * 130 + "\n")
+               f"{'Welsh-Powell':>15} {'DSATUR':>10} {'Jones-Plassmann':>17} {'Heur. Simples':>15} "
+               f"{'Tabucol':>10} {'Melhor':>10}\n")
+        f.write("-" * 158 + "\n")
         for r in resultados_coloracao:
-            melhor = min(r['cores_welsh_powell'], r['cores_dsatur'], r['cores_heuristica_simples'])
+            melhor = min(r['cores_welsh_powell'], r['cores_dsatur'], r['cores_jones_plassmann'],
+                         r['cores_heuristica_simples'], r['cores_tabucol'])
             f.write(f"{r['arquivo']:<30} {r['vertices']:>10} {r['arestas']:>10} "
-                   f"{r['cores_welsh_powell']:>15} {r['cores_dsatur']:>10} "
-                   f"{r['cores_heuristica_simples']:>15} {melhor:>10}\n")
-        f.write("-" * 130 + "\n\n")
+                   f"{r['cores_welsh_powell']:>15} {r['cores_dsatur']:>10} {r['cores_jones_plassmann']:>17} "
+                   f"{r['cores_heuristica_simples']:>15} {r['cores_tabucol']:>10} {melhor:>10}\n")
+        f.write("-" * 158 + "\n\n")
         
         # Análise comparativa
         f.write("\n\n3. ANÁLISE COMPARATIVA\n")
         f.write("=" * 100 + "\n\n")
         
-        f.write("3.1. MST - Kruskal vs Prim\n")
+        f.write("3.1. MST - Kruskal vs Prim (medianas; sem vencedor quando os IQRs se sobrepõem)\n")
         f.write("-" * 100 + "\n")
         for r in resultados_mst:
-            if r['tempo_kruskal'] < r['tempo_prim']:
-                mais_rapido = "Kruskal"
-                diferenca = r['tempo_prim'] - r['tempo_kruskal']
-            else:
-                mais_rapido = "Prim"
-                diferenca = r['tempo_kruskal'] - r['tempo_prim']
+            kruskal, prim = r['tempo_kruskal'], r['tempo_prim']
+            if iqrs_sobrepostos(kruskal, prim):
+                f.write(f"{r['arquivo']:<40} Empate: diferença dentro do ruído da medição\n")
+                continue
+            mais_rapido = "Kruskal" if kruskal['mediana_ns'] < prim['mediana_ns'] else "Prim"
+            diferenca = abs(kruskal['mediana_ns'] - prim['mediana_ns']) / 1e9
             f.write(f"{r['arquivo']:<40} Mais rápido: {mais_rapido:>8} (diferença: {diferenca:.6f}s)\n")
         
         f.write("\n\n3.2. Coloração - Comparação de Algoritmos\n")
@@ -204,7 +278,9 @@ def gerar_relatorio(resultados_mst, resultados_coloracao):
             cores = {
                 'Welsh-Powell': r['cores_welsh_powell'],
                 'DSATUR': r['cores_dsatur'],
-                'Heurística Simples': r['cores_heuristica_simples']
+                'Jones-Plassmann': r['cores_jones_plassmann'],
+                'Heurística Simples': r['cores_heuristica_simples'],
+                'Tabucol': r['cores_tabucol']
             }
             melhor_alg = min(cores, key=cores.get)
             f.write(f"{r['arquivo']:<30} Melhor resultado: {melhor_alg:>20} ({cores[melhor_alg]} cores)\n")
@@ -1,9 +1,44 @@
+from leitura_instancias import ler_instancia, ler_instancia_csr
+
+# fração de índices ocupados por vértices removidos a partir da qual o grafo se compacta sozinho
+LIMIAR_COMPACTACAO = 0.5
+
+
 class Grafo:
+    # o que inserir_aresta faz com uma aresta que já existe: 'permitir' cria uma paralela,
+    # 'ignorar' mantém a existente e 'substituir' troca o peso (ver GrafoLista)
+    arestas_paralelas = 'permitir'
+
     def __init__(self, direcionado: bool, ponderado: bool):
         self.direcionado = direcionado
         self.ponderado = ponderado
 
-    def ler_arquivo(self, nome_arquivo: str) -> None:
+        # lista (peso, origem, destino) de arestas únicas, montada sob demanda pelo MST,
+        # e se o Kruskal já a deixou ordenada
+        self._arestas_canonicas = None
+        self._arestas_ordenadas = False
+
+        # vértices removidos continuam ocupando o índice, com label None, até compactar()
+        self._removidos = 0
+
+    def ler_arquivo(self, nome_arquivo: str, usar_cache: bool = True) -> None:
+        self._arestas_canonicas = None
+
+        if not usar_cache:
+            num_vertices, self.direcionado, self.ponderado, origens, destinos, pesos = ler_instancia(nome_arquivo)
+
+            self._inserir_vertices_em_lote([str(i) for i in range(num_vertices)])
+            self._inserir_arestas_em_lote(origens, destinos, pesos)
+            return
+
+        # cache binário em CSR, regravado sempre que o arquivo de texto muda
+        num_vertices, self.direcionado, self.ponderado, offsets, destinos, pesos = ler_instancia_csr(nome_arquivo)
+
+        self._inserir_vertices_em_lote([str(i) for i in range(num_vertices)])
+        self._carregar_csr(offsets, destinos, pesos)
+
+    def ler_arquivo_sequencial(self, nome_arquivo: str) -> None:
+        """Leitura linha a linha, uma chamada de inserir_aresta por aresta (referência para benchmarks)"""
         with open(nome_arquivo, 'r') as arquivo:
             primeira_linha = arquivo.readline().strip().split()
             num_vertices = int(primeira_linha[0])
@@ -27,12 +62,86 @@ class Grafo:
 
                 self.inserir_aresta(origem, destino, peso)
 
+    def _inserir_vertices_em_lote(self, labels: list) -> None:
+        for label in labels:
+            self.inserir_vertice(label)
+
+    def _inserir_arestas_em_lote(self, origens: list, destinos: list, pesos: list) -> None:
+        for origem, destino, peso in zip(origens, destinos, pesos):
+            self.inserir_aresta(origem, destino, peso)
+
+    def _carregar_csr(self, offsets, destinos, pesos) -> None:
+        """Insere as arestas de uma instância em CSR (ver leitura_instancias.montar_csr)"""
+        origens_lote, destinos_lote, pesos_lote = [], [], []
+        for origem in range(len(offsets) - 1):
+            lacos = 0
+            for i in range(offsets[origem], offsets[origem + 1]):
+                destino = destinos[i]
+                # em grafos não direcionados cada aresta aparece nas duas linhas (laços duas vezes na mesma)
+                if not self.direcionado:
+                    if destino < origem:
+                        continue
+                    if destino == origem:
+                        lacos += 1
+                        if lacos % 2 == 0:
+                            continue
+                origens_lote.append(origem)
+                destinos_lote.append(destino)
+                pesos_lote.append(pesos[i])
+
+        self._inserir_arestas_em_lote(origens_lote, destinos_lote, pesos_lote)
+
     def inserir_vertice(self, label: str) -> bool:
         return
 
     def remover_vertice(self, label: str) -> bool:
         return
 
+    def compactar(self) -> list:
+        """
+        Descarta os vértices removidos e renumera os restantes em uma única passada.
+        Retorna o novo índice de cada índice antigo (-1 para os removidos).
+        """
+        return list(range(len(self.labels)))
+
+    def _compactar_se_necessario(self) -> None:
+        if self._removidos > LIMIAR_COMPACTACAO * len(self.labels):
+            self.compactar()
+
+    def descartar_caches(self) -> None:
+        """Descarta as estruturas derivadas guardadas no grafo, que voltam a ser montadas sob demanda"""
+        self._arestas_canonicas = None
+        self._arestas_ordenadas = False
+
+    def vertices_ativos(self):
+        """Índices dos vértices não removidos, em ordem crescente"""
+        if not self._removidos:
+            return range(len(self.labels))
+        return [v for v, label in enumerate(self.labels) if label is not None]
+
+    def num_vertices_ativos(self) -> int:
+        return len(self.labels) - self._removidos
+
+    def vertice_ativo(self, vertice: int) -> bool:
+        return 0 <= vertice < len(self.labels) and self.labels[vertice] is not None
+
+    def exigir_vertice_ativo(self, vertice: int) -> None:
+        """Levanta ValueError se o vértice não existe ou foi removido (nenhuma busca parte dele)"""
+        if not self.vertice_ativo(vertice):
+            raise ValueError(f"Vértice inexistente ou removido: {vertice}")
+
+    def _novos_indices(self) -> tuple:
+        """(novo índice de cada índice antigo, labels restantes) para compactar()"""
+        novos = []
+        labels = []
+        for label in self.labels:
+            if label is None:
+                novos.append(-1)
+            else:
+                novos.append(len(labels))
+                labels.append(label)
+        return novos, labels
+
     def label_vertice(self, indice: int) -> str:
         return
 
@@ -53,3 +162,15 @@ class Grafo:
 
     def retornar_vizinhos(self, vertice: int) -> list:
         return
+
+    def retornar_vizinhos_ponderados(self, vertice: int) -> list:
+        """Pares (destino, peso) das arestas que saem do vértice"""
+        return [(vizinho, self.peso_aresta(vertice, vizinho)) for vizinho in self.retornar_vizinhos(vertice)]
+
+    def existem_arestas(self, pares) -> list:
+        """existe_aresta para cada par (origem, destino), na mesma ordem"""
+        return [self.existe_aresta(origem, destino) for origem, destino in pares]
+
+    def pesos_arestas(self, pares) -> list:
+        """peso_aresta para cada par (origem, destino), na mesma ordem"""
+        return [self.peso_aresta(origem, destino) for origem, destino in pares]
\ No newline at end of file
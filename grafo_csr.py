@@ -0,0 +1,289 @@
+from array import array
+from multiprocessing.sharedctypes import RawArray
+
+from grafo import Grafo
+from aresta import Aresta
+from leitura_instancias import montar_csr
+
+
+class _VizinhancaCSR:
+    """Visão somente leitura das arestas de um vértice do GrafoCSR"""
+    __slots__ = ('grafo', 'inicio', 'fim')
+
+    def __init__(self, grafo, inicio: int, fim: int):
+        self.grafo = grafo
+        self.inicio = inicio
+        self.fim = fim
+
+    def __len__(self):
+        return self.fim - self.inicio
+
+    def __iter__(self):
+        destinos = self.grafo.destinos
+        pesos = self.grafo.pesos
+        for i in range(self.inicio, self.fim):
+            yield Aresta(destinos[i], pesos[i])
+
+    def __getitem__(self, i: int) -> Aresta:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return Aresta(self.grafo.destinos[self.inicio + i], self.grafo.pesos[self.inicio + i])
+
+
+class _ListaAdjCSR:
+    """Imita o dicionário lista_adj do GrafoLista sobre os buffers CSR"""
+    __slots__ = ('grafo',)
+
+    def __init__(self, grafo):
+        self.grafo = grafo
+
+    def __len__(self):
+        if not self.grafo.congelado:
+            self.grafo.congelar()
+        return len(self.grafo.offsets) - 1
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __contains__(self, vertice):
+        return isinstance(vertice, int) and 0 <= vertice < len(self)
+
+    def __getitem__(self, vertice: int) -> _VizinhancaCSR:
+        if vertice not in self:
+            raise KeyError(vertice)
+        offsets = self.grafo.offsets
+        return _VizinhancaCSR(self.grafo, offsets[vertice], offsets[vertice + 1])
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        return (self[v] for v in self)
+
+    def items(self):
+        return ((v, self[v]) for v in self)
+
+
+class GrafoCSR(Grafo):
+    """
+    Grafo em formato CSR (compressed sparse row), imutável após o carregamento.
+    Vértices e arestas inseridos um a um ficam pendentes até congelar(), que as
+    consultas chamam sozinhas; depois da primeira consulta o grafo não muda mais.
+
+    As arestas ficam em três buffers contíguos (arrays, ou memoryviews sobre o
+    cache binário mapeado em memória): offsets (V + 1 posições),
+    destinos e pesos (uma posição por aresta armazenada). As arestas de um
+    vértice v ocupam o intervalo [offsets[v], offsets[v + 1]) e mantêm a
+    mesma ordem de inserção do GrafoLista.
+    """
+
+    def __init__(self, direcionado: bool, ponderado: bool):
+        super().__init__(direcionado, ponderado)
+
+        self.vertices = {}
+        self.labels = []
+        self.congelado = False
+
+        self.offsets = array('q', [0])
+        self.destinos = array('i')
+        self.pesos = array('i')
+        self.lista_adj = _ListaAdjCSR(self)
+
+        # arestas pendentes até o congelamento
+        self._origens_pendentes = array('i')
+        self._destinos_pendentes = array('i')
+        self._pesos_pendentes = []
+
+    @classmethod
+    def de_grafo(cls, grafo) -> 'GrafoCSR':
+        """Cria um GrafoCSR a partir de qualquer outra implementação de Grafo"""
+        csr = cls(grafo.direcionado, grafo.ponderado)
+        for label in grafo.labels:
+            csr.inserir_vertice(label)
+
+        # as arestas já estão nos dois sentidos no grafo de origem, e as paralelas
+        # mantêm cada uma o seu peso
+        for origem in range(len(grafo.labels)):
+            for destino, peso in grafo.retornar_vizinhos_ponderados(origem):
+                csr._origens_pendentes.append(origem)
+                csr._destinos_pendentes.append(destino)
+                csr._pesos_pendentes.append(peso)
+
+        csr.congelar()
+        return csr
+
+    def ler_arquivo(self, nome_arquivo: str, usar_cache: bool = True) -> None:
+        super().ler_arquivo(nome_arquivo, usar_cache)
+        self.congelar()
+
+    def _carregar_csr(self, offsets, destinos, pesos) -> None:
+        if self.congelado or self._origens_pendentes or len(self.labels) != len(offsets) - 1:
+            return super()._carregar_csr(offsets, destinos, pesos)
+
+        # adota os buffers (arrays ou memoryviews sobre o cache mapeado) sem copiar
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        self.congelado = True
+
+    def _inserir_arestas_em_lote(self, origens: list, destinos: list, pesos: list) -> None:
+        num_vertices = len(self.labels)
+        if self.congelado or (origens and (max(origens) >= num_vertices or max(destinos) >= num_vertices)):
+            return super()._inserir_arestas_em_lote(origens, destinos, pesos)
+
+        if self.direcionado:
+            self._origens_pendentes.extend(origens)
+            self._destinos_pendentes.extend(destinos)
+            self._pesos_pendentes.extend(pesos)
+            return
+
+        # intercala (origem, destino) e (destino, origem) como inserir_aresta faria
+        ida_volta = array('i', bytes(8 * len(origens)))
+        ida_volta[0::2] = array('i', origens)
+        ida_volta[1::2] = array('i', destinos)
+        self._origens_pendentes.extend(ida_volta)
+        ida_volta[0::2] = array('i', destinos)
+        ida_volta[1::2] = array('i', origens)
+        self._destinos_pendentes.extend(ida_volta)
+
+        pesos_duplicados = [0] * (2 * len(pesos))
+        pesos_duplicados[0::2] = pesos
+        pesos_duplicados[1::2] = pesos
+        self._pesos_pendentes.extend(pesos_duplicados)
+
+    def congelar(self) -> None:
+        """Monta os buffers CSR com as arestas pendentes; depois disso o grafo não muda mais"""
+        if self.congelado:
+            return
+
+        # as arestas pendentes já estão nos dois sentidos, então o CSR é montado como direcionado
+        self.offsets, self.destinos, self.pesos = montar_csr(
+            len(self.labels), True, self._origens_pendentes, self._destinos_pendentes, self._pesos_pendentes)
+
+        self._origens_pendentes = array('i')
+        self._destinos_pendentes = array('i')
+        self._pesos_pendentes = []
+        self.congelado = True
+
+    def num_arestas(self) -> int:
+        """Número de arestas armazenadas (em grafos não direcionados cada aresta conta duas vezes)"""
+        if not self.congelado:
+            self.congelar()
+        return len(self.destinos)
+
+    def inserir_vertice(self, label: str) -> bool:
+        if self.congelado or label in self.vertices:
+            return False
+
+        self.vertices[label] = len(self.labels)
+        self.labels.append(label)
+
+        return True
+
+    def remover_vertice(self, label: str) -> bool:
+        return False
+
+    def label_vertice(self, indice: int) -> str:
+        return self.labels[indice] if 0 <= indice < len(self.labels) else ""
+
+    def inserir_aresta(self, origem: int, destino: int, peso: int = 1) -> bool:
+        if self.congelado:
+            return False
+
+        if origem >= len(self.labels) or destino >= len(self.labels):
+            return False
+
+        self._origens_pendentes.append(origem)
+        self._destinos_pendentes.append(destino)
+        self._pesos_pendentes.append(peso)
+
+        if not self.direcionado:
+            self._origens_pendentes.append(destino)
+            self._destinos_pendentes.append(origem)
+            self._pesos_pendentes.append(peso)
+
+        return True
+
+    def remover_aresta(self, origem: int, destino: int) -> bool:
+        return False
+
+    def _posicao_aresta(self, origem: int, destino: int) -> int:
+        if not self.congelado:
+            self.congelar()
+        inicio = self.offsets[origem]
+        fim = self.offsets[origem + 1]
+        try:
+            return inicio + self.destinos[inicio:fim].tolist().index(destino)
+        except ValueError:
+            return -1
+
+    def existe_aresta(self, origem: int, destino: int) -> bool:
+        return self._posicao_aresta(origem, destino) != -1
+
+    def peso_aresta(self, origem: int, destino: int) -> float:
+        posicao = self._posicao_aresta(origem, destino)
+        return self.pesos[posicao] if posicao != -1 else 0
+
+    def retornar_vizinhos(self, vertice: int) -> list:
+        if not self.congelado:
+            self.congelar()
+        return self.destinos[self.offsets[vertice]:self.offsets[vertice + 1]].tolist()
+
+    def retornar_vizinhos_ponderados(self, vertice: int) -> list:
+        if not self.congelado:
+            self.congelar()
+        inicio, fim = self.offsets[vertice], self.offsets[vertice + 1]
+        return list(zip(self.destinos[inicio:fim], self.pesos[inicio:fim]))
+
+    def imprime_grafo(self) -> None:
+        self.congelar()
+        for vertice in range(len(self.labels)):
+            inicio, fim = self.offsets[vertice], self.offsets[vertice + 1]
+            print(f"{vertice}: { [f'{self.destinos[i]}(peso={self.pesos[i]})' for i in range(inicio, fim)] }")
+
+
+def _copiar_para_compartilhado(tipo: str, valores) -> RawArray:
+    """Cópia byte a byte de um array (ou memoryview do mesmo tipo) para um RawArray"""
+    compartilhado = RawArray(tipo, len(valores))
+    if len(valores):
+        memoryview(compartilhado).cast('B')[:] = memoryview(valores).cast('B')
+    return compartilhado
+
+
+def visao_nativa(compartilhado) -> memoryview:
+    """memoryview com o formato nativo do RawArray: indexar ctypes diretamente é bem mais lento"""
+    return memoryview(compartilhado).cast('B').cast(compartilhado._type_._type_)
+
+
+def csr_compartilhado(grafo, com_pesos: bool = False) -> tuple:
+    """
+    Copia a adjacência de qualquer Grafo para (offsets, destinos) em memória
+    compartilhada (RawArray), para ser lida por processos de um multiprocessing.Pool
+    sem serialização. Os vizinhos ficam na ordem de retornar_vizinhos. Com com_pesos,
+    devolve também os pesos, como float64: (offsets, destinos, pesos).
+    """
+    if isinstance(grafo, GrafoCSR):
+        grafo.congelar()
+        offsets, destinos = grafo.offsets, grafo.destinos
+        pesos = grafo.pesos if com_pesos else None
+    else:
+        offsets = array('q', [0])
+        destinos = array('i')
+        pesos = array('d') if com_pesos else None
+        for vertice in range(len(grafo.labels)):
+            if com_pesos:
+                arestas = grafo.retornar_vizinhos_ponderados(vertice)
+                destinos.extend([destino for destino, _ in arestas])
+                pesos.extend([peso for _, peso in arestas])
+            else:
+                destinos.extend(grafo.retornar_vizinhos(vertice))
+            offsets.append(len(destinos))
+
+    compartilhados = (_copiar_para_compartilhado('q', offsets), _copiar_para_compartilhado('i', destinos))
+    if com_pesos:
+        if not (isinstance(pesos, array) and pesos.typecode == 'd'):
+            pesos = array('d', pesos)
+        compartilhados += (_copiar_para_compartilhado('d', pesos),)
+    return compartilhados
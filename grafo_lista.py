@@ -1,14 +1,57 @@
 from grafo import Grafo
-from aresta import Aresta
+from aresta import ListaArestas
+
+# o que inserir_aresta faz quando a aresta já existe
+POLITICAS_ARESTAS_PARALELAS = ('permitir', 'ignorar', 'substituir')
 
 class GrafoLista(Grafo):
-    def __init__(self, direcionado: bool, ponderado: bool):
+    """
+    Lista de adjacências. Com indexar=True, mantém também um índice destino -> peso por
+    vértice, que torna existe_aresta e peso_aresta O(1) em vez de uma busca linear.
+
+    arestas_paralelas define o que acontece ao inserir uma aresta que já existe:
+    'permitir' (padrão) cria outra aresta paralela, 'ignorar' mantém a existente e
+    retorna False, 'substituir' troca o peso da existente. As duas últimas sempre usam
+    o índice. Com paralelas, o índice guarda o peso da primeira inserida, a mesma que o
+    Kruskal considera.
+
+    As arestas de cada vértice ficam em uma ListaArestas (arrays paralelos de destinos
+    e pesos), que ainda se comporta como uma lista de Aresta.
+    """
+
+    def __init__(self, direcionado: bool, ponderado: bool, indexar: bool = False,
+                 arestas_paralelas: str = 'permitir'):
         super().__init__(direcionado, ponderado)
 
+        if arestas_paralelas not in POLITICAS_ARESTAS_PARALELAS:
+            raise ValueError(f"Política de arestas paralelas desconhecida: {arestas_paralelas}")
+
         self.lista_adj = {}
         self.vertices = {}
         self.labels = []
 
+        self.arestas_paralelas = arestas_paralelas
+        self.indexado = indexar or arestas_paralelas != 'permitir'
+        self._indice = None  # {vértice: {destino: peso}}, montado sob demanda
+
+    def indexar_arestas(self) -> None:
+        """Passa a manter o índice destino -> peso (montado na próxima consulta)"""
+        self.indexado = True
+
+    def descartar_caches(self) -> None:
+        super().descartar_caches()
+        self._indice = None
+
+    def _pesos_por_destino(self, vertice: int) -> dict:
+        # reversed: com arestas paralelas, vale o peso da primeira
+        arestas = self.lista_adj[vertice]
+        return dict(zip(reversed(arestas.destinos), reversed(arestas.pesos)))
+
+    def _indice_arestas(self) -> dict:
+        if self._indice is None:
+            self._indice = { vertice: self._pesos_por_destino(vertice) for vertice in self.lista_adj }
+        return self._indice
+
     def inserir_vertice(self, label: str) -> bool:
         if label in self.vertices:
             return False
@@ -17,53 +60,138 @@ class GrafoLista(Grafo):
 
         self.vertices[label] = indice
         self.labels.append(label)
-        self.lista_adj[indice] = []
+        self.lista_adj[indice] = ListaArestas()
+        if self._indice is not None:
+            self._indice[indice] = {}
 
         return True
 
+    def _inserir_vertices_em_lote(self, labels: list) -> None:
+        if self.labels:
+            return super()._inserir_vertices_em_lote(labels)
+
+        self.labels = list(labels)
+        self.vertices = { label: i for i, label in enumerate(self.labels) }
+        self.lista_adj = { i: ListaArestas() for i in range(len(self.labels)) }
+        self._indice = None
+
+    def _inserir_arestas_em_lote(self, origens: list, destinos: list, pesos: list) -> None:
+        num_vertices = len(self.labels)
+        if origens and (max(origens) >= num_vertices or max(destinos) >= num_vertices):
+            return super()._inserir_arestas_em_lote(origens, destinos, pesos)
+        if self.arestas_paralelas != 'permitir' or self._removidos:
+            # cada aresta passa pela política (e pela checagem de removidos) de inserir_aresta
+            return super()._inserir_arestas_em_lote(origens, destinos, pesos)
+
+        self._indice = None
+
+        # agrupa por vértice em listas e copia cada grupo para os arrays de uma vez
+        destinos_por_vertice = [[] for _ in range(num_vertices)]
+        pesos_por_vertice = [[] for _ in range(num_vertices)]
+        for origem, destino, peso in zip(origens, destinos, pesos):
+            destinos_por_vertice[origem].append(destino)
+            pesos_por_vertice[origem].append(peso)
+            if not self.direcionado:
+                destinos_por_vertice[destino].append(origem)
+                pesos_por_vertice[destino].append(peso)
+
+        for vertice in range(num_vertices):
+            if destinos_por_vertice[vertice]:
+                self.lista_adj[vertice].estender(destinos_por_vertice[vertice], pesos_por_vertice[vertice])
+
+    def _carregar_csr(self, offsets, destinos, pesos) -> None:
+        if len(self.labels) != len(offsets) - 1 or any(self.lista_adj.values()):
+            return super()._carregar_csr(offsets, destinos, pesos)
+        if self.arestas_paralelas != 'permitir' or self._removidos:
+            return super()._carregar_csr(offsets, destinos, pesos)
+
+        self._indice = None
+
+        # cada linha do CSR já é a lista de adjacência do vértice, na ordem de inserção
+        for vertice in range(len(self.labels)):
+            inicio, fim = offsets[vertice], offsets[vertice + 1]
+            self.lista_adj[vertice] = ListaArestas(destinos[inicio:fim], pesos[inicio:fim])
+
     def remover_vertice(self, label: str) -> bool:
+        """
+        Marca o vértice como removido (label None) e descarta as arestas que saem dele,
+        em O(grau). As arestas que chegam a ele ficam nas listas dos vizinhos e são
+        ignoradas nas consultas até a compactação, que acontece sozinha quando os
+        removidos passam de LIMIAR_COMPACTACAO dos índices (ou chamando compactar()).
+        """
         if label not in self.vertices:
             return False
 
         indice = self.vertices.pop(label)
-
-        self.labels.pop(indice)
-        self.lista_adj.pop(indice)
-
-        for arestas in self.lista_adj.values():
-            arestas[:] = [aresta for aresta in arestas if aresta.destino != indice]
-
-        self.vertices = { label: i for i, label in enumerate(self.labels) }
-        
+        self.labels[indice] = None
+        self.lista_adj[indice] = ListaArestas()
+        if self._indice is not None:
+            self._indice[indice] = {}
+        self._arestas_canonicas = None
+        self._removidos += 1
+
+        self._compactar_se_necessario()
         return True
 
-    # def remover_vertice(self, label: str) -> bool:
-    #     if label not in self.vertices:
-    #         return False
-
-    #     indice = self.vertices.pop(label)
-    #     self.labels[indice] = None  # Marcar como removido
-
-    #     # Remover arestas que referenciam este vértice
-    #     for key in list(self.lista_adj.keys()):
-    #         self.lista_adj[key] = [aresta for aresta in self.lista_adj[key] if aresta.destino != indice]
-        
-    #     return True
+    def compactar(self) -> list:
+        novos, labels = self._novos_indices()
+
+        lista_adj = {}
+        for antigo, arestas in self.lista_adj.items():
+            if novos[antigo] == -1:
+                continue
+            mantidas = [(novos[destino], peso) for destino, peso in zip(arestas.destinos, arestas.pesos)
+                        if novos[destino] != -1]
+            lista_adj[novos[antigo]] = ListaArestas([destino for destino, _ in mantidas],
+                                                    [peso for _, peso in mantidas])
+
+        self.labels = labels
+        self.vertices = { label: i for i, label in enumerate(labels) }
+        self.lista_adj = lista_adj
+        self._removidos = 0
+        self._indice = None
+        self._arestas_canonicas = None
+        return novos
 
     def label_vertice(self, indice: int) -> str:
-        return self.labels[indice] if 0 <= indice < len(self.labels) else ""
+        return (self.labels[indice] or "") if 0 <= indice < len(self.labels) else ""
 
     def inserir_aresta(self, origem: int, destino: int, peso: int = 1) -> bool:
         if origem >= len(self.labels) or destino >= len(self.labels):
             return False
+        if self._removidos and (self.labels[origem] is None or self.labels[destino] is None):
+            return False
+
+        if self.arestas_paralelas != 'permitir' and self.existe_aresta(origem, destino):
+            if self.arestas_paralelas == 'ignorar':
+                return False
+            self._substituir_peso(origem, destino, peso)
+            return True
 
-        self.lista_adj[origem].append(Aresta(destino, peso))
+        self._arestas_canonicas = None
+        self.lista_adj[origem].adicionar(destino, peso)
 
         if not self.direcionado:
-            self.lista_adj[destino].append(Aresta(origem, peso))
+            self.lista_adj[destino].adicionar(origem, peso)
+
+        if self._indice is not None:
+            self._indice[origem].setdefault(destino, peso)
+            if not self.direcionado:
+                self._indice[destino].setdefault(origem, peso)
 
         return True
 
+    def _substituir_peso(self, origem: int, destino: int, peso) -> None:
+        self._arestas_canonicas = None
+        pontas = [(origem, destino)] if self.direcionado else [(origem, destino), (destino, origem)]
+        for u, v in pontas:
+            arestas = self.lista_adj[u]
+            for i, d in enumerate(arestas.destinos):
+                if d == v:
+                    arestas.definir_peso(i, peso)
+            if self._indice is not None:
+                self._indice[u][v] = peso
+
     # def inserir_aresta(self, origem: int, destino: int, peso: int = 1) -> bool:
     #     if origem not in self.lista_adj or destino not in self.lista_adj:
     #         return False
@@ -79,25 +207,79 @@ class GrafoLista(Grafo):
         if origem >= len(self.labels) or destino >= len(self.labels):
             return False
 
-        self.lista_adj[origem] = [aresta for aresta in self.lista_adj[origem] if aresta.destino != destino]
+        self._arestas_canonicas = None
+        self.lista_adj[origem].remover_destino(destino)
 
         if not self.direcionado:
-            self.lista_adj[destino] = [aresta for aresta in self.lista_adj[destino] if aresta.destino != origem]
+            self.lista_adj[destino].remover_destino(origem)
+
+        if self._indice is not None:
+            self._indice[origem].pop(destino, None)
+            if not self.direcionado:
+                self._indice[destino].pop(origem, None)
 
         return True
 
     def existe_aresta(self, origem: int, destino: int) -> bool:
-        return any(aresta.destino == destino for aresta in self.lista_adj[origem])
+        if self._removidos and not self.vertice_ativo(destino):
+            return False
+        if self.indexado:
+            return destino in self._indice_arestas()[origem]
+        return self.lista_adj[origem].posicao(destino) != -1
 
     def peso_aresta(self, origem: int, destino: int) -> float:
-        for aresta in self.lista_adj[origem]:
-            if aresta.destino == destino:
-                return aresta.peso
-
-        return 0
+        if self._removidos and not self.vertice_ativo(destino):
+            return 0
+        if self.indexado:
+            return self._indice_arestas()[origem].get(destino, 0)
+
+        arestas = self.lista_adj[origem]
+        posicao = arestas.posicao(destino)
+        return arestas.pesos[posicao] if posicao != -1 else 0
+
+    def _consultar_em_lote(self, pares) -> list:
+        """Dicionário destino -> peso da origem de cada par; sem índice, um por origem distinta"""
+        if self.indexado:
+            indice = self._indice_arestas()
+            return [indice[origem] for origem, _ in pares]
+
+        por_origem = {}
+        dicionarios = []
+        for origem, _ in pares:
+            pesos = por_origem.get(origem)
+            if pesos is None:
+                pesos = por_origem[origem] = self._pesos_por_destino(origem)
+            dicionarios.append(pesos)
+        return dicionarios
+
+    def existem_arestas(self, pares) -> list:
+        pares = list(pares)
+        existem = [destino in pesos for (_, destino), pesos in zip(pares, self._consultar_em_lote(pares))]
+        if self._removidos:
+            existem = [existe and self.vertice_ativo(destino) for existe, (_, destino) in zip(existem, pares)]
+        return existem
+
+    def pesos_arestas(self, pares) -> list:
+        pares = list(pares)
+        pesos = [pesos.get(destino, 0) for (_, destino), pesos in zip(pares, self._consultar_em_lote(pares))]
+        if self._removidos:
+            pesos = [peso if self.vertice_ativo(destino) else 0 for peso, (_, destino) in zip(pesos, pares)]
+        return pesos
 
     def retornar_vizinhos(self, vertice: int) -> list:
-        return [aresta.destino for aresta in self.lista_adj[vertice]]
+        if self._removidos:
+            labels = self.labels
+            return [destino for destino in self.lista_adj[vertice].destinos if labels[destino] is not None]
+        return self.lista_adj[vertice].destinos.tolist()
+
+    def retornar_vizinhos_ponderados(self, vertice: int) -> list:
+        # os pares saem direto dos arrays de destinos e pesos, sem a busca linear de peso_aresta
+        arestas = self.lista_adj[vertice]
+        if self._removidos:
+            labels = self.labels
+            return [(destino, peso) for destino, peso in zip(arestas.destinos, arestas.pesos)
+                    if labels[destino] is not None]
+        return list(zip(arestas.destinos, arestas.pesos))
 
     # def retornar_vizinhos(self, vertice: int) -> list:
     #     if vertice not in self.lista_adj:
@@ -106,10 +288,6 @@ class GrafoLista(Grafo):
     #     return [aresta.destino for aresta in self.lista_adj[vertice]]
 
     def imprime_grafo(self) -> None:
-        for vertice, arestas in self.lista_adj.items():
-            print(f"{vertice}: { [f'{aresta.destino}(peso={aresta.peso})' for aresta in arestas] }")
-
-    # def imprime_grafo(self) -> None:
-    #     for vertice, arestas in self.lista_adj.items():
-    #         if vertice is not None:  # Ignora vértices removidos
-    #             print(f"{vertice}: { [f'{aresta.destino}(peso={aresta.peso})' for aresta in arestas] }")
\ No newline at end of file
+        for vertice in self.lista_adj:
+            if self.labels[vertice] is not None:  # Ignora vértices removidos
+                print(f"{vertice}: { [f'{destino}(peso={peso})' for destino, peso in self.retornar_vizinhos_ponderados(vertice)] }")
\ No newline at end of file
@@ -1,13 +1,131 @@
+from array import array
+from itertools import compress
+
 from grafo import Grafo
 
+# tipos inteiros do array, do mais compacto ao mais largo; 'd' guarda pesos não inteiros
+TIPOS_PESO = ('b', 'h', 'i', 'q', 'd')
+
+# byte -> seus 8 bits, do menos significativo ao mais, como bytes 0/1
+_BITS_DO_BYTE = [bytes((byte >> k) & 1 for k in range(8)) for byte in range(256)]
+
+# byte 0/1 -> dígito '0'/'1', para empacotar uma linha com int(..., 2)
+_DIGITOS_BINARIOS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def _tipo_para(menor, maior, atual: str = 'b') -> str:
+    """O tipo mais compacto, a partir de atual, que guarda valores entre menor e maior"""
+    if isinstance(menor, float) or isinstance(maior, float):
+        return 'd'
+
+    for tipo in TIPOS_PESO[TIPOS_PESO.index(atual):]:
+        if tipo == 'd':
+            return tipo
+        limite = 1 << (8 * array(tipo).itemsize - 1)
+        if -limite <= menor and maior < limite:
+            return tipo
+
+
+class LinhaBits:
+    """
+    Linha da matriz de adjacência com um bit por coluna, para grafos não ponderados
+    (V²/8 bytes na matriz toda). Funciona como uma sequência de 0 e 1.
+    """
+
+    __slots__ = ('bits', 'tamanho')
+
+    def __init__(self, tamanho: int = 0):
+        self.bits = bytearray((tamanho + 7) >> 3)
+        self.tamanho = tamanho
+
+    @classmethod
+    def de_marcados(cls, marcados: bytes) -> 'LinhaBits':
+        """Empacota uma sequência de bytes 0/1 (um por coluna), sem laço Python por coluna"""
+        linha = cls(len(marcados))
+        if marcados:
+            valor = int(bytes(marcados[::-1]).translate(_DIGITOS_BINARIOS), 2)
+            linha.bits[:] = valor.to_bytes(len(linha.bits), 'little')
+        return linha
+
+    def __len__(self):
+        return self.tamanho
+
+    def __getitem__(self, coluna: int) -> int:
+        if not 0 <= coluna < self.tamanho:
+            raise IndexError(coluna)
+        return self.bits[coluna >> 3] >> (coluna & 7) & 1
+
+    def __setitem__(self, coluna: int, valor) -> None:
+        if not 0 <= coluna < self.tamanho:
+            raise IndexError(coluna)
+        if valor:
+            self.bits[coluna >> 3] |= 1 << (coluna & 7)
+        else:
+            self.bits[coluna >> 3] &= ~(1 << (coluna & 7)) & 0xFF
+
+    def __iter__(self):
+        return iter(self.expandir())
+
+    def expandir(self) -> bytes:
+        """Um byte 0/1 por coluna"""
+        return b''.join(map(_BITS_DO_BYTE.__getitem__, self.bits))[:self.tamanho]
+
+    def append(self, valor) -> None:
+        if self.tamanho == 8 * len(self.bits):
+            self.bits.append(0)
+        self.tamanho += 1
+        if valor:
+            self[self.tamanho - 1] = 1
+
+
 class GrafoMatriz(Grafo):
-    def __init__(self, direcionado: bool, ponderado: bool):
+    """
+    Matriz de adjacência com cada linha em um array compacto: o tipo ('b', 'h', 'i',
+    'q' ou 'd') é o menor que cabe os pesos inseridos até agora e é alargado quando um
+    peso não cabe. O alargamento vale para a matriz toda: depois de um único peso float
+    (ou inteiro fora de 'q'), todos os pesos passam a ser lidos como float, e inteiros
+    acima de 2**53 perdem precisão. Com bits=True (só para grafos não ponderados), cada
+    linha é uma LinhaBits, com um bit por célula.
+    """
+
+    # uma célula por par de vértices: inserir uma aresta existente troca o peso
+    arestas_paralelas = 'substituir'
+
+    def __init__(self, direcionado: bool, ponderado: bool, bits: bool = False):
         super().__init__(direcionado, ponderado)
+        if bits and ponderado:
+            raise ValueError("Matriz de bits só suporta grafos não ponderados")
 
         self.matriz_adj = []
         self.vertices = {}
         self.labels = []
 
+        self.bits = bits
+        self.tipo = 'b'
+
+    def _linha(self, valores=None, tamanho: int = 0):
+        """Nova linha com os valores dados, ou com tamanho zeros"""
+        if self.bits:
+            if valores is None:
+                return LinhaBits(tamanho)
+            return LinhaBits.de_marcados(bytes(1 if valor else 0 for valor in valores))
+
+        if valores is not None:
+            return array(self.tipo, valores)
+        return array(self.tipo, bytes(array(self.tipo).itemsize * tamanho))
+
+    def _acomodar_pesos(self, menor, maior) -> None:
+        """Alarga o tipo das linhas, se preciso, para caberem pesos entre menor e maior"""
+        if self.bits:
+            if self.ponderado:
+                raise ValueError("Matriz de bits só suporta grafos não ponderados")
+            return
+
+        tipo = _tipo_para(menor, maior, self.tipo)
+        if tipo != self.tipo:
+            self.tipo = tipo
+            self.matriz_adj = [array(tipo, linha) for linha in self.matriz_adj]
+
     def inserir_vertice(self, label: str) -> bool:
         if label in self.vertices:
             return False
@@ -18,34 +136,116 @@ class GrafoMatriz(Grafo):
         for linha in self.matriz_adj:
             linha.append(0)
 
-        self.matriz_adj.append([0] * len(self.labels))
+        self.matriz_adj.append(self._linha(tamanho=len(self.labels)))
 
         return True
 
+    def _inserir_vertices_em_lote(self, labels: list) -> None:
+        if self.labels:
+            return super()._inserir_vertices_em_lote(labels)
+
+        # aloca a matriz inteira de uma vez em vez de crescer linha a linha
+        self.labels = list(labels)
+        self.vertices = { label: i for i, label in enumerate(self.labels) }
+        self.matriz_adj = [self._linha(tamanho=len(self.labels)) for _ in self.labels]
+
+    def _inserir_arestas_em_lote(self, origens: list, destinos: list, pesos: list) -> None:
+        num_vertices = len(self.labels)
+        if origens and (max(origens) >= num_vertices or max(destinos) >= num_vertices):
+            return super()._inserir_arestas_em_lote(origens, destinos, pesos)
+        if self._removidos:
+            return super()._inserir_arestas_em_lote(origens, destinos, pesos)
+
+        if pesos:
+            self._acomodar_pesos(min(pesos), max(pesos))
+
+        matriz = self.matriz_adj
+        if self.direcionado:
+            for origem, destino, peso in zip(origens, destinos, pesos):
+                matriz[origem][destino] = peso
+        else:
+            for origem, destino, peso in zip(origens, destinos, pesos):
+                matriz[origem][destino] = peso
+                matriz[destino][origem] = peso
+
+    def _tem_arestas(self) -> bool:
+        # conta os bytes nulos de cada linha em vez de percorrer célula a célula
+        if self.bits:
+            return any(linha.bits.count(0) != len(linha.bits) for linha in self.matriz_adj)
+        return any(linha.tobytes().count(0) != len(linha) * linha.itemsize for linha in self.matriz_adj)
+
+    def _carregar_csr(self, offsets, destinos, pesos) -> None:
+        if len(self.labels) != len(offsets) - 1 or self._removidos or self._tem_arestas():
+            return super()._carregar_csr(offsets, destinos, pesos)
+
+        if len(pesos):
+            self._acomodar_pesos(min(pesos), max(pesos))
+
+        num_vertices = len(self.labels)
+        for vertice, linha in enumerate(self.matriz_adj):
+            inicio, fim = offsets[vertice], offsets[vertice + 1]
+            if self.bits:
+                marcados = bytearray(num_vertices)
+                for destino, peso in zip(destinos[inicio:fim], pesos[inicio:fim]):
+                    if peso:
+                        marcados[destino] = 1
+                self.matriz_adj[vertice] = LinhaBits.de_marcados(marcados)
+            else:
+                for destino, peso in zip(destinos[inicio:fim], pesos[inicio:fim]):
+                    linha[destino] = peso
+
     def remover_vertice(self, label: str) -> bool:
+        """
+        Marca o vértice como removido (label None) e zera sua linha e sua coluna, em O(V)
+        em vez de apagar uma coluna de cada linha. A matriz só encolhe na compactação,
+        que acontece sozinha quando os removidos passam de LIMIAR_COMPACTACAO dos índices
+        (ou chamando compactar()).
+        """
         if label not in self.vertices:
             return False
 
         indice = self.vertices.pop(label)
-        self.labels.pop(indice)
-
-        self.matriz_adj.pop(indice)
-
+        self.labels[indice] = None
+        self.matriz_adj[indice] = self._linha(tamanho=len(self.labels))
         for linha in self.matriz_adj:
-            linha.pop(indice)
-
-        self.vertices = { label: i for i, label in enumerate(self.labels) }
+            linha[indice] = 0
+        self._arestas_canonicas = None
+        self._removidos += 1
 
+        self._compactar_se_necessario()
         return True
 
+    def compactar(self) -> list:
+        novos, labels = self._novos_indices()
+        mantidos = [antigo for antigo, novo in enumerate(novos) if novo != -1]
+
+        matriz_adj = []
+        for i in mantidos:
+            colunas = list(self.matriz_adj[i])
+            matriz_adj.append(self._linha([colunas[j] for j in mantidos]))
+        self.matriz_adj = matriz_adj
+        self.labels = labels
+        self.vertices = { label: i for i, label in enumerate(labels) }
+        self._removidos = 0
+        self._arestas_canonicas = None
+        return novos
+
     def label_vertice(self, indice: int) -> str:
-        return self.labels[indice] if 0 <= indice < len(self.labels) else ""
+        return (self.labels[indice] or "") if 0 <= indice < len(self.labels) else ""
 
     def inserir_aresta(self, origem: int, destino: int, peso: int = 1) -> bool:
         if origem >= len(self.labels) or destino >= len(self.labels):
             return False
+        if self._removidos and (self.labels[origem] is None or self.labels[destino] is None):
+            return False
 
-        self.matriz_adj[origem][destino] = peso
+        self._arestas_canonicas = None
+        try:
+            self.matriz_adj[origem][destino] = peso
+        except (OverflowError, TypeError):
+            # o peso não cabe no tipo atual das linhas
+            self._acomodar_pesos(peso, peso)
+            self.matriz_adj[origem][destino] = peso
 
         if not self.direcionado:
             self.matriz_adj[destino][origem] = peso
@@ -56,6 +256,7 @@ class GrafoMatriz(Grafo):
         if origem >= len(self.labels) or destino >= len(self.labels):
             return False
 
+        self._arestas_canonicas = None
         self.matriz_adj[origem][destino] = 0
 
         if not self.direcionado:
@@ -72,9 +273,19 @@ class GrafoMatriz(Grafo):
     def retornar_vizinhos(self, vertice: int) -> list:
         if vertice >= len(self.labels):
             return []
-            
-        return [i for i, peso in enumerate(self.matriz_adj[vertice]) if peso != 0]
+
+        # compress seleciona as colunas não nulas em C, sem um laço Python por célula
+        return list(compress(range(len(self.labels)), self.matriz_adj[vertice]))
+
+    def retornar_vizinhos_ponderados(self, vertice: int) -> list:
+        if vertice >= len(self.labels):
+            return []
+
+        linha = self.matriz_adj[vertice]
+        if self.bits:
+            return [(i, 1) for i in compress(range(len(self.labels)), linha)]
+        return [(i, linha[i]) for i in compress(range(len(self.labels)), linha)]
 
     def imprime_grafo(self) -> None:
         for linha in self.matriz_adj:
-            print(linha)
+            print(list(linha))
@@ -0,0 +1,100 @@
+class HeapIndexado:
+    """
+    Heap d-ário de mínimo indexado pelos itens 0..n-1, com diminuição de chave.
+
+    Cada item aparece no máximo uma vez no heap; a posição de cada item é
+    mantida em um vetor, então diminuir_chave custa O(log_d n) sem entradas
+    duplicadas (ao contrário do heapq com remoção preguiçosa).
+    """
+
+    def __init__(self, capacidade: int, aridade: int = 4):
+        self.aridade = aridade
+        self.heap = []
+        self.chaves = [float('inf')] * capacidade
+        self.posicao = [-1] * capacidade
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item: int) -> bool:
+        return self.posicao[item] != -1
+
+    def chave(self, item: int):
+        return self.chaves[item]
+
+    def inserir(self, item: int, chave) -> None:
+        self.chaves[item] = chave
+        self.posicao[item] = len(self.heap)
+        self.heap.append(item)
+        self._subir(len(self.heap) - 1)
+
+    def diminuir_chave(self, item: int, chave) -> None:
+        self.chaves[item] = chave
+        self._subir(self.posicao[item])
+
+    def inserir_ou_diminuir(self, item: int, chave) -> bool:
+        """Insere o item ou diminui sua chave; retorna False se a chave atual já é menor ou igual"""
+        if self.posicao[item] == -1:
+            self.inserir(item, chave)
+            return True
+        if chave < self.chaves[item]:
+            self.diminuir_chave(item, chave)
+            return True
+        return False
+
+    def extrair_minimo(self) -> tuple:
+        heap = self.heap
+        item = heap[0]
+        ultimo = heap.pop()
+        self.posicao[item] = -1
+
+        if heap:
+            heap[0] = ultimo
+            self.posicao[ultimo] = 0
+            self._descer(0)
+
+        return item, self.chaves[item]
+
+    def _subir(self, i: int) -> None:
+        heap, chaves, posicao, aridade = self.heap, self.chaves, self.posicao, self.aridade
+        item = heap[i]
+        chave = chaves[item]
+
+        while i > 0:
+            pai = (i - 1) // aridade
+            item_pai = heap[pai]
+            if chaves[item_pai] <= chave:
+                break
+            heap[i] = item_pai
+            posicao[item_pai] = i
+            i = pai
+
+        heap[i] = item
+        posicao[item] = i
+
+    def _descer(self, i: int) -> None:
+        heap, chaves, posicao, aridade = self.heap, self.chaves, self.posicao, self.aridade
+        tamanho = len(heap)
+        item = heap[i]
+        chave = chaves[item]
+
+        while True:
+            primeiro = i * aridade + 1
+            if primeiro >= tamanho:
+                break
+
+            # menor entre os filhos
+            menor = primeiro
+            for filho in range(primeiro + 1, min(primeiro + aridade, tamanho)):
+                if chaves[heap[filho]] < chaves[heap[menor]]:
+                    menor = filho
+
+            if chaves[heap[menor]] >= chave:
+                break
+
+            heap[i] = heap[menor]
+            posicao[heap[i]] = i
+            i = menor
+
+        heap[i] = item
+        posicao[item] = i
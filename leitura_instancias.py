@@ -0,0 +1,203 @@
+"""
+Leitura de instâncias em texto e cache binário em formato CSR
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+PASTA_CACHE = '__cache_grafos__'
+
+# magic, versão, marcador de ordem de bytes, direcionado, ponderado, tipo do peso,
+# num_vertices, num_entradas, tamanho e mtime (ns) do arquivo de origem
+_FORMATO_CABECALHO = '=8sIIBBcxqqqq'
+_TAMANHO_CABECALHO = 64
+_MAGIC = b'GRAFCSR\0'
+_VERSAO = 1
+_MARCADOR_BYTES = 0x01020304
+
+
+def ler_instancia(nome_arquivo: str) -> tuple:
+    """
+    Lê um arquivo de instância de uma só vez e devolve
+    (num_vertices, direcionado, ponderado, origens, destinos, pesos).
+    """
+    with open(nome_arquivo, 'rb') as arquivo:
+        primeira_linha = arquivo.readline().split()
+        corpo = arquivo.read()
+
+    num_vertices = int(primeira_linha[0])
+    num_arestas = int(primeira_linha[1])
+    direcionado = bool(int(primeira_linha[2]))
+    ponderado = bool(int(primeira_linha[3]))
+
+    # caminho rápido: todas as linhas de aresta têm o mesmo número de colunas
+    tokens = corpo.split()
+    primeira_aresta = corpo.lstrip().split(b'\n', 1)[0].split()
+    colunas = len(primeira_aresta)
+
+    if colunas >= 2 and len(tokens) == colunas * num_arestas:
+        valores = list(map(int, tokens))
+        origens = valores[0::colunas]
+        destinos = valores[1::colunas]
+        pesos = valores[2::colunas] if ponderado and colunas > 2 else [1] * num_arestas
+        return num_vertices, direcionado, ponderado, origens, destinos, pesos
+
+    # formato irregular: interpreta linha a linha, como ler_arquivo_sequencial
+    origens, destinos, pesos = [], [], []
+    for linha in corpo.split(b'\n')[:num_arestas]:
+        aresta_info = linha.split()
+        if len(aresta_info) < 2:  # Pula linhas vazias ou incompletas
+            continue
+        origens.append(int(aresta_info[0]))
+        destinos.append(int(aresta_info[1]))
+        pesos.append(int(aresta_info[2]) if ponderado and len(aresta_info) > 2 else 1)
+
+    return num_vertices, direcionado, ponderado, origens, destinos, pesos
+
+
+def _tipo_dos_pesos(pesos) -> str:
+    if all(isinstance(p, int) for p in pesos):
+        if not pesos or (min(pesos) >= -2**31 and max(pesos) < 2**31):
+            return 'i'
+        return 'q'
+    return 'd'
+
+
+def montar_csr(num_vertices: int, direcionado: bool, origens, destinos, pesos) -> tuple:
+    """
+    Monta (offsets, destinos, pesos) em CSR, na mesma ordem em que inserir_aresta
+    preencheria as listas de adjacência. Arestas com vértices inexistentes são ignoradas.
+    """
+    tipo_peso = _tipo_dos_pesos(pesos)
+
+    grau = [0] * (num_vertices + 1)
+    validas = []
+    for i, (origem, destino) in enumerate(zip(origens, destinos)):
+        if origem >= num_vertices or destino >= num_vertices:
+            continue
+        validas.append(i)
+        grau[origem + 1] += 1
+        if not direcionado:
+            grau[destino + 1] += 1
+
+    for v in range(num_vertices):
+        grau[v + 1] += grau[v]
+
+    # counting sort estável por origem
+    posicao = grau[:-1]
+    csr_destinos = array('i', bytes(4 * grau[-1]))
+    csr_pesos = array(tipo_peso, [0]) * grau[-1]
+    for i in validas:
+        origem, destino, peso = origens[i], destinos[i], pesos[i]
+
+        p = posicao[origem]
+        csr_destinos[p] = destino
+        csr_pesos[p] = peso
+        posicao[origem] = p + 1
+
+        if not direcionado:
+            p = posicao[destino]
+            csr_destinos[p] = origem
+            csr_pesos[p] = peso
+            posicao[destino] = p + 1
+
+    return array('q', grau), csr_destinos, csr_pesos
+
+
+def caminho_cache(nome_arquivo: str) -> str:
+    """Caminho do arquivo binário correspondente a uma instância em texto"""
+    caminho = os.path.abspath(nome_arquivo)
+    chave = hashlib.sha1(caminho.encode('utf-8')).hexdigest()[:16]
+    nome = f"{os.path.basename(caminho)}.{chave}.csr"
+    return os.path.join(os.path.dirname(caminho), PASTA_CACHE, nome)
+
+
+def salvar_cache(nome_arquivo: str, num_vertices: int, direcionado: bool, ponderado: bool,
+                 offsets, destinos, pesos) -> bool:
+    """Grava a instância em formato binário; retorna False se não foi possível gravar"""
+    estado = os.stat(nome_arquivo)
+    cabecalho = struct.pack(_FORMATO_CABECALHO, _MAGIC, _VERSAO, _MARCADOR_BYTES,
+                            direcionado, ponderado, pesos.typecode.encode(),
+                            num_vertices, len(destinos), estado.st_size, estado.st_mtime_ns)
+
+    destino_cache = caminho_cache(nome_arquivo)
+    temporario = f"{destino_cache}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(destino_cache), exist_ok=True)
+        with open(temporario, 'wb') as arquivo:
+            arquivo.write(cabecalho.ljust(_TAMANHO_CABECALHO, b'\0'))
+            arquivo.write(offsets.tobytes())
+            arquivo.write(destinos.tobytes())
+            # alinha o buffer de pesos em 8 bytes
+            arquivo.write(b'\0' * (-arquivo.tell() % 8))
+            arquivo.write(pesos.tobytes())
+        os.replace(temporario, destino_cache)
+    except OSError:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return False
+
+    return True
+
+
+def abrir_cache(nome_arquivo: str):
+    """
+    Mapeia o cache binário em memória e devolve
+    (num_vertices, direcionado, ponderado, offsets, destinos, pesos) como memoryviews
+    sobre o mmap, sem cópias. Retorna None se o cache não existe ou está desatualizado.
+    """
+    destino_cache = caminho_cache(nome_arquivo)
+    try:
+        estado = os.stat(nome_arquivo)
+        with open(destino_cache, 'rb') as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapa) < _TAMANHO_CABECALHO:
+        mapa.close()
+        return None
+
+    (magic, versao, marcador, direcionado, ponderado, tipo_peso,
+     num_vertices, num_entradas, tamanho, mtime_ns) = struct.unpack_from(_FORMATO_CABECALHO, mapa)
+
+    if (magic != _MAGIC or versao != _VERSAO or marcador != _MARCADOR_BYTES
+            or tamanho != estado.st_size or mtime_ns != estado.st_mtime_ns):
+        mapa.close()
+        return None
+
+    tipo_peso = tipo_peso.decode()
+    inicio_destinos = _TAMANHO_CABECALHO + 8 * (num_vertices + 1)
+    inicio_pesos = inicio_destinos + 4 * num_entradas
+    inicio_pesos += -inicio_pesos % 8
+    fim = inicio_pesos + array(tipo_peso).itemsize * num_entradas
+    if len(mapa) != fim:
+        mapa.close()
+        return None
+
+    # as memoryviews mantêm o mmap aberto enquanto o grafo existir
+    buffer = memoryview(mapa)
+    offsets = buffer[_TAMANHO_CABECALHO:inicio_destinos].cast('q')
+    destinos = buffer[inicio_destinos:inicio_destinos + 4 * num_entradas].cast('i')
+    pesos = buffer[inicio_pesos:fim].cast(tipo_peso)
+
+    return num_vertices, bool(direcionado), bool(ponderado), offsets, destinos, pesos
+
+
+def ler_instancia_csr(nome_arquivo: str) -> tuple:
+    """
+    Devolve a instância já em CSR: (num_vertices, direcionado, ponderado, offsets, destinos, pesos).
+    Usa o cache binário quando ele está em dia com o arquivo de texto e o grava na primeira leitura.
+    """
+    instancia = abrir_cache(nome_arquivo)
+    if instancia is not None:
+        return instancia
+
+    num_vertices, direcionado, ponderado, origens, destinos, pesos = ler_instancia(nome_arquivo)
+    offsets, csr_destinos, csr_pesos = montar_csr(num_vertices, direcionado, origens, destinos, pesos)
+    salvar_cache(nome_arquivo, num_vertices, direcionado, ponderado, offsets, csr_destinos, csr_pesos)
+
+    return num_vertices, direcionado, ponderado, offsets, csr_destinos, csr_pesos
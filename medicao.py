@@ -0,0 +1,190 @@
+"""
+Medição de tempo repetida e estatisticamente robusta (perf_counter_ns, aquecimento,
+mediana e intervalo interquartil), gravação dos resultados em JSON/CSV e comparação
+de dois arquivos de resultados para apontar regressões
+"""
+
+import os
+import gc
+import csv
+import json
+import time
+import platform
+
+# cada amostra executa a função quantas vezes for preciso para durar ao menos isto,
+# senão a resolução do relógio e o custo da chamada dominam funções muito rápidas
+TEMPO_MINIMO_AMOSTRA_NS = 1_000_000
+
+# variação da mediana abaixo da qual a diferença é tratada como ruído na comparação
+LIMIAR_REGRESSAO = 0.05
+
+CAMPOS_CSV = ('nome', 'repeticoes', 'execucoes_por_amostra', 'mediana_ns', 'q1_ns', 'q3_ns',
+              'iqr_ns', 'minimo_ns', 'maximo_ns')
+
+
+def fixar_cpu(cpu: int):
+    """
+    Prende o processo atual (e os que ele criar depois) a uma CPU, para que migrações
+    entre núcleos não entrem na medição. Retorna a afinidade anterior, ou None onde
+    os.sched_setaffinity não existe (fora do Linux), caso em que nada muda.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    anterior = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {cpu})
+    return anterior
+
+
+def _quantil(ordenadas: list, q: float) -> float:
+    """Quantil por interpolação linear entre as amostras ordenadas"""
+    posicao = (len(ordenadas) - 1) * q
+    abaixo = int(posicao)
+    acima = min(abaixo + 1, len(ordenadas) - 1)
+    return ordenadas[abaixo] + (ordenadas[acima] - ordenadas[abaixo]) * (posicao - abaixo)
+
+
+def resumir(amostras: list) -> dict:
+    """Mediana, quartis, IQR, mínimo e máximo (ns) das amostras"""
+    ordenadas = sorted(amostras)
+    q1, q3 = _quantil(ordenadas, 0.25), _quantil(ordenadas, 0.75)
+    return {
+        'mediana_ns': _quantil(ordenadas, 0.5),
+        'q1_ns': q1,
+        'q3_ns': q3,
+        'iqr_ns': q3 - q1,
+        'minimo_ns': ordenadas[0],
+        'maximo_ns': ordenadas[-1],
+    }
+
+
+def _cronometrar_ns(funcao, execucoes: int, coletar_lixo: bool, preparar=None) -> int:
+    # o lixo das amostras anteriores é recolhido antes, fora do tempo medido
+    gc.collect()
+    ativo = gc.isenabled()
+    if not coletar_lixo:
+        gc.disable()
+    try:
+        if preparar is None:
+            inicio = time.perf_counter_ns()
+            for _ in range(execucoes):
+                funcao()
+            return time.perf_counter_ns() - inicio
+
+        total = 0
+        for _ in range(execucoes):
+            preparar()
+            inicio = time.perf_counter_ns()
+            funcao()
+            total += time.perf_counter_ns() - inicio
+        return total
+    finally:
+        if ativo:
+            gc.enable()
+
+
+def medir(funcao, repeticoes: int = 15, aquecimento: int = 3, coletar_lixo: bool = False,
+          preparar=None) -> dict:
+    """
+    Mede funcao (sem argumentos) em repeticoes amostras, depois de aquecimento execuções
+    descartadas (importações, caches do processo). Funções rápidas são executadas várias
+    vezes por amostra, até TEMPO_MINIMO_AMOSTRA_NS; cada amostra guarda o tempo médio
+    por execução. preparar, se dado, roda antes de cada execução e fora do tempo medido
+    (por exemplo, para descartar o que a execução anterior deixou em cache). Com
+    coletar_lixo=False o coletor de lixo fica desligado durante cada amostra. Retorna o
+    resumo de resumir com as amostras.
+    """
+    if repeticoes < 1:
+        raise ValueError(f"Número de repetições deve ser positivo: {repeticoes}")
+
+    execucoes = 1
+    for _ in range(max(1, aquecimento)):
+        tempo = _cronometrar_ns(funcao, execucoes, coletar_lixo, preparar)
+        while tempo < TEMPO_MINIMO_AMOSTRA_NS:
+            execucoes *= 2 if tempo == 0 else max(2, -(-TEMPO_MINIMO_AMOSTRA_NS // tempo))
+            tempo = _cronometrar_ns(funcao, execucoes, coletar_lixo, preparar)
+
+    amostras = [_cronometrar_ns(funcao, execucoes, coletar_lixo, preparar) / execucoes
+                for _ in range(repeticoes)]
+    resultado = {'repeticoes': repeticoes, 'execucoes_por_amostra': execucoes}
+    resultado.update(resumir(amostras))
+    resultado['amostras_ns'] = amostras
+    return resultado
+
+
+def iqrs_sobrepostos(a: dict, b: dict) -> bool:
+    """Se os intervalos interquartis de duas medições se sobrepõem (diferença indistinguível do ruído)"""
+    return a['q1_ns'] <= b['q3_ns'] and b['q1_ns'] <= a['q3_ns']
+
+
+def ambiente(**configuracao) -> dict:
+    """Dados da máquina e da execução gravados junto com os resultados"""
+    dados = {
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementacao': platform.python_implementation(),
+        'sistema': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'num_cpus': os.cpu_count(),
+    }
+    dados.update(configuracao)
+    return dados
+
+
+def salvar_json(caminho: str, resultados: list, metadados: dict = None) -> None:
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump({'ambiente': metadados or {}, 'resultados': resultados}, arquivo, indent=2, ensure_ascii=False)
+
+
+def salvar_csv(caminho: str, resultados: list) -> None:
+    """Uma linha por medição, sem as amostras individuais"""
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=CAMPOS_CSV, extrasaction='ignore')
+        escritor.writeheader()
+        escritor.writerows(resultados)
+
+
+def carregar_resultados(caminho: str) -> list:
+    """Resultados de um arquivo JSON de salvar_json ou CSV de salvar_csv"""
+    if caminho.endswith('.csv'):
+        with open(caminho, encoding='utf-8', newline='') as arquivo:
+            return [{campo: valor if campo == 'nome' else float(valor) for campo, valor in linha.items()}
+                    for linha in csv.DictReader(arquivo)]
+
+    with open(caminho, encoding='utf-8') as arquivo:
+        return json.load(arquivo)['resultados']
+
+
+def comparar(base: list, nova: list, limiar: float = LIMIAR_REGRESSAO) -> list:
+    """
+    Compara as medições de mesmo nome. Uma medição é 'regressão' se a mediana nova passa
+    da base por mais de limiar (fração) e os intervalos interquartis não se sobrepõem,
+    'melhora' no caso simétrico e 'igual' caso contrário; as que só existem em um dos
+    lados saem como 'nova' ou 'removida'. Retorna (nome, mediana base, mediana nova,
+    razão nova/base, situação) por medição, na ordem da base.
+    """
+    por_nome = {resultado['nome']: resultado for resultado in nova}
+    nomes_base = {resultado['nome'] for resultado in base}
+    comparacao = []
+
+    for antes in base:
+        depois = por_nome.get(antes['nome'])
+        if depois is None:
+            comparacao.append((antes['nome'], antes['mediana_ns'], None, None, 'removida'))
+            continue
+
+        razao = depois['mediana_ns'] / antes['mediana_ns'] if antes['mediana_ns'] else float('inf')
+        if iqrs_sobrepostos(antes, depois):
+            situacao = 'igual'
+        elif razao > 1 + limiar:
+            situacao = 'regressão'
+        elif razao < 1 - limiar:
+            situacao = 'melhora'
+        else:
+            situacao = 'igual'
+        comparacao.append((antes['nome'], antes['mediana_ns'], depois['mediana_ns'], razao, situacao))
+
+    for depois in nova:
+        if depois['nome'] not in nomes_base:
+            comparacao.append((depois['nome'], None, depois['mediana_ns'], None, 'nova'))
+
+    return comparacao
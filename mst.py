@@ -1,32 +1,62 @@
+import os
 import time
+import heapq
+import bisect
+import random
+import multiprocessing
+from array import array
+from itertools import chain
+from collections import deque
 
-class UnionFind:
-    """Estrutura Union-Find para o algoritmo de Kruskal"""
-    def __init__(self, n):
-        self.pai = list(range(n))
-        self.rank = [0] * n
+from heap_indexado import HeapIndexado
+from union_find import UnionFind
+from componentes import rotular_componentes
 
-    def find(self, x):
-        if self.pai[x] != x:
-            self.pai[x] = self.find(self.pai[x])
-        return self.pai[x]
+# acima desta densidade a busca linear O(V²) do Prim empata ou vence as versões com heap
+LIMIAR_PRIM_DENSO = 0.9
 
-    def union(self, x, y):
-        raiz_x = self.find(x)
-        raiz_y = self.find(y)
+# abaixo disso, o custo de distribuir as arestas entre processos supera o ganho
+ARESTAS_POR_PROCESSO_BORUVKA = 50000
 
-        if raiz_x == raiz_y:
-            return False
+# Filter-Kruskal compensa quando há bem mais arestas que vértices
+LIMIAR_FILTER_KRUSKAL = 16
+TAMANHO_BASE_FILTER_KRUSKAL = 1024
 
-        if self.rank[raiz_x] < self.rank[raiz_y]:
-            self.pai[raiz_x] = raiz_y
-        elif self.rank[raiz_x] > self.rank[raiz_y]:
-            self.pai[raiz_y] = raiz_x
-        else:
-            self.pai[raiz_y] = raiz_x
-            self.rank[raiz_x] += 1
 
-        return True
+# arestas de cada processo do Borůvka (definidas pelo inicializador do pool)
+_ARESTAS_BORUVKA = None
+
+
+def _inicializar_boruvka(num_vertices, pesos, origens, destinos):
+    global _ARESTAS_BORUVKA
+    _ARESTAS_BORUVKA = (num_vertices, pesos, origens, destinos)
+
+
+def _aresta_menor(i, j, pesos, origens, destinos):
+    """Compara as arestas i e j pela ordem (peso, origem, destino)"""
+    if pesos[i] != pesos[j]:
+        return pesos[i] < pesos[j]
+    return (origens[i], destinos[i]) < (origens[j], destinos[j])
+
+
+def _menores_arestas_particao(tarefa):
+    """Para cada componente, o índice da aresta mais barata que sai dela dentro da partição"""
+    inicio, fim, componente = tarefa
+    _, pesos, origens, destinos = _ARESTAS_BORUVKA
+
+    menores = {}
+    for i in range(inicio, fim):
+        comp_origem = componente[origens[i]]
+        comp_destino = componente[destinos[i]]
+        if comp_origem == comp_destino:
+            continue
+
+        for comp in (comp_origem, comp_destino):
+            j = menores.get(comp)
+            if j is None or _aresta_menor(i, j, pesos, origens, destinos):
+                menores[comp] = i
+
+    return menores
 
 
 class MST:
@@ -35,56 +65,281 @@ class MST:
         self.arestas_mst = []
         self.peso_total = 0
         self.tempo_execucao = 0
+        self.variante = None
+        self.num_componentes = 0
 
-    def kruskal(self):
-        """Algoritmo de Kruskal para encontrar a Árvore Geradora Mínima"""
-        inicio = time.time()
+    def kruskal(self, variante='auto'):
+        """
+        Algoritmo de Kruskal para encontrar a Árvore Geradora Mínima.
 
-        # Coletar todas as arestas do grafo
-        arestas = []
-        visitadas = set()
-        
-        for origem in range(len(self.grafo.labels)):
-            for aresta in self.grafo.lista_adj[origem]:
-                destino = aresta.destino
-                peso = aresta.peso
-                
-                # Evitar adicionar a mesma aresta duas vezes em grafos não direcionados
-                par = tuple(sorted([origem, destino]))
-                if par not in visitadas:
-                    arestas.append((peso, origem, destino))
-                    visitadas.add(par)
-
-        # Ordenar arestas por peso
-        arestas.sort()
-
-        # Aplicar Union-Find
-        uf = UnionFind(len(self.grafo.labels))
+        variante: 'ordenacao' (ordena todas as arestas), 'filter' (Filter-Kruskal, que
+        particiona as arestas em torno de pivôs e descarta as internas a uma componente
+        antes de ordená-las) ou 'auto', que usa 'filter' em grafos com muitas arestas por
+        vértice, ou 'ordenacao' se as arestas em cache no grafo já estiverem ordenadas.
+        A variante usada fica em self.variante.
+        """
+        inicio = time.perf_counter()
+
+        arestas = self._coletar_arestas()
+        num_vertices = len(self.grafo.labels)
+
+        if variante == 'auto':
+            if self.grafo._arestas_ordenadas:
+                variante = 'ordenacao'
+            elif len(arestas) >= LIMIAR_FILTER_KRUSKAL * num_vertices:
+                variante = 'filter'
+            else:
+                variante = 'ordenacao'
+
+        uf = UnionFind(num_vertices)
         self.arestas_mst = []
         self.peso_total = 0
 
-        for peso, origem, destino in arestas:
+        if variante == 'ordenacao':
+            # a ordenação fica no cache, então as próximas execuções só percorrem a lista
+            arestas.sort()
+            self.grafo._arestas_ordenadas = True
+            self._kruskal_base(arestas, uf)
+        elif variante == 'filter':
+            self._filter_kruskal(arestas, uf)
+        else:
+            raise ValueError(f"Variante de Kruskal desconhecida: {variante}")
+
+        self.variante = variante
+        self.num_componentes = self.grafo.num_vertices_ativos() - len(self.arestas_mst)
+        self.tempo_execucao = time.perf_counter() - inicio
+        return self.peso_total
+
+    def _kruskal_base(self, arestas_ordenadas, uf):
+        num_arestas_arvore = self.grafo.num_vertices_ativos() - 1
+
+        for peso, origem, destino in arestas_ordenadas:
             if uf.union(origem, destino):
                 self.arestas_mst.append((origem, destino, peso))
                 self.peso_total += peso
+                if len(self.arestas_mst) == num_arestas_arvore:
+                    return
+
+    def _filter_kruskal(self, arestas, uf):
+        num_arestas_arvore = self.grafo.num_vertices_ativos() - 1
+
+        # pilha de (arestas, filtrar); as leves de cada partição saem antes das pesadas
+        pilha = [(arestas, False)]
+        while pilha and len(self.arestas_mst) < num_arestas_arvore:
+            arestas, filtrar = pilha.pop()
+
+            if filtrar:
+                find = uf.find
+                arestas = [aresta for aresta in arestas if find(aresta[1]) != find(aresta[2])]
+
+            if len(arestas) <= TAMANHO_BASE_FILTER_KRUSKAL:
+                self._kruskal_base(sorted(arestas), uf)
+                continue
+
+            pivo = random.choice(arestas)[0]
+            leves = [aresta for aresta in arestas if aresta[0] <= pivo]
+            if len(leves) == len(arestas):
+                # todas as arestas com o mesmo peso do pivô ou abaixo dele
+                self._kruskal_base(sorted(arestas), uf)
+                continue
+
+            pilha.append(([aresta for aresta in arestas if aresta[0] > pivo], True))
+            pilha.append((leves, False))
+
+    def _coletar_arestas(self):
+        """
+        Lista (peso, origem, destino) com cada aresta do grafo uma única vez, guardada no
+        próprio grafo para as próximas execuções (o grafo a descarta quando muda).
+        """
+        arestas = self.grafo._arestas_canonicas
+        if arestas is not None:
+            return arestas
+
+        num_vertices = len(self.grafo.labels)
+        vizinhos_ponderados = self.grafo.retornar_vizinhos_ponderados
+        arestas = []
 
-        self.tempo_execucao = time.time() - inicio
+        if not self.grafo.direcionado:
+            # {u, v} aparece nas listas de u e de v: fica a ocorrência na lista da menor ponta;
+            # ultima_origem descarta arestas paralelas (e o laço duplicado) na mesma lista
+            ultima_origem = [-1] * num_vertices
+            for origem in range(num_vertices):
+                for destino, peso in vizinhos_ponderados(origem):
+                    if destino >= origem and ultima_origem[destino] != origem:
+                        ultima_origem[destino] = origem
+                        arestas.append((peso, origem, destino))
+        else:
+            # Evitar adicionar u->v e v->u como duas arestas
+            visitadas = set()
+            for origem in range(num_vertices):
+                for destino, peso in vizinhos_ponderados(origem):
+                    par = origem * num_vertices + destino if origem <= destino else destino * num_vertices + origem
+                    if par not in visitadas:
+                        arestas.append((peso, origem, destino))
+                        visitadas.add(par)
+
+        self.grafo._arestas_canonicas = arestas
+        self.grafo._arestas_ordenadas = False
+        return arestas
+
+    def boruvka(self, num_processos=None):
+        """
+        Algoritmo de Borůvka para encontrar a Árvore Geradora Mínima.
+
+        A cada rodada, a aresta mais barata que sai de cada componente é procurada em
+        paralelo, com as arestas divididas entre num_processos processos (padrão: número
+        de CPUs). Empates são desfeitos por (peso, origem, destino), a mesma ordem do
+        Kruskal, então o resultado é idêntico ao dele.
+        """
+        inicio = time.perf_counter()
+
+        arestas = self._coletar_arestas()
+        num_vertices = len(self.grafo.labels)
+
+        tipo_peso = 'q' if all(isinstance(peso, int) for peso, _, _ in arestas) else 'd'
+        pesos = array(tipo_peso, [peso for peso, _, _ in arestas])
+        origens = array('i', [origem for _, origem, _ in arestas])
+        destinos = array('i', [destino for _, _, destino in arestas])
+
+        if num_processos is None:
+            num_processos = os.cpu_count() or 1
+        num_processos = max(1, min(num_processos, len(arestas) // ARESTAS_POR_PROCESSO_BORUVKA))
+
+        tamanho_particao = -(-len(arestas) // num_processos) if arestas else 0
+        particoes = [(i, min(i + tamanho_particao, len(arestas)))
+                     for i in range(0, len(arestas), tamanho_particao or 1)]
+
+        dados = (num_vertices, pesos, origens, destinos)
+        pool = None
+        if num_processos > 1:
+            pool = multiprocessing.Pool(num_processos, initializer=_inicializar_boruvka, initargs=dados)
+        else:
+            _inicializar_boruvka(*dados)
+
+        uf = UnionFind(num_vertices)
+        componente = array('i', range(num_vertices))
+        self.arestas_mst = []
+        self.peso_total = 0
+
+        try:
+            while True:
+                tarefas = [(inicio_p, fim_p, componente) for inicio_p, fim_p in particoes]
+                if pool is not None:
+                    parciais = pool.map(_menores_arestas_particao, tarefas)
+                else:
+                    parciais = [_menores_arestas_particao(tarefa) for tarefa in tarefas]
+
+                # junta as menores arestas de cada partição
+                menores = {}
+                for parcial in parciais:
+                    for comp, i in parcial.items():
+                        j = menores.get(comp)
+                        if j is None or _aresta_menor(i, j, pesos, origens, destinos):
+                            menores[comp] = i
+
+                if not menores:
+                    break
+
+                # contração: a ordem total das arestas garante que não há ciclos
+                for i in set(menores.values()):
+                    if uf.union(origens[i], destinos[i]):
+                        self.arestas_mst.append((origens[i], destinos[i], pesos[i]))
+                        self.peso_total += pesos[i]
+
+                componente = uf.find_many(range(num_vertices))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            _inicializar_boruvka(0, None, None, None)
+
+        # mesma ordem em que o Kruskal encontra as arestas
+        self.arestas_mst.sort(key=lambda aresta: (aresta[2], aresta[0], aresta[1]))
+        self.num_componentes = self.grafo.num_vertices_ativos() - len(self.arestas_mst)
+
+        self.tempo_execucao = time.perf_counter() - inicio
         return self.peso_total
 
-    def prim(self, vertice_inicial=0):
-        """Algoritmo de Prim para encontrar a Árvore Geradora Mínima"""
-        inicio = time.time()
+    def prim(self, vertice_inicial=0, variante='auto'):
+        """
+        Algoritmo de Prim para encontrar a Árvore Geradora Mínima. Em grafos desconexos,
+        quando a árvore atual não alcança mais nenhum vértice, uma nova começa no primeiro
+        vértice ainda não visitado, e o resultado é a floresta geradora mínima (uma árvore
+        por componente, contadas em self.num_componentes) na mesma passada.
+
+        variante: 'densa' (busca linear O(V²)), 'heap' (heapq com remoção preguiçosa,
+        O(E log V)), 'heap_indexado' (heap d-ário com diminuição de chave) ou 'auto',
+        que escolhe pela densidade do grafo. A variante usada fica em self.variante.
+        """
+        inicio = time.perf_counter()
+
+        if variante == 'auto':
+            variante = 'densa' if self.densidade() >= LIMIAR_PRIM_DENSO else 'heap'
+
+        if variante == 'densa':
+            self._prim_denso(vertice_inicial)
+        elif variante == 'heap':
+            self._prim_heap(vertice_inicial)
+        elif variante == 'heap_indexado':
+            self._prim_heap_indexado(vertice_inicial)
+        else:
+            raise ValueError(f"Variante de Prim desconhecida: {variante}")
+
+        self.variante = variante
+        self.tempo_execucao = time.perf_counter() - inicio
+        return self.peso_total
+
+    def densidade(self):
+        """Fração das V(V-1)/2 arestas possíveis presentes no grafo (sem os vértices removidos)"""
+        num_vertices = self.grafo.num_vertices_ativos()
+        if num_vertices < 2:
+            return 1.0
+
+        num_arestas = sum(len(self.grafo.retornar_vizinhos(v)) for v in self.grafo.vertices_ativos())
+        if not self.grafo.direcionado:
+            num_arestas //= 2
+
+        return num_arestas / (num_vertices * (num_vertices - 1) / 2)
+
+    def arvores(self):
+        """
+        Floresta geradora mínima separada por componente conexa do grafo: lista de
+        (vértices, arestas, peso) por componente, na ordem do menor vértice de cada uma
+        """
+        rotulos, num_componentes = rotular_componentes(self.grafo)
+        arvores = [([], [], 0) for _ in range(num_componentes)]
+        for v, rotulo in enumerate(rotulos):
+            if rotulo != -1:
+                arvores[rotulo][0].append(v)
+        for origem, destino, peso in self.arestas_mst:
+            arvores[rotulos[origem]][1].append((origem, destino, peso))
 
+        return [(vertices, arestas, sum(peso for _, _, peso in arestas)) for vertices, arestas, _ in arvores]
+
+    def _raizes(self, vertice_inicial):
+        """
+        vertice_inicial e depois todos os vértices em ordem, candidatos a raiz de cada
+        árvore; vértices removidos nunca são raiz
+        """
+        ativos = self.grafo.vertices_ativos()
+        if self.grafo.vertice_ativo(vertice_inicial):
+            return chain((vertice_inicial,), ativos)
+        return ativos
+
+    def _prim_denso(self, vertice_inicial):
         num_vertices = len(self.grafo.labels)
-        visitados = [False] * num_vertices
+        # removidos já contam como visitados, então nunca são escolhidos
+        visitados = [label is None for label in self.grafo.labels]
         min_peso = [float('inf')] * num_vertices
         pai = [-1] * num_vertices
 
-        min_peso[vertice_inicial] = 0
+        if self.grafo.vertice_ativo(vertice_inicial):
+            min_peso[vertice_inicial] = 0
         self.arestas_mst = []
         self.peso_total = 0
+        self.num_componentes = 0
 
-        for _ in range(num_vertices):
+        for _ in range(self.grafo.num_vertices_ativos()):
             # Encontrar o vértice não visitado com menor peso
             u = -1
             for v in range(num_vertices):
@@ -92,7 +347,10 @@ class MST:
                     u = v
 
             if min_peso[u] == float('inf'):
-                break
+                # nada mais é alcançável pela árvore atual: u é a raiz da próxima
+                min_peso[u] = 0
+            if pai[u] == -1:
+                self.num_componentes += 1
 
             visitados[u] = True
 
@@ -101,22 +359,246 @@ class MST:
                 self.peso_total += min_peso[u]
 
             # Atualizar os pesos mínimos dos vizinhos
-            for aresta in self.grafo.lista_adj[u]:
-                v = aresta.destino
-                peso = aresta.peso
+            for v, peso in self.grafo.retornar_vizinhos_ponderados(u):
                 if not visitados[v] and peso < min_peso[v]:
                     min_peso[v] = peso
                     pai[v] = u
 
-        self.tempo_execucao = time.time() - inicio
-        return self.peso_total
+    def _prim_heap(self, vertice_inicial):
+        num_vertices = len(self.grafo.labels)
+        visitados = [False] * num_vertices
+        min_peso = [float('inf')] * num_vertices
+
+        self.arestas_mst = []
+        self.peso_total = 0
+        self.num_componentes = 0
+
+        for raiz in self._raizes(vertice_inicial):
+            if visitados[raiz]:
+                continue
+            self.num_componentes += 1
+            min_peso[raiz] = 0
+
+            # entradas obsoletas são descartadas quando saem do heap
+            heap = [(0, raiz, -1)]
+            while heap:
+                peso_u, u, pai_u = heapq.heappop(heap)
+                if visitados[u]:
+                    continue
+
+                visitados[u] = True
+
+                if pai_u != -1:
+                    self.arestas_mst.append((pai_u, u, peso_u))
+                    self.peso_total += peso_u
+
+                for v, peso in self.grafo.retornar_vizinhos_ponderados(u):
+                    if not visitados[v] and peso < min_peso[v]:
+                        min_peso[v] = peso
+                        heapq.heappush(heap, (peso, v, u))
+
+    def _prim_heap_indexado(self, vertice_inicial):
+        num_vertices = len(self.grafo.labels)
+        visitados = [False] * num_vertices
+        pai = [-1] * num_vertices
+
+        self.arestas_mst = []
+        self.peso_total = 0
+        self.num_componentes = 0
+
+        heap = HeapIndexado(num_vertices)
+        for raiz in self._raizes(vertice_inicial):
+            if visitados[raiz]:
+                continue
+            self.num_componentes += 1
+
+            heap.inserir(raiz, 0)
+            while heap:
+                u, peso_u = heap.extrair_minimo()
+                visitados[u] = True
+
+                if pai[u] != -1:
+                    self.arestas_mst.append((pai[u], u, peso_u))
+                    self.peso_total += peso_u
+
+                for v, peso in self.grafo.retornar_vizinhos_ponderados(u):
+                    if not visitados[v] and heap.inserir_ou_diminuir(v, peso):
+                        pai[v] = u
 
     def imprimir_resultado(self, mostrar_arestas=False):
+        if self.variante:
+            print(f"Variante: {self.variante}")
         print(f"Tempo de execução: {self.tempo_execucao:.6f} segundos")
         print(f"Peso total da MST: {self.peso_total}")
         print(f"Número de arestas na MST: {len(self.arestas_mst)}")
+        if self.num_componentes > 1:
+            print(f"Grafo desconexo: floresta com {self.num_componentes} árvores")
 
         if mostrar_arestas:
             print("\nArestas da MST:")
             for origem, destino, peso in self.arestas_mst:
                 print(f"  {self.grafo.label_vertice(origem)} -- {self.grafo.label_vertice(destino)} (peso: {peso})")
+
+
+class MSTDinamica(MST):
+    """
+    Árvore (floresta) geradora mínima mantida sob inserções e remoções de arestas em
+    grafos não direcionados, sem recalcular tudo a cada mudança.
+
+    Inserção: se a nova aresta fecha um ciclo na árvore, ela substitui a aresta mais
+    pesada do ciclo quando for mais leve (propriedade do ciclo). Remoção de uma aresta
+    da árvore: procura a aresta mais leve que reconecta os dois lados, varrendo só as
+    arestas do lado menor. Empates seguem a ordem (peso, origem, destino) do Kruskal,
+    então o resultado é sempre igual ao de um Kruskal do zero.
+
+    Em grafos que trocam o peso de uma aresta reinserida (arestas_paralelas ==
+    'substituir', como o GrafoMatriz), reinserir é tratado como remover e inserir de novo.
+    """
+
+    def __init__(self, grafo):
+        if grafo.direcionado:
+            raise ValueError("MSTDinamica só suporta grafos não direcionados")
+
+        super().__init__(grafo)
+        self.kruskal()
+
+        # arestas da árvore por vértice (vizinho -> peso) e chaves ordenadas como no Kruskal
+        self._arvore = [{} for _ in self.grafo.labels]
+        self._chaves = []
+        for origem, destino, peso in self.arestas_mst:
+            self._arvore[origem][destino] = peso
+            self._arvore[destino][origem] = peso
+            self._chaves.append((peso, origem, destino))
+
+    def inserir_aresta(self, origem, destino, peso=1):
+        """Insere a aresta no grafo e atualiza a MST"""
+        inicio = time.perf_counter()
+
+        # a primeira de várias arestas paralelas é a que o Kruskal considera
+        paralela = origem < len(self.grafo.labels) and destino < len(self.grafo.labels) \
+            and self.grafo.existe_aresta(origem, destino)
+        if paralela and self.grafo.arestas_paralelas == 'substituir':
+            # o grafo trocaria o peso da aresta em silêncio, e ela pode estar na árvore
+            self.remover_aresta(origem, destino)
+            self.inserir_aresta(origem, destino, peso)
+            self.tempo_execucao = time.perf_counter() - inicio
+            return True
+        if not self.grafo.inserir_aresta(origem, destino, peso):
+            return False
+
+        self._acompanhar_vertices()
+
+        if not paralela and origem != destino:
+            chave = (peso, min(origem, destino), max(origem, destino))
+            caminho = self._caminho_na_arvore(origem, destino)
+
+            if caminho is None:
+                self._adicionar_na_arvore(chave)
+            else:
+                mais_pesada = max((self._arvore[a][b], min(a, b), max(a, b)) for a, b in caminho)
+                if chave < mais_pesada:
+                    self._remover_da_arvore(mais_pesada)
+                    self._adicionar_na_arvore(chave)
+
+        self._atualizar_arestas_mst()
+        self.tempo_execucao = time.perf_counter() - inicio
+        return True
+
+    def remover_aresta(self, origem, destino):
+        """Remove a aresta (e as paralelas a ela) do grafo e atualiza a MST"""
+        inicio = time.perf_counter()
+
+        if not self.grafo.remover_aresta(origem, destino):
+            return False
+
+        self._acompanhar_vertices()
+        if destino in self._arvore[origem]:
+            self._remover_da_arvore((self._arvore[origem][destino], min(origem, destino), max(origem, destino)))
+
+            lado = self._lado_menor(origem, destino)
+            substituta = self._aresta_de_reconexao(lado)
+            if substituta is not None:
+                self._adicionar_na_arvore(substituta)
+
+        self._atualizar_arestas_mst()
+        self.tempo_execucao = time.perf_counter() - inicio
+        return True
+
+    def _acompanhar_vertices(self):
+        # vértices inseridos no grafo depois da construção entram sem arestas na árvore
+        while len(self._arvore) < len(self.grafo.labels):
+            self._arvore.append({})
+
+    def _adicionar_na_arvore(self, chave):
+        peso, origem, destino = chave
+        self._arvore[origem][destino] = peso
+        self._arvore[destino][origem] = peso
+        bisect.insort(self._chaves, chave)
+        self.peso_total += peso
+
+    def _remover_da_arvore(self, chave):
+        peso, origem, destino = chave
+        del self._arvore[origem][destino]
+        del self._arvore[destino][origem]
+        del self._chaves[bisect.bisect_left(self._chaves, chave)]
+        self.peso_total -= peso
+
+    def _atualizar_arestas_mst(self):
+        self.arestas_mst = [(origem, destino, peso) for peso, origem, destino in self._chaves]
+        self.num_componentes = self.grafo.num_vertices_ativos() - len(self.arestas_mst)
+
+    def _caminho_na_arvore(self, origem, destino):
+        """Arestas (a, b) do caminho entre origem e destino na árvore, ou None se não há caminho"""
+        pai = {origem: None}
+        fila = deque([origem])
+        while fila and destino not in pai:
+            u = fila.popleft()
+            for v in self._arvore[u]:
+                if v not in pai:
+                    pai[v] = u
+                    fila.append(v)
+
+        if destino not in pai:
+            return None
+
+        caminho = []
+        v = destino
+        while pai[v] is not None:
+            caminho.append((pai[v], v))
+            v = pai[v]
+        return caminho
+
+    def _lado_menor(self, a, b):
+        """Vértices do menor dos dois pedaços da árvore, contendo a e b, após um corte"""
+        lados = [{a}, {b}]
+        filas = [deque([a]), deque([b])]
+
+        # as duas buscas avançam alternadamente; a primeira que termina é a do lado menor
+        while True:
+            for i in (0, 1):
+                if not filas[i]:
+                    return lados[i]
+                u = filas[i].popleft()
+                for v in self._arvore[u]:
+                    if v not in lados[i]:
+                        lados[i].add(v)
+                        filas[i].append(v)
+
+    def _aresta_de_reconexao(self, lado):
+        """Menor chave (peso, origem, destino) entre as arestas que saem de lado"""
+        melhor = None
+        for u in lado:
+            vistos = set()
+            for v, peso in self.grafo.retornar_vizinhos_ponderados(u):
+                # só a primeira de arestas paralelas conta
+                if v in vistos:
+                    continue
+                vistos.add(v)
+                if v in lado:
+                    continue
+
+                chave = (peso, min(u, v), max(u, v))
+                if melhor is None or chave < melhor:
+                    melhor = chave
+
+        return melhor
@@ -0,0 +1,129 @@
+import random
+from collections import deque
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from busca_profundidade import busca_em_profundidade, percorrer_em_profundidade
+from busca_largura import busca_em_largura, busca_em_largura_direcional, mascaras_adjacencia
+
+BACKENDS = [GrafoLista, GrafoMatriz]
+
+
+def aleatorio(classe, semente, arestas_por_vertice=3):
+    gerador = random.Random(semente)
+    num_vertices = gerador.randint(1, 40)
+    grafo = classe(direcionado=semente % 2 == 0, ponderado=False)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for _ in range(gerador.randint(0, arestas_por_vertice * num_vertices)):
+        grafo.inserir_aresta(gerador.randrange(num_vertices), gerador.randrange(num_vertices))
+    return grafo, gerador
+
+
+def profundidade_recursiva(grafo, inicio, destino=None):
+    visitados = [False] * len(grafo.labels)
+    ordem = []
+
+    def visitar(vertice):
+        visitados[vertice] = True
+        ordem.append(vertice)
+        if vertice == destino:
+            return True
+        return any(visitar(vizinho) for vizinho in grafo.retornar_vizinhos(vertice) if not visitados[vizinho])
+
+    visitar(inicio)
+    return ordem
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_profundidade_igual_a_recursiva(classe):
+    for semente in range(150):
+        grafo, gerador = aleatorio(classe, semente)
+        num_vertices = len(grafo.labels)
+        inicio = gerador.randrange(num_vertices)
+
+        assert busca_em_profundidade(grafo, inicio) == profundidade_recursiva(grafo, inicio), semente
+        # com destino, para logo depois de visitá-lo
+        destino = gerador.randrange(num_vertices)
+        ordem = busca_em_profundidade(grafo, inicio, destino)
+        assert ordem == profundidade_recursiva(grafo, inicio, destino), semente
+        if destino in ordem:
+            assert ordem[-1] == destino
+
+
+def test_profundidade_em_caminho_longo():
+    grafo = GrafoLista(direcionado=False, ponderado=False)
+    num_vertices = 100000
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for i in range(num_vertices - 1):
+        grafo.inserir_aresta(i, i + 1)
+
+    assert busca_em_profundidade(grafo, 0) == list(range(num_vertices))
+    assert busca_em_profundidade(grafo, 0, 10) == list(range(11))
+
+    # o gerador pode ser interrompido a qualquer momento
+    visita = percorrer_em_profundidade(grafo, num_vertices - 1)
+    assert [next(visita) for _ in range(3)] == [num_vertices - 1, num_vertices - 2, num_vertices - 3]
+
+
+class _ContaAcessos(list):
+    """Lista que conta as leituras: as máscaras de entrada só são lidas no passo bottom-up"""
+    acessos = 0
+
+    def __getitem__(self, indice):
+        self.acessos += 1
+        return super().__getitem__(indice)
+
+
+def niveis_por_fila(grafo, inicio):
+    niveis = [float('inf')] * len(grafo.labels)
+    niveis[inicio] = 0
+    fila = deque([inicio])
+    while fila:
+        vertice = fila.popleft()
+        for vizinho in grafo.retornar_vizinhos(vertice):
+            if niveis[vizinho] == float('inf'):
+                niveis[vizinho] = niveis[vertice] + 1
+                fila.append(vizinho)
+    return niveis
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+@pytest.mark.parametrize("arestas_por_vertice", [1, 3, 20])
+def test_largura_direcional_igual_a_largura(classe, arestas_por_vertice):
+    acessos_bottom_up = 0
+    for semente in range(150):
+        grafo, gerador = aleatorio(classe, semente, arestas_por_vertice)
+        num_vertices = len(grafo.labels)
+        inicio = gerador.randrange(num_vertices)
+        referencia = niveis_por_fila(grafo, inicio)
+        alcancados = busca_em_largura(grafo, inicio)
+        assert sorted(alcancados) == [v for v in range(num_vertices) if referencia[v] != float('inf')]
+        # a ordem da BFS comum é não decrescente em nível
+        assert [referencia[v] for v in alcancados] == sorted(referencia[v] for v in alcancados)
+
+        saida, entrada, graus = mascaras_adjacencia(grafo)
+        entrada = _ContaAcessos(entrada)
+        niveis, caminhos = busca_em_largura_direcional(grafo, inicio, mascaras=(saida, entrada, graus))
+        acessos_bottom_up += entrada.acessos
+        assert niveis == referencia, semente
+
+        for v in range(num_vertices):
+            if niveis[v] == float('inf'):
+                assert caminhos.caminho(v) == []
+                continue
+            if v != inicio:
+                # o pai está no nível anterior e tem aresta até v
+                pai = caminhos.anteriores[v]
+                assert niveis[pai] == niveis[v] - 1 and v in grafo.retornar_vizinhos(pai)
+            caminho = caminhos.caminho(v)
+            assert caminho[0] == inicio and caminho[-1] == v and len(caminho) == niveis[v] + 1
+
+        destino = gerador.randrange(num_vertices)
+        assert busca_em_largura_direcional(grafo, inicio, destino)[0][destino] == referencia[destino]
+
+    if arestas_por_vertice == 20:
+        assert acessos_bottom_up > 0
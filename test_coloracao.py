@@ -0,0 +1,140 @@
+import random
+from itertools import product
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+import coloracao_grafos
+from coloracao_grafos import ColoracaoGrafos, _colorir_em_ordem, _dsatur
+
+BACKENDS = [GrafoLista, GrafoMatriz]
+
+
+def montar(classe, arestas, num_vertices, direcionado=False):
+    grafo = classe(direcionado=direcionado, ponderado=False)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for origem, destino in arestas:
+        grafo.inserir_aresta(origem, destino)
+    return grafo
+
+
+def aleatorio(classe, semente, num_vertices, densidade, direcionado=False):
+    gerador = random.Random(semente)
+    arestas = [(u, v) for u in range(num_vertices) for v in range(num_vertices)
+               if u != v and (direcionado or u < v) and gerador.random() < densidade]
+    return montar(classe, arestas, num_vertices, direcionado)
+
+
+def valida_sem_direcao(grafo, cores):
+    return all(cores[u] != cores[v] for u in cores for v in grafo.retornar_vizinhos(u) if u != v)
+
+
+def numero_cromatico(grafo):
+    """Enumeração de todas as colorações, só para grafos bem pequenos"""
+    num_vertices = len(grafo.labels)
+    arestas = [(u, v) for u in range(num_vertices) for v in grafo.retornar_vizinhos(u) if u != v]
+    for k in range(1, num_vertices + 1):
+        for cores in product(range(k), repeat=num_vertices):
+            if all(cores[u] != cores[v] for u, v in arestas):
+                return k
+    return 0
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_branch_and_bound_em_ciclo_direcionado(classe):
+    # só pelos vizinhos de saída o DSATUR repetiria a cor de 0 em 2
+    grafo = montar(classe, [(0, 1), (1, 2), (2, 0)], 3, direcionado=True)
+
+    coloracao = ColoracaoGrafos(grafo)
+    assert coloracao.branch_and_bound() == 3
+    assert coloracao.otima
+    assert valida_sem_direcao(grafo, coloracao.cores)
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_tabucol_em_grafo_direcionado(classe):
+    grafo = aleatorio(classe, 7, 30, 0.2, direcionado=True)
+
+    coloracao = ColoracaoGrafos(grafo)
+    coloracao.dsatur()  # inválida na vizinhança sem direção
+    num_cores = coloracao.tabucol(limite_tempo=0.5, semente=1)
+    assert valida_sem_direcao(grafo, coloracao.cores)
+    assert num_cores == max(coloracao.cores.values()) + 1
+
+
+def test_branch_and_bound_igual_a_enumeracao():
+    for semente in range(60):
+        direcionado = semente % 3 == 0
+        grafo = aleatorio(GrafoLista, semente, 2 + semente % 6, 0.5, direcionado)
+
+        coloracao = ColoracaoGrafos(grafo)
+        assert coloracao.branch_and_bound() == numero_cromatico(grafo), semente
+        assert coloracao.otima
+        assert valida_sem_direcao(grafo, coloracao.cores)
+
+
+@pytest.mark.parametrize("classe", BACKENDS + [GrafoCSR])
+@pytest.mark.parametrize("prioridade", ["aleatoria", "grau"])
+@pytest.mark.parametrize("num_processos", [1, 2])
+def test_jones_plassmann_igual_ao_guloso_na_ordem_das_prioridades(classe, prioridade, num_processos, monkeypatch):
+    # sem isso os grafos pequenos nunca chegam ao pool
+    monkeypatch.setattr(coloracao_grafos, "ARESTAS_POR_PROCESSO_JP", 1)
+
+    for semente in range(5):
+        grafo = aleatorio(classe, semente, 40 + 10 * semente, 0.15)
+        num_vertices = len(grafo.labels)
+
+        coloracao = ColoracaoGrafos(grafo)
+        num_cores = coloracao.jones_plassmann(num_processos=num_processos, semente=semente, prioridade=prioridade)
+        assert valida_sem_direcao(grafo, coloracao.cores)
+
+        ordem = list(range(num_vertices))
+        random.Random(semente).shuffle(ordem)
+        if prioridade == "grau":
+            ordem.sort(key=lambda v: len(grafo.retornar_vizinhos(v)), reverse=True)
+        vizinhos = [[u for u in grafo.retornar_vizinhos(v) if u != v] for v in range(num_vertices)]
+        cores, num_cores_guloso = _colorir_em_ordem(ordem, vizinhos)
+        assert num_cores == num_cores_guloso
+        assert [coloracao.cores[v] for v in range(num_vertices)] == cores
+
+
+def dsatur_simples(vertices, vizinhos):
+    """DSATUR por busca linear, com o mesmo desempate (saturação, grau, menor índice)"""
+    cores = [-1] * len(vizinhos)
+    for _ in vertices:
+        def prioridade(v):
+            saturacao = len({cores[u] for u in vizinhos[v] if cores[u] != -1})
+            return (saturacao, len(vizinhos[v]), -v)
+        vertice = max((v for v in vertices if cores[v] == -1), key=prioridade)
+        usadas = {cores[u] for u in vizinhos[vertice]}
+        cores[vertice] = next(cor for cor in range(len(vizinhos) + 1) if cor not in usadas)
+    return cores, max(cores, default=-1) + 1
+
+
+def test_dsatur_igual_a_referencia():
+    for semente in range(150):
+        gerador = random.Random(semente)
+        num_vertices = gerador.randint(1, 50)
+        densidade = gerador.choice([0.05, 0.2, 0.5, 0.9])
+        vizinhos = [[] for _ in range(num_vertices)]
+        for u in range(num_vertices):
+            for v in range(u + 1, num_vertices):
+                if gerador.random() < densidade:
+                    vizinhos[u].append(v)
+                    vizinhos[v].append(u)
+        # às vezes só parte dos vértices, como quando há removidos (sem arestas)
+        vertices = list(range(num_vertices))
+        if semente % 3 == 0:
+            for v in gerador.sample(vertices, num_vertices // 4):
+                for u in vizinhos[v]:
+                    vizinhos[u].remove(v)
+                vizinhos[v] = []
+                vertices.remove(v)
+
+        cores, num_cores = _dsatur(vertices, vizinhos)
+        assert (cores, num_cores) == dsatur_simples(vertices, vizinhos), semente
+        assert all(cores[u] != cores[v] for u in vertices for v in vizinhos[u])
+        assert all(cores[v] == -1 for v in range(num_vertices) if v not in vertices)
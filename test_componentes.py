@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from mst import MST
+from componentes import (rotular_componentes, componentes_conexas, componentes_fortemente_conexas,
+                         ordenacao_topologica)
+
+BACKENDS = [GrafoLista, GrafoMatriz]
+
+
+def aleatorio(classe, semente, direcionado):
+    gerador = random.Random(semente)
+    num_vertices = gerador.randint(1, 30)
+    grafo = classe(direcionado=direcionado, ponderado=True)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for _ in range(gerador.randint(0, 2 * num_vertices)):
+        origem, destino = gerador.randrange(num_vertices), gerador.randrange(num_vertices)
+        if not grafo.existe_aresta(origem, destino):
+            grafo.inserir_aresta(origem, destino, gerador.randint(1, 9))
+    return grafo
+
+
+def alcancaveis(grafo, inicio):
+    vistos = {inicio}
+    pilha = [inicio]
+    while pilha:
+        vertice = pilha.pop()
+        for vizinho in grafo.retornar_vizinhos(vertice):
+            if vizinho not in vistos:
+                vistos.add(vizinho)
+                pilha.append(vizinho)
+    return vistos
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_componentes_iguais_ao_alcance(classe):
+    for semente in range(100):
+        grafo = aleatorio(classe, semente, direcionado=False)
+        num_vertices = len(grafo.labels)
+        alcance = [alcancaveis(grafo, v) for v in range(num_vertices)]
+
+        rotulos, num_componentes = rotular_componentes(grafo)
+        for u in range(num_vertices):
+            for v in range(num_vertices):
+                assert (rotulos[u] == rotulos[v]) == (v in alcance[u]), semente
+        assert len(componentes_conexas(grafo)) == num_componentes
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_fortemente_conexas_e_ordem_topologica(classe):
+    for semente in range(100):
+        grafo = aleatorio(classe, semente, direcionado=True)
+        num_vertices = len(grafo.labels)
+        alcance = [alcancaveis(grafo, v) for v in range(num_vertices)]
+
+        componentes = componentes_fortemente_conexas(grafo)
+        assert sorted(v for componente in componentes for v in componente) == list(range(num_vertices))
+        posicao = {v: i for i, componente in enumerate(componentes) for v in componente}
+        for u in range(num_vertices):
+            for v in range(num_vertices):
+                mesma = posicao[u] == posicao[v]
+                assert mesma == (v in alcance[u] and u in alcance[v]), semente
+            # componentes saem em ordem topológica
+            for v in grafo.retornar_vizinhos(u):
+                assert posicao[u] <= posicao[v]
+
+        aciclico = len(componentes) == num_vertices and not any(
+            u in grafo.retornar_vizinhos(u) for u in range(num_vertices))
+        if aciclico:
+            ordem = {v: i for i, v in enumerate(ordenacao_topologica(grafo))}
+            assert all(ordem[u] < ordem[v] for u in range(num_vertices) for v in grafo.retornar_vizinhos(u))
+        else:
+            with pytest.raises(ValueError):
+                ordenacao_topologica(grafo)
+
+
+def test_fortemente_conexas_sem_recursao():
+    grafo = GrafoLista(direcionado=True, ponderado=False)
+    num_vertices = 20000
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for i in range(num_vertices):
+        grafo.inserir_aresta(i, (i + 1) % num_vertices)
+
+    assert [sorted(componente) for componente in componentes_fortemente_conexas(grafo)] == [list(range(num_vertices))]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_florestas_geradoras_concordam(classe):
+    for semente in range(100):
+        grafo = aleatorio(classe, semente, direcionado=False)
+        num_vertices = len(grafo.labels)
+        _, num_componentes = rotular_componentes(grafo)
+
+        pesos = set()
+        for variante in ("densa", "heap", "heap_indexado"):
+            mst = MST(grafo)
+            pesos.add(mst.prim(semente % num_vertices, variante))
+            assert mst.num_componentes == num_componentes, (semente, variante)
+        for algoritmo in ("kruskal", "boruvka"):
+            mst = MST(grafo)
+            pesos.add(getattr(mst, algoritmo)())
+            assert mst.num_componentes == num_componentes, (semente, algoritmo)
+        assert len(pesos) == 1, semente
+
+        arvores = mst.arvores()
+        assert len(arvores) == num_componentes
+        assert sum(peso for _, _, peso in arvores) == pesos.pop()
+        assert all(len(arestas) == len(vertices) - 1 for vertices, arestas, _ in arvores)
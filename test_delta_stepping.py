@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+from dijkstra import dijkstra
+import delta_stepping as modulo
+from delta_stepping import delta_stepping
+
+BACKENDS = [GrafoLista, GrafoMatriz, GrafoCSR]
+
+
+def aleatorio(classe, semente):
+    gerador = random.Random(semente)
+    num_vertices = gerador.randint(1, 40)
+    grafo = classe(direcionado=semente % 2 == 0, ponderado=True)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for _ in range(gerador.randint(0, 4 * num_vertices)):
+        origem, destino = gerador.randrange(num_vertices), gerador.randrange(num_vertices)
+        if origem != destino:
+            grafo.inserir_aresta(origem, destino, gerador.randint(1, 20))
+    return grafo, gerador.randrange(num_vertices)
+
+
+def custo(grafo, caminho):
+    return sum(min(peso for vizinho, peso in grafo.retornar_vizinhos_ponderados(origem) if vizinho == destino)
+               for origem, destino in zip(caminho, caminho[1:]))
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+@pytest.mark.parametrize("delta", [None, 0.5, 3, 50])
+@pytest.mark.parametrize("num_processos", [1, 2])
+def test_delta_stepping_igual_ao_dijkstra(classe, delta, num_processos, monkeypatch):
+    # tarefas pequenas para que os grafos de teste passem pelo pool
+    monkeypatch.setattr(modulo, "VERTICES_POR_TAREFA_DELTA", 2)
+
+    for semente in range(20):
+        grafo, inicio = aleatorio(classe, semente)
+        referencia = dijkstra(grafo, inicio)[0]
+
+        distancias, caminhos = delta_stepping(grafo, inicio, delta, num_processos)
+        assert distancias == referencia, semente
+        for destino, distancia in enumerate(distancias):
+            caminho = caminhos.caminho(destino)
+            if distancia == float('inf'):
+                assert caminho == []
+            else:
+                assert caminho[0] == inicio and caminho[-1] == destino
+                assert custo(grafo, caminho) == distancia
+
+
+def test_delta_invalido():
+    grafo, inicio = aleatorio(GrafoLista, 1)
+    with pytest.raises(ValueError):
+        delta_stepping(grafo, inicio, 0, 1)
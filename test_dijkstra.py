@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+from dijkstra import dijkstra, dijkstra_bidirecional, a_estrela, Landmarks, adjacencia_reversa
+
+BACKENDS = [GrafoLista, GrafoMatriz, GrafoCSR]
+INFINITO = float('inf')
+
+
+def aleatorio(classe, semente):
+    """Grafo com até 25 vértices e pesos de 1 a 20; no GrafoLista podem sair arestas paralelas"""
+    gerador = random.Random(semente)
+    num_vertices = gerador.randint(1, 25)
+    grafo = classe(direcionado=semente % 2 == 0, ponderado=True)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for _ in range(gerador.randint(0, 70)):
+        origem, destino = gerador.randrange(num_vertices), gerador.randrange(num_vertices)
+        if origem != destino:
+            grafo.inserir_aresta(origem, destino, gerador.randint(1, 20))
+    return grafo, gerador
+
+
+def bellman_ford(grafo, inicio):
+    num_vertices = len(grafo.labels)
+    distancias = [INFINITO] * num_vertices
+    distancias[inicio] = 0
+    for _ in range(num_vertices):
+        for origem in range(num_vertices):
+            for destino, peso in grafo.retornar_vizinhos_ponderados(origem):
+                distancias[destino] = min(distancias[destino], distancias[origem] + peso)
+    return distancias
+
+
+def custo(grafo, caminho):
+    return sum(min(peso for vizinho, peso in grafo.retornar_vizinhos_ponderados(origem) if vizinho == destino)
+               for origem, destino in zip(caminho, caminho[1:]))
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_dijkstra_igual_a_bellman_ford(classe):
+    for semente in range(100):
+        grafo, gerador = aleatorio(classe, semente)
+        inicio = gerador.randrange(len(grafo.labels))
+        referencia = bellman_ford(grafo, inicio)
+
+        distancias, caminhos = dijkstra(grafo, inicio)
+        assert distancias == referencia, semente
+        for destino, distancia, caminho in caminhos:
+            if referencia[destino] == INFINITO:
+                assert (distancia, caminho) == ("Inacessível", [])
+            else:
+                assert caminho[0] == inicio and caminho[-1] == destino
+                assert custo(grafo, caminho) == distancia == referencia[destino]
+
+        # parando no destino, a distância dele já é final
+        for destino in range(len(grafo.labels)):
+            distancias, caminhos = dijkstra(grafo, inicio, destino)
+            assert distancias[destino] == referencia[destino]
+            if referencia[destino] != INFINITO:
+                assert custo(grafo, caminhos.caminho(destino)) == referencia[destino]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_consultas_ponto_a_ponto_iguais_ao_dijkstra(classe):
+    for semente in range(100):
+        grafo, gerador = aleatorio(classe, semente)
+        num_vertices = len(grafo.labels)
+        landmarks = Landmarks(grafo, gerador.randint(1, 4), semente=semente)
+        reversa = adjacencia_reversa(grafo) if grafo.direcionado else None
+        referencia = [bellman_ford(grafo, v) for v in range(num_vertices)]
+
+        for _ in range(5):
+            inicio, destino = gerador.randrange(num_vertices), gerador.randrange(num_vertices)
+            esperada = referencia[inicio][destino]
+            consultas = (dijkstra_bidirecional(grafo, inicio, destino),
+                         dijkstra_bidirecional(grafo, inicio, destino, reversa),
+                         a_estrela(grafo, inicio, destino),
+                         a_estrela(grafo, inicio, destino, landmarks))
+            for distancia, caminho, _ in consultas:
+                if esperada == INFINITO:
+                    assert (distancia, caminho) == ("Inacessível", []), semente
+                else:
+                    assert distancia == esperada, semente
+                    assert caminho[0] == inicio and caminho[-1] == destino
+                    assert custo(grafo, caminho) == esperada
+
+        # o limite do ALT nunca passa da distância real
+        for vertice in range(num_vertices):
+            for destino in range(num_vertices):
+                assert landmarks(vertice, destino) <= referencia[vertice][destino]
@@ -0,0 +1,63 @@
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+from mst import MST
+
+ARESTAS = [(0, 1, 4), (1, 2, 2), (2, 3, 5), (3, 0, 1), (1, 3, 7)]
+
+
+def montar(classe, arestas=ARESTAS, num_vertices=4):
+    grafo = classe(direcionado=False, ponderado=True)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for origem, destino, peso in arestas:
+        grafo.inserir_aresta(origem, destino, peso)
+    return grafo
+
+
+def test_consulta_antes_de_congelar():
+    grafo = montar(GrafoCSR)
+    assert not grafo.congelado
+
+    # a primeira consulta congela, em vez de ler os buffers ainda vazios
+    assert grafo.retornar_vizinhos(1) == [0, 2, 3]
+    assert grafo.congelado
+    assert not grafo.inserir_aresta(0, 2, 1)
+
+    for consulta in (lambda g: g.peso_aresta(3, 1), lambda g: g.existe_aresta(0, 2),
+                     lambda g: len(g.lista_adj[2]),
+                     lambda g: sorted(g.retornar_vizinhos_ponderados(0))):
+        assert consulta(montar(GrafoCSR)) == consulta(montar(GrafoLista))
+
+    assert montar(GrafoCSR).num_arestas() == 2 * len(ARESTAS)
+    assert MST(montar(GrafoCSR)).kruskal() == MST(montar(GrafoLista)).kruskal() == 7
+
+
+@pytest.mark.parametrize("classe", [GrafoLista, GrafoMatriz])
+def test_de_grafo_copia_os_pesos_de_cada_aresta(classe):
+    # no GrafoLista a aresta 0-1 é paralela (pesos 4 e 9); a matriz guarda só o último
+    grafo = montar(classe, ARESTAS + [(0, 1, 9)])
+    csr = GrafoCSR.de_grafo(grafo)
+
+    for vertice in range(4):
+        assert csr.retornar_vizinhos(vertice) == grafo.retornar_vizinhos(vertice)
+        assert sorted(csr.retornar_vizinhos_ponderados(vertice)) == sorted(grafo.retornar_vizinhos_ponderados(vertice))
+    assert MST(csr).kruskal() == MST(grafo).kruskal()
+
+
+def test_vizinhos_em_lista_tambem_sobre_o_cache(tmp_path):
+    caminho = tmp_path / "k5.txt"
+    caminho.write_text(open("arquivos_m2/coloracao/k5.txt", encoding="utf-8").read(), encoding="utf-8")
+    referencia = GrafoLista(direcionado=False, ponderado=False)
+    referencia.ler_arquivo(str(caminho), usar_cache=False)
+
+    # a segunda leitura mapeia o cache binário, e os buffers viram memoryviews
+    for _ in range(2):
+        grafo = GrafoCSR(direcionado=False, ponderado=False)
+        grafo.ler_arquivo(str(caminho))
+        for vertice in range(len(grafo.labels)):
+            vizinhos = grafo.retornar_vizinhos(vertice)
+            assert isinstance(vizinhos, list)
+            assert vizinhos == referencia.retornar_vizinhos(vertice)
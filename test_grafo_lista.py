@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from grafo_lista import GrafoLista
+
+NUM_VERTICES = 12
+
+
+def conferir(grafo, referencia):
+    # inclui destinos fora do intervalo, que devem dar False/0 como sem remoções
+    pares = [(u, v) for u in range(NUM_VERTICES) for v in list(range(NUM_VERTICES)) + [NUM_VERTICES, 50]]
+    existem = [bool(referencia.get(par)) for par in pares]
+    pesos = [referencia[par][0] if referencia.get(par) else 0 for par in pares]
+
+    assert [grafo.existe_aresta(u, v) for u, v in pares] == existem
+    assert [grafo.peso_aresta(u, v) for u, v in pares] == pesos
+    assert grafo.existem_arestas(pares) == existem
+    assert grafo.pesos_arestas(pares) == pesos
+
+
+@pytest.mark.parametrize("politica", ["permitir", "ignorar", "substituir"])
+@pytest.mark.parametrize("indexar", [False, True])
+@pytest.mark.parametrize("direcionado", [False, True])
+def test_politicas_contra_dicionario(politica, indexar, direcionado):
+    gerador = random.Random(f"{politica}-{indexar}-{direcionado}")
+    grafo = GrafoLista(direcionado, True, indexar=indexar, arestas_paralelas=politica)
+    for i in range(NUM_VERTICES):
+        grafo.inserir_vertice(str(i))
+
+    # (origem, destino) -> pesos das arestas paralelas, na ordem de inserção
+    referencia = {}
+    removidos = set()
+
+    for passo in range(400):
+        origem, destino = gerador.sample(range(NUM_VERTICES), 2)
+        sentidos = [(origem, destino)] if direcionado else [(origem, destino), (destino, origem)]
+        sorteio = gerador.random()
+
+        if sorteio < 0.6:
+            peso = gerador.randint(1, 9)
+            existe = bool(referencia.get((origem, destino)))
+            if removidos & {origem, destino} or (existe and politica == "ignorar"):
+                assert not grafo.inserir_aresta(origem, destino, peso)
+                continue
+            assert grafo.inserir_aresta(origem, destino, peso)
+            for par in sentidos:
+                if existe and politica == "substituir":
+                    referencia[par] = [peso] * len(referencia[par])
+                else:
+                    referencia.setdefault(par, []).append(peso)
+        elif sorteio < 0.99 or len(removidos) == 3:
+            grafo.remover_aresta(origem, destino)
+            for par in sentidos:
+                referencia.pop(par, None)
+        else:
+            # no máximo 3 de 12, abaixo do limiar de compactação: os índices não mudam
+            assert grafo.remover_vertice(str(origem)) != (origem in removidos)
+            removidos.add(origem)
+            referencia = {par: pesos for par, pesos in referencia.items() if origem not in par}
+
+        conferir(grafo, referencia)
+
+    assert grafo._removidos == len(removidos)
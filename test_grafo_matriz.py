@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from grafo_matriz import GrafoMatriz, LinhaBits
+
+
+def test_bits_so_sem_pesos():
+    with pytest.raises(ValueError):
+        GrafoMatriz(direcionado=False, ponderado=True, bits=True)
+
+
+@pytest.mark.parametrize("direcionado", [False, True])
+def test_bits_igual_a_matriz_comum(direcionado):
+    gerador = random.Random(int(direcionado))
+    bits = GrafoMatriz(direcionado, False, bits=True)
+    comum = GrafoMatriz(direcionado, False)
+    proximo_label = 0
+
+    for passo in range(600):
+        sorteio = gerador.random()
+        num_vertices = len(comum.labels)
+        if sorteio < 0.05 or num_vertices < 2:
+            for grafo in (bits, comum):
+                assert grafo.inserir_vertice(str(proximo_label))
+            proximo_label += 1
+        elif sorteio < 0.08:
+            label = gerador.choice([label for label in comum.labels if label is not None])
+            for grafo in (bits, comum):
+                assert grafo.remover_vertice(label)
+        else:
+            origem, destino = gerador.randrange(num_vertices), gerador.randrange(num_vertices)
+            if sorteio < 0.7:
+                assert bits.inserir_aresta(origem, destino) == comum.inserir_aresta(origem, destino)
+            else:
+                assert bits.remover_aresta(origem, destino) == comum.remover_aresta(origem, destino)
+
+        assert bits.labels == comum.labels
+        assert all(isinstance(linha, LinhaBits) for linha in bits.matriz_adj)
+        for u in range(len(comum.labels)):
+            assert bits.retornar_vizinhos(u) == comum.retornar_vizinhos(u)
+            assert bits.retornar_vizinhos_ponderados(u) == comum.retornar_vizinhos_ponderados(u)
+            for v in range(len(comum.labels)):
+                assert bits.existe_aresta(u, v) == comum.existe_aresta(u, v)
+                assert bits.peso_aresta(u, v) == comum.peso_aresta(u, v)
+
+
+def test_tipo_alargado_conforme_os_pesos():
+    grafo = GrafoMatriz(direcionado=False, ponderado=True)
+    for i in range(5):
+        grafo.inserir_vertice(str(i))
+
+    esperados = {}
+    for (origem, destino, peso), tipo in [((0, 1, 100), 'b'), ((1, 2, -1000), 'h'), ((2, 3, 70000), 'i'),
+                                          ((3, 4, 2**40), 'q')]:
+        grafo.inserir_aresta(origem, destino, peso)
+        esperados[(origem, destino)] = peso
+        assert grafo.tipo == tipo
+        assert {par: grafo.peso_aresta(*par) for par in esperados} == esperados
+        assert all(type(grafo.peso_aresta(*par)) is int for par in esperados)
+
+    # um único float passa a matriz toda para 'd', e os pesos voltam como float
+    grafo.inserir_aresta(0, 4, 2.5)
+    assert grafo.tipo == 'd'
+    assert grafo.peso_aresta(0, 4) == 2.5 and grafo.peso_aresta(4, 0) == 2.5
+    assert {par: grafo.peso_aresta(*par) for par in esperados} == esperados
+    assert type(grafo.peso_aresta(0, 1)) is float
+
+
+def test_inteiro_acima_de_64_bits_vira_float():
+    grafo = GrafoMatriz(direcionado=True, ponderado=True)
+    for i in range(2):
+        grafo.inserir_vertice(str(i))
+
+    grafo.inserir_aresta(0, 1, 2**63)
+    assert grafo.tipo == 'd'
+    # acima de 2**53 o float não representa todos os inteiros
+    grafo.inserir_aresta(1, 0, 2**53 + 1)
+    assert grafo.peso_aresta(1, 0) == float(2**53 + 1) != 2**53 + 1
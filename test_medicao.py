@@ -0,0 +1,44 @@
+import time
+
+from grafo_lista import GrafoLista
+from mst import MST
+from medicao import medir, comparar, iqrs_sobrepostos
+
+
+def resumo(nome, q1, mediana, q3):
+    return {'nome': nome, 'q1_ns': q1, 'mediana_ns': mediana, 'q3_ns': q3, 'iqr_ns': q3 - q1}
+
+
+def test_preparar_fica_fora_do_tempo():
+    chamadas = []
+    medicao = medir(lambda: chamadas.append('f'), repeticoes=3, aquecimento=1,
+                    preparar=lambda: (chamadas.append('p'), time.sleep(0.002)))
+
+    # preparar roda uma vez antes de cada execução, e os 2 ms dele não entram na amostra
+    assert chamadas[::2] == ['p'] * (len(chamadas) // 2)
+    assert chamadas[1::2] == ['f'] * (len(chamadas) // 2)
+    assert medicao['mediana_ns'] < 1_000_000
+
+
+def test_descartar_caches_refaz_as_arestas_do_kruskal():
+    grafo = GrafoLista(direcionado=False, ponderado=True)
+    for i in range(4):
+        grafo.inserir_vertice(str(i))
+    for origem, destino, peso in [(0, 1, 3), (1, 2, 1), (2, 3, 2), (3, 0, 5)]:
+        grafo.inserir_aresta(origem, destino, peso)
+
+    MST(grafo).kruskal()
+    assert grafo._arestas_canonicas is not None
+    grafo.descartar_caches()
+    assert grafo._arestas_canonicas is None
+    assert MST(grafo).kruskal() == 6
+
+
+def test_comparar_so_aponta_diferenca_fora_do_ruido():
+    base = [resumo('a', 90, 100, 110), resumo('b', 90, 100, 110), resumo('c', 90, 100, 110), resumo('d', 1, 1, 1)]
+    nova = [resumo('a', 150, 160, 170), resumo('b', 40, 50, 60), resumo('c', 105, 120, 135), resumo('e', 1, 1, 1)]
+
+    situacoes = {nome: situacao for nome, _, _, _, situacao in comparar(base, nova)}
+    # c piorou 20% na mediana, mas os IQRs se sobrepõem
+    assert situacoes == {'a': 'regressão', 'b': 'melhora', 'c': 'igual', 'd': 'removida', 'e': 'nova'}
+    assert iqrs_sobrepostos(base[2], nova[2]) and not iqrs_sobrepostos(base[0], nova[0])
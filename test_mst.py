@@ -0,0 +1,156 @@
+import random
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+import mst as mst_modulo
+from mst import MST, MSTDinamica, LIMIAR_FILTER_KRUSKAL
+
+BACKENDS = [GrafoLista, GrafoMatriz]
+
+
+def montar(classe, arestas, num_vertices, direcionado=False, **opcoes):
+    grafo = classe(direcionado=direcionado, ponderado=True, **opcoes)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for origem, destino, peso in arestas:
+        grafo.inserir_aresta(origem, destino, peso)
+    return grafo
+
+
+def pesos_por_algoritmo(grafo):
+    pesos = {}
+    for algoritmo in ("kruskal", "boruvka", "prim"):
+        mst = MST(grafo)
+        pesos[algoritmo] = getattr(mst, algoritmo)()
+    return pesos
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_cache_de_arestas_acompanha_mudancas(classe):
+    grafo = montar(classe, [(0, 1, 5), (1, 2, 5), (2, 3, 5), (3, 0, 5)], 4)
+    assert pesos_por_algoritmo(grafo) == {"kruskal": 15, "boruvka": 15, "prim": 15}
+
+    # cada mutação precisa descartar as arestas em cache do Kruskal e do Borůvka
+    grafo.inserir_aresta(0, 2, 1)
+    assert set(pesos_por_algoritmo(grafo).values()) == {11}
+
+    grafo.remover_aresta(0, 2)
+    assert set(pesos_por_algoritmo(grafo).values()) == {15}
+
+    grafo.remover_vertice("3")
+    assert set(pesos_por_algoritmo(grafo).values()) == {10}
+
+    grafo.inserir_vertice("4")
+    grafo.inserir_aresta(4, 0, 2)
+    grafo.compactar()
+    assert set(pesos_por_algoritmo(grafo).values()) == {12}
+
+
+def kruskal_do_zero(grafo):
+    mst = MST(grafo)
+    mst.kruskal()
+    return mst.peso_total, sorted(mst.arestas_mst)
+
+
+@pytest.mark.parametrize("classe, opcoes", [(GrafoLista, {"arestas_paralelas": "substituir"}), (GrafoMatriz, {})])
+def test_mst_dinamica_com_troca_de_peso(classe, opcoes):
+    # triângulo 0-1-2 (mais 3 vértices soltos) com 0-1 na árvore; reinserir 0-1 com peso 10 a tira dela
+    grafo = montar(classe, [(0, 1, 2), (1, 2, 5), (0, 2, 7)], 6, **opcoes)
+    dinamica = MSTDinamica(grafo)
+    assert dinamica.peso_total == 7
+
+    assert dinamica.inserir_aresta(0, 1, 10)
+    assert grafo.peso_aresta(0, 1) == 10
+    assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo) == (12, [(0, 2, 7), (1, 2, 5)])
+
+    # e com peso 1 ela volta
+    assert dinamica.inserir_aresta(1, 0, 1)
+    assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo)
+
+    gerador = random.Random(3)
+    for _ in range(200):
+        origem, destino = gerador.sample(range(6), 2)
+        if gerador.random() < 0.8:
+            dinamica.inserir_aresta(origem, destino, gerador.randint(1, 9))
+        else:
+            dinamica.remover_aresta(origem, destino)
+        assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo)
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_mst_dinamica_igual_ao_kruskal(classe):
+    # pesos de 1 a 5 para forçar empates; no GrafoLista as arestas repetidas viram paralelas
+    gerador = random.Random(8)
+    arestas = [(u, v, gerador.randint(1, 5)) for u in range(30) for v in range(u + 1, 30) if gerador.random() < 0.15]
+    grafo = montar(classe, arestas, 30)
+    dinamica = MSTDinamica(grafo)
+    assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo)
+
+    for _ in range(300):
+        origem, destino = gerador.sample(range(30), 2)
+        if gerador.random() < 0.5:
+            dinamica.inserir_aresta(origem, destino, gerador.randint(1, 5))
+        else:
+            vizinhos = grafo.retornar_vizinhos(origem)
+            if len(vizinhos):
+                destino = vizinhos[gerador.randrange(len(vizinhos))]
+            dinamica.remover_aresta(origem, destino)
+        assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo)
+
+
+@pytest.mark.parametrize("classe, opcoes", [(GrafoLista, {}), (GrafoLista, {"arestas_paralelas": "substituir"}),
+                                            (GrafoMatriz, {})])
+def test_mst_dinamica_com_vertices_novos(classe, opcoes):
+    grafo = montar(classe, [(0, 1, 2), (1, 2, 5)], 3, **opcoes)
+    dinamica = MSTDinamica(grafo)
+
+    # vértices e aresta inseridos direto no grafo, sem passar pela MSTDinamica
+    grafo.inserir_vertice("3")
+    grafo.inserir_vertice("4")
+    grafo.inserir_aresta(3, 4, 1)
+
+    assert dinamica.remover_aresta(3, 4)
+    assert not grafo.existe_aresta(3, 4)
+    assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo)
+
+    grafo.inserir_aresta(3, 4, 1)
+    assert dinamica.inserir_aresta(4, 3, 3)
+    if grafo.arestas_paralelas == "substituir":
+        # a troca de peso passa pela remoção, que também precisa conhecer os vértices novos
+        esperado = (10, [(0, 1, 2), (1, 2, 5), (3, 4, 3)])
+        assert (dinamica.peso_total, sorted(dinamica.arestas_mst)) == kruskal_do_zero(grafo) == esperado
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+@pytest.mark.parametrize("maior_peso", [10, 10**6])
+def test_filter_kruskal_igual_a_ordenacao(classe, maior_peso, monkeypatch):
+    # base pequena para que as partições e a filtragem sejam exercitadas
+    monkeypatch.setattr(mst_modulo, "TAMANHO_BASE_FILTER_KRUSKAL", 16)
+
+    # duas cliques quase completas de 40 vértices, sem ligação: floresta de 2 árvores
+    gerador = random.Random(maior_peso)
+    arestas = [(u, v, gerador.randint(1, maior_peso)) for parte in (0, 40)
+               for u in range(parte, parte + 40) for v in range(u + 1, parte + 40) if gerador.random() < 0.95]
+    grafo = montar(classe, arestas, 80)
+    assert len(arestas) >= LIMIAR_FILTER_KRUSKAL * 80
+
+    resultados = {}
+    for variante in ("filter", "ordenacao"):
+        grafo.descartar_caches()
+        mst = MST(grafo)
+        mst.kruskal(variante)
+        assert mst.variante == variante and mst.num_componentes == 2
+        resultados[variante] = (mst.peso_total, sorted(mst.arestas_mst))
+    assert resultados["filter"] == resultados["ordenacao"]
+
+    # o 'auto' escolhe o filter em grafo denso, a não ser que a ordenação já esteja no cache
+    mst = MST(grafo)
+    mst.kruskal()
+    assert mst.variante == "ordenacao"
+    grafo.descartar_caches()
+    mst = MST(grafo)
+    mst.kruskal()
+    assert mst.variante == "filter"
+    assert (mst.peso_total, sorted(mst.arestas_mst)) == resultados["ordenacao"]
@@ -0,0 +1,108 @@
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from mst import MST
+from componentes import componentes_conexas, componentes_fortemente_conexas, ordenacao_topologica
+from coloracao_grafos import ColoracaoGrafos
+from busca_largura import busca_em_largura, busca_em_largura_direcional
+from busca_profundidade import busca_em_profundidade
+from dijkstra import dijkstra
+
+BACKENDS = [GrafoLista, GrafoMatriz]
+
+# ciclo 0-1-2-3-4-5-0 com uma corda 1-4
+ARESTAS = [(0, 1, 4), (1, 2, 2), (2, 3, 5), (3, 4, 1), (4, 5, 3), (5, 0, 6), (1, 4, 7)]
+
+
+def montar(classe, direcionado=False, arestas=ARESTAS, num_vertices=6):
+    grafo = classe(direcionado=direcionado, ponderado=True)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for origem, destino, peso in arestas:
+        grafo.inserir_aresta(origem, destino, peso)
+    return grafo
+
+
+def sem_removidos(arestas, removido):
+    return [(u, v, p) for u, v, p in arestas if removido not in (u, v)]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_mst_ignora_vertice_removido(classe, capsys):
+    grafo = montar(classe)
+    assert grafo.remover_vertice("5")
+    assert grafo.labels[5] is None  # ainda não compactou
+
+    # árvore de 0..4 sobre as arestas restantes: 3-4 (1), 1-2 (2), 0-1 (4), 2-3 (5)
+    for algoritmo in ("kruskal", "boruvka", "prim"):
+        mst = MST(grafo)
+        assert getattr(mst, algoritmo)() == 12, algoritmo
+        assert len(mst.arestas_mst) == 4
+        assert mst.num_componentes == 1
+
+    for variante in ("densa", "heap", "heap_indexado"):
+        mst = MST(grafo)
+        assert mst.prim(vertice_inicial=5, variante=variante) == 12
+        assert mst.num_componentes == 1
+
+    mst = MST(grafo)
+    mst.kruskal()
+    mst.imprimir_resultado()
+    assert "desconexo" not in capsys.readouterr().out
+    assert [vertices for vertices, _, _ in mst.arvores()] == [[0, 1, 2, 3, 4]]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_mst_floresta_apos_remocao(classe):
+    # sem a corda, remover 2 parte o ciclo restante em 0-1 e 3-4
+    grafo = montar(classe, arestas=sem_removidos(ARESTAS, 4) + [(3, 4, 1)])
+    grafo.remover_aresta(5, 0)
+    grafo.remover_vertice("2")
+
+    mst = MST(grafo)
+    mst.kruskal()
+    assert mst.num_componentes == 3  # {0, 1}, {3, 4} e {5}
+    assert componentes_conexas(grafo) == [[0, 1], [3, 4], [5]]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_componentes_ignoram_vertice_removido(classe):
+    grafo = montar(classe)
+    grafo.remover_vertice("2")
+    assert componentes_conexas(grafo) == [[0, 1, 3, 4, 5]]
+
+    direcionado = montar(classe, direcionado=True, arestas=[(0, 1, 1), (1, 2, 1), (3, 4, 1)])
+    direcionado.remover_vertice("1")
+    assert sorted(map(sorted, componentes_fortemente_conexas(direcionado))) == [[0], [2], [3], [4], [5]]
+    assert sorted(ordenacao_topologica(direcionado)) == [0, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_coloracao_ignora_vertice_removido(classe):
+    # triângulo 0-1-2 e vértice 3 ligado a todos: 4 cores; sem o 3, 3 cores
+    arestas = [(0, 1, 1), (1, 2, 1), (0, 2, 1), (3, 0, 1), (3, 1, 1), (3, 2, 1)]
+    grafo = montar(classe, arestas=arestas, num_vertices=5)
+    grafo.remover_vertice("3")
+
+    for metodo in ("welsh_powell", "dsatur", "heuristica_simples", "jones_plassmann", "branch_and_bound"):
+        coloracao = ColoracaoGrafos(grafo)
+        assert getattr(coloracao, metodo)() == 3, metodo
+        assert sorted(coloracao.cores) == [0, 1, 2, 4], metodo
+
+    coloracao = ColoracaoGrafos(grafo)
+    coloracao.dsatur()
+    assert coloracao.tabucol(limite_tempo=0.5, semente=1) == 3
+    assert sorted(coloracao.cores) == [0, 1, 2, 4]
+
+
+@pytest.mark.parametrize("classe", BACKENDS)
+def test_busca_nao_parte_de_vertice_removido(classe):
+    grafo = montar(classe)
+    grafo.remover_vertice("5")
+
+    for busca in (busca_em_largura, busca_em_largura_direcional, busca_em_profundidade, dijkstra):
+        with pytest.raises(ValueError):
+            busca(grafo, 5)
+    assert sorted(busca_em_largura(grafo, 0)) == [0, 1, 2, 3, 4]
+    assert sorted(busca_em_profundidade(grafo, 0)) == [0, 1, 2, 3, 4]
@@ -0,0 +1,84 @@
+import os
+import random
+from array import array
+
+import pytest
+
+from grafo_lista import GrafoLista
+from grafo_matriz import GrafoMatriz
+from grafo_csr import GrafoCSR
+from dijkstra import dijkstra
+import todos_os_pares as modulo
+from todos_os_pares import todos_os_pares, MAX_VERTICES_FLOYD_WARSHALL
+
+
+def aleatorio(classe, semente):
+    gerador = random.Random(semente)
+    num_vertices = gerador.randint(0, 20)
+    grafo = classe(direcionado=semente % 2 == 0, ponderado=True)
+    for i in range(num_vertices):
+        grafo.inserir_vertice(str(i))
+    for _ in range(gerador.randint(0, 80) if num_vertices else 0):
+        origem, destino = gerador.randrange(num_vertices), gerador.randrange(num_vertices)
+        if origem != destino:
+            grafo.inserir_aresta(origem, destino, gerador.randint(1, 20))
+    return grafo
+
+
+@pytest.mark.parametrize("classe", [GrafoLista, GrafoMatriz, GrafoCSR])
+@pytest.mark.parametrize("modo", ["dijkstra", "floyd_warshall", "auto"])
+def test_todos_os_pares_igual_ao_dijkstra(classe, modo, monkeypatch):
+    # tarefas pequenas para que os grafos de teste usem os dois processos
+    monkeypatch.setattr(modulo, "ORIGENS_POR_TAREFA", 4)
+
+    for semente in range(30):
+        grafo = aleatorio(classe, semente)
+        num_vertices = len(grafo.labels)
+        referencia = [dijkstra(grafo, origem)[0] for origem in range(num_vertices)]
+
+        with todos_os_pares(grafo, modo, num_processos=1 + semente % 2) as matriz:
+            assert len(matriz) == num_vertices
+            assert [matriz.linha(i).tolist() for i in range(num_vertices)] == referencia, semente
+            assert all(matriz[i, j] == referencia[i][j] for i in range(num_vertices) for j in range(num_vertices))
+
+
+def test_matriz_gravada_em_arquivo(tmp_path):
+    grafo = aleatorio(GrafoLista, 5)
+    caminho = tmp_path / "distancias.bin"
+    with todos_os_pares(grafo, caminho_saida=str(caminho), num_processos=1) as matriz:
+        num_vertices = len(matriz)
+        esperadas = [matriz.linha(i).tolist() for i in range(num_vertices)]
+
+    # o arquivo pedido fica, linha a linha em float64
+    valores = array('d', caminho.read_bytes())
+    assert [valores[i * num_vertices:(i + 1) * num_vertices].tolist() for i in range(num_vertices)] == esperadas
+
+
+def test_floyd_warshall_recusado_acima_do_limite():
+    grafo = GrafoLista(direcionado=False, ponderado=True)
+    for i in range(MAX_VERTICES_FLOYD_WARSHALL + 1):
+        grafo.inserir_vertice(str(i))
+    grafo.inserir_aresta(0, 1, 2)
+
+    with pytest.raises(ValueError):
+        todos_os_pares(grafo, modo='floyd_warshall')
+
+    # o 'auto' cai no Dijkstra
+    with todos_os_pares(grafo, num_processos=1) as matriz:
+        assert matriz.modo == 'dijkstra'
+        assert matriz[1, 0] == 2
+
+
+def test_fechar_com_linhas_em_uso():
+    grafo = aleatorio(GrafoLista, 7)
+    referencia = dijkstra(grafo, 0)[0]
+
+    with todos_os_pares(grafo, num_processos=1) as matriz:
+        linha = matriz.linha(0)
+        caminho = matriz.caminho
+
+    # o temporário é apagado mesmo com a linha aberta, e ela continua válida
+    assert not os.path.exists(caminho)
+    assert linha.tolist() == referencia
+    matriz.fechar()  # fechar de novo não faz nada
+    linha.release()
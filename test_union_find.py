@@ -0,0 +1,38 @@
+import random
+
+from union_find import UnionFind
+
+
+def particao(uf, n):
+    grupos = {}
+    for x in range(n):
+        grupos.setdefault(uf.find(x), []).append(x)
+    return sorted(grupos.values())
+
+
+def test_lote_igual_a_chamadas_sequenciais():
+    gerador = random.Random(4)
+    for n in (1, 2, 10, 200):
+        em_lote, sequencial = UnionFind(n), UnionFind(n)
+        for _ in range(30):
+            tamanho = gerador.randint(0, n)
+            xs = [gerador.randrange(n) for _ in range(tamanho)]
+            ys = [gerador.randrange(n) for _ in range(tamanho)]
+
+            assert em_lote.union_many(xs, ys) == [sequencial.union(x, y) for x, y in zip(xs, ys)]
+            consultas = [gerador.randrange(n) for _ in range(tamanho)]
+            assert em_lote.find_many(consultas).tolist() == [sequencial.find(x) for x in consultas]
+
+            # mesma compressão de caminho e mesmos ranks, não só a mesma partição
+            assert em_lote.pai == sequencial.pai and em_lote.rank == sequencial.rank
+            # particao comprime caminhos, então roda nas duas instâncias para mantê-las iguais
+            grupos = particao(sequencial, n)
+            assert particao(em_lote, n) == grupos
+            assert em_lote.num_conjuntos == sequencial.num_conjuntos == len(grupos)
+
+
+def test_union_many_com_pares_repetidos():
+    uf = UnionFind(4)
+    assert uf.union_many([0, 1, 0, 2, 3], [1, 0, 0, 3, 1]) == [True, False, False, True, True]
+    assert uf.num_conjuntos == 1
+    assert len(set(uf.find_many(range(4)))) == 1
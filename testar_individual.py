@@ -29,6 +29,12 @@ def testar_mst(arquivo):
     mst_prim = MST(grafo)
     peso = mst_prim.prim()
     mst_prim.imprimir_resultado(mostrar_arestas=False)
+    
+    # Borůvka
+    print("\n--- Algoritmo de Borůvka ---")
+    mst_boruvka = MST(grafo)
+    peso = mst_boruvka.boruvka()
+    mst_boruvka.imprimir_resultado(mostrar_arestas=False)
 
 
 def testar_coloracao(arquivo):
@@ -54,6 +60,13 @@ def testar_coloracao(arquivo):
     coloracao_dsatur = ColoracaoGrafos(grafo)
     cores = coloracao_dsatur.dsatur()
     coloracao_dsatur.imprimir_resultado(mostrar_cores=False)
+
+    # Jones-Plassmann
+    print("\n--- Algoritmo Jones-Plassmann (paralelo) ---")
+    coloracao_jp = ColoracaoGrafos(grafo)
+    cores = coloracao_jp.jones_plassmann()
+    coloracao_jp.imprimir_resultado(mostrar_cores=False)
+    print(f"Rodadas: {coloracao_jp.rodadas}")
     
     # Heurística Simples
     print("\n--- Heurística Simples ---")
@@ -61,6 +74,13 @@ def testar_coloracao(arquivo):
     cores = coloracao_simples.heuristica_simples()
     coloracao_simples.imprimir_resultado(mostrar_cores=False)
 
+    # Exato, com orçamento de tempo
+    print("\n--- Branch and Bound (limite de 60s) ---")
+    coloracao_exata = ColoracaoGrafos(grafo)
+    cores = coloracao_exata.branch_and_bound(limite_tempo=60)
+    coloracao_exata.imprimir_resultado(mostrar_cores=False)
+    print(f"Ótima: {'sim' if coloracao_exata.otima else 'não'} (limite inferior: {coloracao_exata.limite_inferior})")
+
 
 def menu():
     """Menu interativo"""
@@ -0,0 +1,242 @@
+"""
+Distâncias mínimas entre todos os pares de vértices, gravadas numa matriz V x V
+de float64 mapeada em memória (arquivo binário linha a linha, sem cabeçalho)
+"""
+
+import os
+import mmap
+import heapq
+import tempfile
+import multiprocessing
+from array import array
+from itertools import repeat
+from operator import add, gt
+
+from grafo_csr import csr_compartilhado, visao_nativa
+
+# acima desta densidade (e com poucos vértices) o Floyd-Warshall por linhas vence
+# V execuções do Dijkstra; acima do limite de vértices ele é recusado, porque as
+# linhas ficam em listas Python (O(V²) floats) durante o cálculo
+LIMIAR_FLOYD_WARSHALL = 0.75
+MAX_VERTICES_FLOYD_WARSHALL = 1000
+
+# origens por tarefa do pool: poucas demais desequilibram, muitas demais custam comunicação
+ORIGENS_POR_TAREFA = 64
+
+
+class MatrizDistancias:
+    """
+    Matriz de distâncias em um arquivo mapeado em memória. matriz[i, j] é a distância
+    de i a j (inf se inacessível) e matriz.linha(i) é uma memoryview da linha, sem cópia.
+    Sem caminho, usa um arquivo temporário que é apagado em fechar(). Linhas ainda em uso
+    depois de fechar() continuam legíveis; o mapeamento só é desfeito quando a última
+    delas é liberada (com release() ou pelo coletor de lixo).
+    """
+
+    def __init__(self, num_vertices: int, caminho: str = None):
+        self.num_vertices = num_vertices
+        self.modo = None
+        self.temporario = caminho is None
+        if self.temporario:
+            descritor, caminho = tempfile.mkstemp(suffix='.dist')
+            os.close(descritor)
+        self.caminho = caminho
+
+        with open(caminho, 'wb') as arquivo:
+            arquivo.truncate(8 * num_vertices * num_vertices)
+
+        with open(caminho, 'r+b') as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0) if num_vertices else None
+        self.valores = memoryview(self._mapa).cast('d') if num_vertices else memoryview(array('d'))
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __getitem__(self, par: tuple) -> float:
+        i, j = par
+        return self.valores[i * self.num_vertices + j]
+
+    def linha(self, i: int) -> memoryview:
+        return self.valores[i * self.num_vertices:(i + 1) * self.num_vertices]
+
+    def fechar(self) -> None:
+        try:
+            self.valores.release()
+            if self._mapa is not None:
+                try:
+                    self._mapa.close()
+                except BufferError:
+                    # ainda há linhas de linha() em uso; elas mantêm o mmap vivo
+                    pass
+                self._mapa = None
+        finally:
+            if self.temporario and os.path.exists(self.caminho):
+                os.remove(self.caminho)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+# grafo e saída de cada processo (definidos pelo inicializador do pool)
+_ESTADO_TODOS_PARES = None
+
+
+def _inicializar_todos_pares(offsets, destinos, pesos, caminho_saida, num_vertices):
+    global _ESTADO_TODOS_PARES
+    if offsets is None:
+        _ESTADO_TODOS_PARES = None
+        return
+
+    # cada processo mapeia o mesmo arquivo; as linhas escritas por cada um são disjuntas
+    with open(caminho_saida, 'r+b') as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0)
+    saida = memoryview(mapa).cast('d')
+    _ESTADO_TODOS_PARES = (visao_nativa(offsets), visao_nativa(destinos), visao_nativa(pesos),
+                           saida, num_vertices)
+
+
+def _dijkstra_origens(tarefa):
+    """Dijkstra com heap a partir de cada origem do intervalo, gravando as linhas da saída"""
+    inicio, fim = tarefa
+    offsets, destinos, pesos, saida, num_vertices = _ESTADO_TODOS_PARES
+    infinito = array('d', [float('inf')]) * num_vertices
+
+    for origem in range(inicio, fim):
+        distancias = array('d', infinito)
+        distancias[origem] = 0.0
+        visitados = bytearray(num_vertices)
+
+        heap = [(0.0, origem)]
+        while heap:
+            distancia_atual, vertice = heapq.heappop(heap)
+            if visitados[vertice]:
+                continue
+            visitados[vertice] = 1
+
+            for i in range(offsets[vertice], offsets[vertice + 1]):
+                vizinho = destinos[i]
+                distancia = distancia_atual + pesos[i]
+                if distancia < distancias[vizinho]:
+                    distancias[vizinho] = distancia
+                    heapq.heappush(heap, (distancia, vizinho))
+
+        saida[origem * num_vertices:(origem + 1) * num_vertices] = distancias
+
+    return fim - inicio
+
+
+def _todos_pares_dijkstra(grafo, matriz: MatrizDistancias, num_processos: int) -> None:
+    num_vertices = matriz.num_vertices
+    offsets, destinos, pesos = csr_compartilhado(grafo, com_pesos=True)
+    tarefas = [(i, min(i + ORIGENS_POR_TAREFA, num_vertices))
+               for i in range(0, num_vertices, ORIGENS_POR_TAREFA)]
+
+    matriz._mapa.flush()
+    dados = (offsets, destinos, pesos, matriz.caminho, num_vertices)
+    if num_processos > 1:
+        with multiprocessing.Pool(num_processos, initializer=_inicializar_todos_pares, initargs=dados) as pool:
+            pool.map(_dijkstra_origens, tarefas)
+    else:
+        _inicializar_todos_pares(*dados)
+        try:
+            for tarefa in tarefas:
+                _dijkstra_origens(tarefa)
+        finally:
+            _inicializar_todos_pares(None, None, None, None, 0)
+
+
+def _todos_pares_floyd_warshall(grafo, matriz: MatrizDistancias) -> None:
+    """
+    Floyd-Warshall linha a linha: para cada k, a linha i vira min(D[i], D[i][k] + D[k]),
+    calculada sobre as linhas inteiras (soma com map e mínimo por compreensão, bem mais
+    rápidos que um laço duplo). Linhas com D[i][k] infinito, ou que nenhum caminho por k
+    pode melhorar, são puladas. As linhas ficam em listas durante o cálculo (O(V²) floats, por
+    isso MAX_VERTICES_FLOYD_WARSHALL) e vão para a matriz mapeada no final.
+    """
+    num_vertices = matriz.num_vertices
+    infinito = float('inf')
+
+    # D inicial: pesos das arestas (na matriz de adjacência, 0 fora da diagonal é ausência)
+    matriz_adj = getattr(grafo, 'matriz_adj', None)
+    linhas = []
+    for i in range(num_vertices):
+        if matriz_adj is not None:
+            linha = [peso if peso != 0 else infinito for peso in matriz_adj[i]]
+        else:
+            linha = [infinito] * num_vertices
+            for j, peso in grafo.retornar_vizinhos_ponderados(i):
+                if peso < linha[j]:
+                    linha[j] = peso
+        linha[i] = min(linha[i], 0.0)
+        linhas.append(linha)
+
+    # se nem o menor D[i][k] + D[k][j] fica abaixo do maior D[i][j], a linha não muda
+    maiores = [max(linha) for linha in linhas]
+
+    for k in range(num_vertices):
+        linha_k = linhas[k]
+        menor_k = min(linha_k[j] for j in range(num_vertices) if j != k) if num_vertices > 1 else infinito
+        for i in range(num_vertices):
+            linha_i = linhas[i]
+            distancia_ik = linha_i[k]
+            if distancia_ik == infinito or i == k or distancia_ik + menor_k >= maiores[i]:
+                continue
+
+            por_k = list(map(add, repeat(distancia_ik), linha_k))
+            if any(map(gt, linha_i, por_k)):
+                linha_i = [atual if atual <= nova else nova for atual, nova in zip(linha_i, por_k)]
+                linhas[i] = linha_i
+                maiores[i] = max(linha_i)
+
+    for i, linha in enumerate(linhas):
+        matriz.valores[i * num_vertices:(i + 1) * num_vertices] = array('d', linha)
+
+
+def _densidade(grafo) -> float:
+    num_vertices = len(grafo.labels)
+    if num_vertices < 2:
+        return 0.0
+    num_arestas = sum(len(grafo.retornar_vizinhos(v)) for v in range(num_vertices))
+    return num_arestas / (num_vertices * (num_vertices - 1))
+
+
+def todos_os_pares(grafo, modo: str = 'auto', caminho_saida: str = None, num_processos: int = None):
+    """
+    Distâncias mínimas entre todos os pares, gravadas em uma MatrizDistancias mapeada
+    em memória (em caminho_saida, ou num arquivo temporário).
+
+    modo: 'dijkstra' (um Dijkstra com heap por origem, com as origens divididas entre
+    num_processos processos que leem o grafo em memória compartilhada; padrão: número
+    de CPUs), 'floyd_warshall' (O(V³) por linhas, bom para grafos densos e pequenos)
+    ou 'auto', que escolhe Floyd-Warshall para grafos densos. O Floyd-Warshall só é
+    aceito com até MAX_VERTICES_FLOYD_WARSHALL vértices, e é o único que aceita pesos
+    negativos.
+    """
+    num_vertices = len(grafo.labels)
+
+    if modo == 'auto':
+        denso = num_vertices <= MAX_VERTICES_FLOYD_WARSHALL and _densidade(grafo) >= LIMIAR_FLOYD_WARSHALL
+        modo = 'floyd_warshall' if denso else 'dijkstra'
+    if modo not in ('dijkstra', 'floyd_warshall'):
+        raise ValueError(f"Modo de todos os pares desconhecido: {modo}")
+    if modo == 'floyd_warshall' and num_vertices > MAX_VERTICES_FLOYD_WARSHALL:
+        raise ValueError(f"Floyd-Warshall limitado a {MAX_VERTICES_FLOYD_WARSHALL} vértices "
+                         f"(o grafo tem {num_vertices}); use modo='dijkstra'")
+
+    if num_processos is None:
+        num_processos = os.cpu_count() or 1
+    num_processos = max(1, min(num_processos, -(-num_vertices // ORIGENS_POR_TAREFA)))
+
+    matriz = MatrizDistancias(num_vertices, caminho_saida)
+    matriz.modo = modo
+    if num_vertices:
+        if modo == 'dijkstra':
+            _todos_pares_dijkstra(grafo, matriz, num_processos)
+        else:
+            _todos_pares_floyd_warshall(grafo, matriz)
+        matriz._mapa.flush()
+
+    return matriz
@@ -0,0 +1,108 @@
+from array import array
+
+
+class UnionFind:
+    """
+    Estrutura Union-Find (conjuntos disjuntos) com união por rank e compressão de
+    caminho por halving, sem recursão. Os vetores pai e rank são arrays compactos.
+    """
+
+    def __init__(self, n):
+        self.pai = array('i', range(n))
+        self.rank = array('b', bytes(n))
+        self.num_conjuntos = n
+
+    def find(self, x):
+        pai = self.pai
+        p = pai[x]
+        while p != x:
+            avo = pai[p]
+            if avo == p:
+                return p
+            # cada nó passa a apontar para o avô, encurtando o caminho pela metade
+            pai[x] = avo
+            x = avo
+            p = pai[x]
+        return x
+
+    def union(self, x, y):
+        raiz_x = self.find(x)
+        raiz_y = self.find(y)
+
+        if raiz_x == raiz_y:
+            return False
+
+        rank = self.rank
+        if rank[raiz_x] < rank[raiz_y]:
+            self.pai[raiz_x] = raiz_y
+        elif rank[raiz_x] > rank[raiz_y]:
+            self.pai[raiz_y] = raiz_x
+        else:
+            self.pai[raiz_y] = raiz_x
+            rank[raiz_x] += 1
+
+        self.num_conjuntos -= 1
+        return True
+
+    def find_many(self, elementos) -> array:
+        """Representante de cada elemento, na mesma ordem"""
+        pai = self.pai
+        raizes = array('i')
+        for x in elementos:
+            p = pai[x]
+            while p != x:
+                avo = pai[p]
+                if avo == p:
+                    x = p
+                    break
+                pai[x] = avo
+                x = avo
+                p = pai[x]
+            raizes.append(x)
+        return raizes
+
+    def union_many(self, xs, ys) -> list:
+        """Une os pares (xs[i], ys[i]); retorna, para cada par, se houve união"""
+        pai, rank = self.pai, self.rank
+        unidos = []
+        for x, y in zip(xs, ys):
+            # find de x e de y embutidos para evitar chamadas de método
+            p = pai[x]
+            while p != x:
+                avo = pai[p]
+                if avo == p:
+                    x = p
+                    break
+                pai[x] = avo
+                x = avo
+                p = pai[x]
+
+            p = pai[y]
+            while p != y:
+                avo = pai[p]
+                if avo == p:
+                    y = p
+                    break
+                pai[y] = avo
+                y = avo
+                p = pai[y]
+
+            if x == y:
+                unidos.append(False)
+                continue
+
+            if rank[x] < rank[y]:
+                pai[x] = y
+            elif rank[x] > rank[y]:
+                pai[y] = x
+            else:
+                pai[y] = x
+                rank[x] += 1
+
+            self.num_conjuntos -= 1
+            unidos.append(True)
+
+        return unidos
+
+    def mesmo_conjunto(self, x, y) -> bool:
+        return self.find(x) == self.find(y)